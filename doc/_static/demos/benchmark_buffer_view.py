@@ -0,0 +1,42 @@
+"""
+Benchmark the creation of an R vector from a numpy array, with a copy
+of the data (`from_memoryview()`) and without (`from_buffer_view()`,
+requiring the cffi API mode).
+
+Usage:
+
+    python benchmark_buffer_view.py [N_ITEMS]
+"""
+
+import resource
+import sys
+import time
+import numpy
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def run(n):
+    a = numpy.random.random(n)
+    print('%i items (%.1f MB)' % (n, a.nbytes / 1024 ** 2))
+    # The view is created first since the peak RSS only grows.
+    for name, func in (('from_buffer_view',
+                        ri.FloatSexpVector.from_buffer_view),
+                       ('from_memoryview',
+                        ri.FloatSexpVector.from_memoryview)):
+        t0 = time.perf_counter()
+        vec = func(memoryview(a))
+        t1 = time.perf_counter()
+        total = ri.baseenv['sum'](vec)[0]
+        t2 = time.perf_counter()
+        print('%18s: create %.4fs, sum in R %.4fs (%.1f), '
+              'max RSS %.1f MB' %
+              (name, t1 - t0, t2 - t1, total,
+               resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+        del vec
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000000
+    run(n)
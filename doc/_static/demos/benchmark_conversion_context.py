@@ -0,0 +1,57 @@
+"""
+Benchmark entering conversion contexts.
+
+Conversion contexts share the rules of the converter they are created
+from until a rule is added or changed in the context. This is compared
+to making a full copy of the converter when creating the context (the
+behavior of rpy2 before contexts were copy-on-write).
+
+Usage:
+
+    python benchmark_conversion_context.py [N_CONTEXTS]
+"""
+
+import sys
+import timeit
+from rpy2 import robjects
+from rpy2.robjects import conversion
+from rpy2.robjects import numpy2ri
+from rpy2.robjects import pandas2ri
+
+
+def enter_copy(converter, value):
+    ctx_converter = conversion.Converter('copy', template=converter)
+    token = conversion.converter_ctx.set(ctx_converter)
+    try:
+        ctx_converter.py2rpy(value)
+    finally:
+        conversion.converter_ctx.reset(token)
+
+
+def enter_context(converter, value):
+    with converter.context() as cv:
+        cv.py2rpy(value)
+
+
+def run(n, repeat=3):
+    print('%i contexts' % n)
+    print('%24s %12s %12s %8s' % ('converter', 'copy (us)',
+                                  'context (us)', 'speedup'))
+    value = robjects.IntVector([1, 2, 3])
+    for name, converter in (
+            ('default', robjects.default_converter),
+            ('default+numpy+pandas', robjects.default_converter +
+             numpy2ri.converter + pandas2ri.converter)
+    ):
+        t_copy = min(timeit.repeat(lambda: enter_copy(converter, value),
+                                   number=n, repeat=repeat))
+        t_ctx = min(timeit.repeat(lambda: enter_context(converter, value),
+                                  number=n, repeat=repeat))
+        print('%24s %12.2f %12.2f %8.1f' % (name, 1e6 * t_copy / n,
+                                            1e6 * t_ctx / n,
+                                            t_copy / t_ctx))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run(n)
@@ -0,0 +1,34 @@
+"""
+Benchmark assigning R vectors to symbols in an R environment.
+
+Assigning a vector to a symbol in an environment marks it as shared.
+This is compared to assigning a copy of the vector (the behavior of
+rpy2 before assignment stopped copying).
+
+Usage:
+
+    python benchmark_env_assign.py [N_ELEMENTS]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def run(n, repeat=3):
+    x = ri.baseenv['numeric'](n)
+    env = ri.baseenv['new.env']()
+    print('vector of %i doubles' % n)
+    print('%12s %12s %8s' % ('copy (s)', 'shared (s)', 'speedup'))
+    t_copy = min(timeit.repeat(lambda: env.assign('x', x, copy=True),
+                               number=10, repeat=repeat))
+    t_shared = min(timeit.repeat(lambda: env.assign('x', x),
+                                 number=10, repeat=repeat))
+    print('%12.4f %12.4f %8.1f' % (t_copy, t_shared, t_copy / t_shared))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    run(n)
@@ -0,0 +1,47 @@
+"""
+Benchmark importing R packages with `importr()`.
+
+Importing all objects in a package when importing it is compared to
+importing it with `lazy=True`, where R objects are only fetched and
+wrapped on first access.
+
+Each package is loaded in R before the timings, so that only the time
+spent by rpy2 is measured.
+
+Usage:
+
+    python benchmark_importr.py [PACKAGE ...]
+"""
+
+import sys
+import timeit
+import warnings
+from rpy2.robjects import packages
+
+
+def run(names, repeat=3):
+    print('%12s %10s %12s %12s %8s' % ('package', 'symbols', 'eager (s)',
+                                       'lazy (s)', 'speedup'))
+    for name in names:
+        if not packages.isinstalled(name):
+            print('%12s (not installed)' % name)
+            continue
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            pack = packages.importr(name, on_conflict='warn', lazy=True)
+            t_eager = min(timeit.repeat(
+                lambda: packages.importr(name, on_conflict='warn'),
+                number=1, repeat=repeat))
+            t_lazy = min(timeit.repeat(
+                lambda: packages.importr(name, on_conflict='warn',
+                                         lazy=True),
+                number=1, repeat=repeat))
+        print('%12s %10i %12.4f %12.4f %8.1f' % (name, len(pack._rpy2r),
+                                                 t_eager, t_lazy,
+                                                 t_eager / t_lazy))
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] if len(sys.argv) > 1 else ['base', 'stats',
+                                                    'utils', 'Matrix']
+    run(names)
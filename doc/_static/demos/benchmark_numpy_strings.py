@@ -0,0 +1,84 @@
+"""
+Benchmark the conversion of numpy and pandas arrays of strings to R
+and back.
+
+The bulk conversions (used by default by `numpy2ri` and `pandas2ri`)
+are compared to the conversion of one string at a time.
+
+Usage:
+
+    python benchmark_numpy_strings.py [N_ITEMS]
+"""
+
+import sys
+import timeit
+import numpy
+import pandas
+import rpy2.rinterface as ri
+import rpy2.robjects as ro
+from rpy2.rinterface_lib import sexp
+from rpy2.robjects import numpy2ri
+from rpy2.robjects import pandas2ri
+
+ri.initr()
+
+
+def make_data(n):
+    values = numpy.char.add(
+        'id-', numpy.random.randint(0, n, n).astype('U')
+    )
+    with_na = values.astype(object)
+    with_na[::10] = None
+    res = {
+        'numpy U': values,
+        'numpy O with NA': with_na,
+        'pandas string': pandas.Series(with_na, dtype='string[python]'),
+    }
+    try:
+        import pyarrow  # noqa: F401
+        res['pandas arrow'] = pandas.Series(with_na,
+                                            dtype='string[pyarrow]')
+    except ImportError:
+        pass
+    return res
+
+
+def to_r_itemwise(obj):
+    cls = ri.StrSexpVector
+    return cls.from_iterable(
+        [None if x is None or x is pandas.NA else x for x in obj],
+        populate_func=sexp._populate_r_vector,
+        set_elt=cls._R_SET_VECTOR_ELT,
+        cast_value=cls._CAST_IN
+    )
+
+
+def to_python_itemwise(vec):
+    res = numpy.array([vec[i] for i in range(len(vec))])
+    return res
+
+
+def run(n, repeat=3):
+    print('%i items' % n)
+    print('%16s %10s %12s %10s %8s' % ('data', 'direction', 'itemwise (s)',
+                                       'bulk (s)', 'speedup'))
+    cv = ro.default_converter + numpy2ri.converter + pandas2ri.converter
+    for name, data in make_data(n).items():
+        t_item = min(timeit.repeat(lambda: to_r_itemwise(data),
+                                   number=1, repeat=repeat))
+        t_bulk = min(timeit.repeat(lambda: cv.py2rpy(data),
+                                   number=1, repeat=repeat))
+        print('%16s %10s %12.4f %10.4f %8.1f' % (name, 'to R', t_item,
+                                                 t_bulk, t_item / t_bulk))
+        vec = to_r_itemwise(data)
+        t_item = min(timeit.repeat(lambda: to_python_itemwise(vec),
+                                   number=1, repeat=repeat))
+        t_bulk = min(timeit.repeat(lambda: cv.rpy2py(vec),
+                                   number=1, repeat=repeat))
+        print('%16s %10s %12.4f %10.4f %8.1f' % (name, 'to Python', t_item,
+                                                 t_bulk, t_item / t_bulk))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    run(n)
@@ -0,0 +1,61 @@
+"""
+Benchmark the conversion of pandas DataFrames to R data.frames,
+from narrow and long to wide and short.
+
+The conversion in pandas2ri (building the R data.frame directly) is
+compared to the conversion of each column followed by a call to R's
+`data.frame()`.
+
+Usage:
+
+    python benchmark_pandas_dataframe.py
+"""
+
+import timeit
+from collections import OrderedDict
+import numpy
+import pandas
+import rpy2.robjects as ro
+from rpy2.robjects import pandas2ri
+from rpy2.robjects.conversion import localconverter
+
+SHAPES = ((1000000, 5), (100000, 50), (10000, 500), (100, 5000))
+
+
+def make_dataframe(nrows, ncols):
+    rng = numpy.random.default_rng(123)
+    columns = OrderedDict()
+    for i in range(ncols):
+        if i % 3 == 0:
+            columns['f%i' % i] = rng.random(nrows)
+        elif i % 3 == 1:
+            columns['i%i' % i] = rng.integers(0, 1000, nrows, dtype='i')
+        else:
+            columns['b%i' % i] = rng.random(nrows) > 0.5
+    return pandas.DataFrame(columns)
+
+
+def convert_with_r_dataframe(cv, pd_df):
+    return ro.vectors.DataFrame(
+        OrderedDict((k, cv.py2rpy(v)) for k, v in pd_df.items())
+    )
+
+
+def run(repeat=3):
+    print('%10s %8s %16s %14s %8s' % ('rows', 'columns', 'data.frame() (s)',
+                                      'pandas2ri (s)', 'speedup'))
+    with localconverter(ro.default_converter + pandas2ri.converter) as cv:
+        for nrows, ncols in SHAPES:
+            pd_df = make_dataframe(nrows, ncols)
+            t_ref = min(timeit.repeat(
+                lambda: convert_with_r_dataframe(cv, pd_df),
+                number=1, repeat=repeat))
+            t_new = min(timeit.repeat(
+                lambda: cv.py2rpy(pd_df),
+                number=1, repeat=repeat))
+            print('%10i %8i %16.4f %14.4f %8.1f' %
+                  (nrows, ncols, t_ref, t_new, t_ref / t_new))
+
+
+if __name__ == '__main__':
+    run()
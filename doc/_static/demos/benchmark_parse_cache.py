@@ -0,0 +1,46 @@
+"""
+Benchmark evaluating the same string of R code repeatedly.
+
+Evaluating R code with `robjects.r(...)` parses the string each time
+unless the cache of parsed R code is used
+(see `rpy2.rinterface.set_parse_cache_maxsize`).
+
+Usage:
+
+    python benchmark_parse_cache.py [N]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2 import robjects
+
+CODE = 'sum(sapply(1:3, function(i) i * 2))'
+
+
+def evaluate(n):
+    for i in range(n):
+        robjects.r(CODE)
+
+
+def run(n, repeat=3):
+    print('%i evaluations of "%s"' % (n, CODE))
+    print('%14s %12s %8s' % ('uncached (s)', 'cached (s)', 'speedup'))
+    ri.set_parse_cache_maxsize(0)
+    t_uncached = min(timeit.repeat(lambda: evaluate(n),
+                                   number=1, repeat=repeat))
+    ri.set_parse_cache_maxsize(128)
+    try:
+        t_cached = min(timeit.repeat(lambda: evaluate(n),
+                                     number=1, repeat=repeat))
+        print(ri.parse_cache_info())
+    finally:
+        ri.set_parse_cache_maxsize(0)
+        ri.parse_cache_clear()
+    print('%14.4f %12.4f %8.1f' % (t_uncached, t_cached,
+                                   t_uncached / t_cached))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run(n)
@@ -0,0 +1,57 @@
+"""
+Benchmark pickling R vectors, as when shipping tasks to workers.
+
+An R vector of doubles is pickled and unpickled with R serialization
+(the format used by rpy2 for R objects other than vectors of atomic types),
+with the native format of rpy2 for vectors of atomic types, and with
+that native format and pickle protocol 5 out-of-band buffers (as used by
+Dask or Ray to send the data of tasks).
+
+Usage:
+
+    python benchmark_pickle.py [SIZE ...]
+"""
+
+import pickle
+import sys
+import timeit
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def r_serialization(x):
+    return ri.Sexp(ri.unserialize(x.__getstate__()))
+
+
+def native(x):
+    return pickle.loads(pickle.dumps(x, protocol=4))
+
+
+def out_of_band(x):
+    buffers = []
+    data = pickle.dumps(x, protocol=5, buffer_callback=buffers.append)
+    return pickle.loads(data, buffers=buffers)
+
+
+def run(sizes, repeat=3):
+    print('%12s %16s %12s %16s %8s' % ('size', 'serialize (s)',
+                                       'native (s)', 'out-of-band (s)',
+                                       'speedup'))
+    for size in sizes:
+        x = ri.baseenv['runif'](size)
+        t_serialize = min(timeit.repeat(lambda: r_serialization(x),
+                                        number=1, repeat=repeat))
+        t_native = min(timeit.repeat(lambda: native(x),
+                                     number=1, repeat=repeat))
+        t_oob = min(timeit.repeat(lambda: out_of_band(x),
+                                  number=1, repeat=repeat))
+        print('%12i %16.4f %12.4f %16.4f %8.1f' % (size, t_serialize,
+                                                   t_native, t_oob,
+                                                   t_serialize / t_oob))
+
+
+if __name__ == '__main__':
+    sizes = ([int(x) for x in sys.argv[1:]] if len(sys.argv) > 1
+             else [10**4, 10**6, 10**8])
+    run(sizes)
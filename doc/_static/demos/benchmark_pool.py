@@ -0,0 +1,55 @@
+"""
+Benchmark the throughput of a pool of worker processes with an embedded R.
+
+The same R function is called N times in the embedded R of the
+current process, and with a `rpy2.robjects.pool.WorkerPool` of
+increasing number of worker processes.
+
+Usage:
+
+    python benchmark_pool.py [N] [SIZE]
+"""
+
+import os
+import sys
+import timeit
+from rpy2 import robjects
+from rpy2.robjects import pool
+
+robjects.r('benchmark_task <- function(n) sum(sort(runif(n)))')
+
+
+def single(n, size):
+    task = robjects.globalenv.find('benchmark_task')
+    for i in range(n):
+        task(size)
+
+
+def pooled(workerpool, n, size):
+    futures = workerpool.map('benchmark_task', [size] * n)
+    for future in futures:
+        future.result()
+
+
+def run(n, size, repeat=3):
+    print('%i calls to benchmark_task(%i)' % (n, size))
+    print('%10s %10s %12s %8s' % ('processes', 'time (s)',
+                                  'calls / s', 'speedup'))
+    t_single = min(timeit.repeat(lambda: single(n, size),
+                                 number=1, repeat=repeat))
+    print('%10s %10.4f %12.1f %8.1f' % ('embedded', t_single,
+                                        n / t_single, 1))
+    nprocesses = 1
+    while nprocesses <= (os.cpu_count() or 1):
+        with pool.WorkerPool(nprocesses) as workerpool:
+            t_pool = min(timeit.repeat(lambda: pooled(workerpool, n, size),
+                                       number=1, repeat=repeat))
+        print('%10i %10.4f %12.1f %8.1f' % (nprocesses, t_pool,
+                                            n / t_pool, t_single / t_pool))
+        nprocesses *= 2
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    run(n, size)
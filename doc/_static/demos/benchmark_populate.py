@@ -0,0 +1,56 @@
+"""
+Benchmark the creation of R vectors from Python lists.
+
+The bulk path (used by default by `from_iterable()` for atomic vectors)
+is compared to the path casting and setting items one at a time.
+
+Usage:
+
+    python benchmark_populate.py [N_ITEMS]
+"""
+
+import random
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import sexp
+
+ri.initr()
+
+
+def make_data(n):
+    return {
+        ri.BoolSexpVector: [random.random() > 0.5 for i in range(n)],
+        ri.IntSexpVector: [random.randint(0, 1000) for i in range(n)],
+        ri.FloatSexpVector: [random.random() for i in range(n)],
+        ri.ComplexSexpVector: [complex(random.random(), random.random())
+                               for i in range(n)],
+        ri.ByteSexpVector: [random.randint(0, 255) for i in range(n)],
+        ri.StrSexpVector: ['item%i' % random.randint(0, n)
+                           for i in range(n)],
+    }
+
+
+def populate_itemwise(cls, data):
+    return cls.from_iterable(data,
+                             populate_func=sexp._populate_r_vector,
+                             set_elt=cls._R_SET_VECTOR_ELT,
+                             cast_value=cls._CAST_IN)
+
+
+def run(n, repeat=3):
+    print('%i items' % n)
+    print('%20s %12s %12s %8s' % ('class', 'itemwise (s)', 'bulk (s)',
+                                  'speedup'))
+    for cls, data in make_data(n).items():
+        t_item = min(timeit.repeat(lambda: populate_itemwise(cls, data),
+                                   number=1, repeat=repeat))
+        t_bulk = min(timeit.repeat(lambda: cls.from_iterable(data),
+                                   number=1, repeat=repeat))
+        print('%20s %12.4f %12.4f %8.1f' % (cls.__name__, t_item, t_bulk,
+                                            t_item / t_bulk))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
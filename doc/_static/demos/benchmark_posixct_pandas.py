@@ -0,0 +1,68 @@
+"""
+Benchmark the conversion of R POSIXct and Date vectors to pandas.
+
+The vectorized conversion (used by default by `pandas2ri`) is compared
+to the path building one Python datetime object per element.
+
+Usage:
+
+    python benchmark_posixct_pandas.py [N_ITEMS]
+"""
+
+import sys
+import timeit
+import numpy
+import pandas
+import rpy2.rinterface as ri
+import rpy2.robjects as ro
+from rpy2.robjects import pandas2ri
+
+ri.initr()
+
+
+def make_data(n):
+    seconds = numpy.random.uniform(0, 2e9, n)
+    posixct = ro.baseenv['as.POSIXct'](
+        ri.FloatSexpVector.from_memoryview(memoryview(seconds)),
+        origin='1970-01-01', tz='UTC'
+    )
+    date = ro.baseenv['as.Date'](
+        ri.FloatSexpVector.from_memoryview(
+            memoryview(numpy.floor(seconds / 86400))
+        ),
+        origin='1970-01-01'
+    )
+    return ro.vectors.POSIXct(posixct), ro.vectors.DateVector(date)
+
+
+def posixct_itemwise(obj):
+    return pandas.to_datetime(tuple(obj.iter_localized_datetime()),
+                              errors='coerce')
+
+
+def date_itemwise(obj):
+    return pandas.to_datetime(
+        tuple(pandas.NaT if numpy.isnan(x)
+              else pandas.Timestamp(int(x), unit='D') for x in obj)
+    )
+
+
+def run(n, repeat=3):
+    print('%i items' % n)
+    print('%10s %12s %12s %8s' % ('class', 'itemwise (s)', 'vector (s)',
+                                  'speedup'))
+    posixct, date = make_data(n)
+    for name, obj, itemwise, vectorized in (
+            ('POSIXct', posixct, posixct_itemwise, pandas2ri.rpy2py_posixct),
+            ('Date', date, date_itemwise, pandas2ri.rpy2py_date)):
+        t_item = min(timeit.repeat(lambda: itemwise(obj),
+                                   number=1, repeat=repeat))
+        t_vec = min(timeit.repeat(lambda: vectorized(obj),
+                                  number=1, repeat=repeat))
+        print('%10s %12.4f %12.4f %8.1f' % (name, t_item, t_vec,
+                                            t_item / t_vec))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
@@ -0,0 +1,58 @@
+"""
+Benchmark calling an R function with prepared calls.
+
+Calling an R function builds the R call with its arguments for each
+call. This is compared to building the call once with
+`SexpClosure.prepare()` and replacing the values of the arguments
+before each evaluation, for calls with 0, 5, and 20 named arguments.
+
+Usage:
+
+    python benchmark_prepared_call.py [N]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def make_function(nargs):
+    params = ', '.join('a%i=NULL' % i for i in range(nargs))
+    return ri.baseenv['eval'](ri.parse('function(%s) NULL' % params))
+
+
+def call_plain(function, kwargs, n):
+    for i in range(n):
+        function(**kwargs)
+
+
+def call_prepared(function, kwargs, n):
+    call = function.prepare(*kwargs.keys())
+    values = tuple(kwargs.values())
+    for i in range(n):
+        call(*values)
+
+
+def run(n, repeat=3):
+    print('%i calls' % n)
+    print('%6s %12s %14s %8s' % ('args', 'call (s)', 'prepared (s)',
+                                 'speedup'))
+    value = ri.IntSexpVector([1])
+    for nargs in (0, 5, 20):
+        function = make_function(nargs)
+        kwargs = {'a%i' % i: value for i in range(nargs)}
+        t_plain = min(timeit.repeat(
+            lambda: call_plain(function, kwargs, n),
+            number=1, repeat=repeat))
+        t_prepared = min(timeit.repeat(
+            lambda: call_prepared(function, kwargs, n),
+            number=1, repeat=repeat))
+        print('%6i %12.4f %14.4f %8.1f' % (nargs, t_plain, t_prepared,
+                                           t_plain / t_prepared))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run(n)
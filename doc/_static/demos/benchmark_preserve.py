@@ -0,0 +1,60 @@
+"""
+Benchmark creating and dropping many rpy2 proxies for R objects.
+
+N R objects are created, each one with an rpy2 proxy protecting it from
+R's garbage collection, and then the proxies are dropped in the order
+they were created (the worst case for R's precious list). This is
+compared with protecting the same number of R objects with R's own
+`R_PreserveObject()` / `R_ReleaseObject()`.
+
+Usage:
+
+    python benchmark_preserve.py [N ...]
+"""
+
+import sys
+import time
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import _rinterface_capi
+from rpy2.rinterface_lib import openrlib
+
+ri.initr()
+
+
+def proxies(n):
+    t0 = time.perf_counter()
+    sexps = [ri.IntSexpVector((i, )) for i in range(n)]
+    t1 = time.perf_counter()
+    while sexps:
+        # Drop the oldest proxies first.
+        del sexps[:10000]
+    return t1 - t0, time.perf_counter() - t1
+
+
+def precious_list(n):
+    rlib = openrlib.rlib
+    sexps = [ri.IntSexpVector((i, )) for i in range(n)]
+    t0 = time.perf_counter()
+    for x in sexps:
+        rlib.R_PreserveObject(x.__sexp__._cdata)
+    t1 = time.perf_counter()
+    for x in sexps:
+        rlib.R_ReleaseObject(x.__sexp__._cdata)
+    return t1 - t0, time.perf_counter() - t1
+
+
+def run(sizes):
+    print('%10s %18s %18s %18s %18s' % ('n', 'create (s)', 'drop (s)',
+                                        'R preserve (s)', 'R release (s)'))
+    for n in sizes:
+        t_create, t_drop = proxies(n)
+        t_preserve, t_release = precious_list(n)
+        print('%10i %18.4f %18.4f %18.4f %18.4f' % (n, t_create, t_drop,
+                                                    t_preserve, t_release))
+    print(_rinterface_capi.preserved_info())
+
+
+if __name__ == '__main__':
+    sizes = ([int(x) for x in sys.argv[1:]] if len(sys.argv) > 1
+             else [10**4, 10**5, 10**6])
+    run(sizes)
@@ -0,0 +1,62 @@
+"""
+Benchmark the conversion of R objects with a class to Python.
+
+The Python class for the R class of an object is memoized for the
+R type and class attribute of the object. This is compared to
+resolving it from the R class for each object (the behavior of rpy2
+before the resolution was memoized).
+
+Usage:
+
+    python benchmark_rclass.py [N_OBJECTS]
+"""
+
+import sys
+import timeit
+from rpy2 import rinterface
+from rpy2 import robjects
+from rpy2.robjects import conversion
+from rpy2.robjects.methods import methods_env
+
+R_S3 = rinterface.parse("""
+function(n) lapply(seq_len(n), function(i) structure(i, class=c('foo', 'bar')))
+""")
+R_S4 = rinterface.parse("""
+function(n) {
+  methods::setClass('Foo', representation(x='integer'))
+  lapply(seq_len(n), function(i) methods::new('Foo', x=i))
+}
+""")
+
+
+def rpy2py_uncached(obj):
+    nc_map = conversion.get_conversion().rpy2py_nc_map
+    if isinstance(obj, rinterface.SexpS4):
+        cls = (nc_map[rinterface.SexpS4]
+               .find(methods_env['extends'](obj.rclass)))
+    else:
+        cls = nc_map[type(obj)].find(obj.rclass)
+    return cls(obj)
+
+
+def run(n, repeat=3):
+    print('%i objects' % n)
+    print('%8s %14s %14s %8s' % ('objects', 'uncached (s)', 'cached (s)',
+                                 'speedup'))
+    rpy2py = robjects.default_converter.rpy2py
+    n_r = rinterface.IntSexpVector([n])
+    for name, r_src in (('S3', R_S3), ('S4', R_S4)):
+        objs = list(rinterface.baseenv['eval'](r_src)(n_r))
+        t_uncached = min(timeit.repeat(
+            lambda: [rpy2py_uncached(x) for x in objs],
+            number=1, repeat=repeat))
+        t_cached = min(timeit.repeat(
+            lambda: [rpy2py(x) for x in objs],
+            number=1, repeat=repeat))
+        print('%8s %14.4f %14.4f %8.1f' % (name, t_uncached, t_cached,
+                                           t_uncached / t_cached))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run(n)
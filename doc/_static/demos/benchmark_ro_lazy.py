@@ -0,0 +1,42 @@
+"""
+Benchmark chained R operations on vectors with the delegator `ro`.
+
+Each operation with `ro` is evaluated by R and converted back to
+Python. This is compared to building the chain of operations with
+`ro.lazy` and evaluating it in one R call.
+
+Usage:
+
+    python benchmark_ro_lazy.py [N]
+"""
+
+import sys
+import timeit
+from rpy2 import robjects
+
+
+def chain_eager(x, y):
+    return ((((x.ro + 1).ro * y).ro - 2).ro / y).ro ** 2
+
+
+def chain_lazy(x, y):
+    return ((((x.ro.lazy + 1).ro * y).ro - 2).ro / y).ro ** 2
+
+
+def run(n, repeat=3):
+    x = robjects.FloatVector(range(1000))
+    y = robjects.FloatVector(range(1, 1001))
+    print('%i evaluations of a chain of 5 operations' % n)
+    print('%12s %12s %8s' % ('eager (s)', 'lazy (s)', 'speedup'))
+    t_eager = min(timeit.repeat(
+        lambda: [chain_eager(x, y) for i in range(n)],
+        number=1, repeat=repeat))
+    t_lazy = min(timeit.repeat(
+        lambda: [chain_lazy(x, y).evaluate() for i in range(n)],
+        number=1, repeat=repeat))
+    print('%12.4f %12.4f %8.1f' % (t_eager, t_lazy, t_eager / t_lazy))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    run(n)
@@ -0,0 +1,66 @@
+"""
+Benchmark the overhead of calling rternalized Python functions from R.
+
+Functions rternalized with `rternalize()` have the layout of their
+parameters computed once. This is compared to an R external pointer
+made directly from the Python function, for which the layout is
+computed for each call (the behavior of rpy2 before the layout was
+cached).
+
+Usage:
+
+    python benchmark_rternalize.py [N_CALLS]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def f_posonly(x, /):
+    return x
+
+
+def f_keywords(x, y=None, *, z=None):
+    return x
+
+
+R_LOOP = ri.parse("""
+function(f, n) {
+  for (i in seq_len(n)) f(i)
+  invisible(NULL)
+}
+""")
+r_loop = ri.baseenv['eval'](R_LOOP)
+
+R_WRAP = ri.parse("""
+function(extptr) {
+  function(...) .External(".Python", extptr, ...)
+}
+""")
+r_wrap = ri.baseenv['eval'](R_WRAP)
+
+
+def run(n, repeat=3):
+    print('%i calls' % n)
+    print('%12s %14s %14s %8s' % ('function', 'per call (us)',
+                                  'cached (us)', 'speedup'))
+    n_r = ri.IntSexpVector([n])
+    for func in (f_posonly, f_keywords):
+        f_uncached = r_wrap(ri.SexpExtPtr.from_pyobject(func))
+        f_cached = ri.rternalize(func)
+        t_uncached = min(timeit.repeat(lambda: r_loop(f_uncached, n_r),
+                                       number=1, repeat=repeat))
+        t_cached = min(timeit.repeat(lambda: r_loop(f_cached, n_r),
+                                     number=1, repeat=repeat))
+        print('%12s %14.2f %14.2f %8.1f' % (func.__name__,
+                                            1e6 * t_uncached / n,
+                                            1e6 * t_cached / n,
+                                            t_uncached / t_cached))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run(n)
@@ -0,0 +1,55 @@
+"""
+Benchmark Python functions applied to R vectors from R.
+
+A function rternalized for scalars and applied to each element with
+R's `vapply()` is compared to the same computation rternalized with
+`vectorized=True`, called once on the whole vector or by chunks.
+
+Usage:
+
+    python benchmark_rternalize_vectorized.py [N_ITEMS]
+"""
+
+import math
+import random
+import sys
+import timeit
+import numpy
+import rpy2.rinterface as ri
+
+ri.initr()
+
+
+def f_scalar(x):
+    return math.exp(-x[0] ** 2)
+
+
+def f_vectorized(x):
+    return numpy.exp(-x ** 2)
+
+
+R_VAPPLY = ri.parse("""
+function(x, f) vapply(x, f, numeric(1))
+""")
+r_vapply = ri.baseenv['eval'](R_VAPPLY)
+
+
+def run(n, repeat=3):
+    print('%i items' % n)
+    x = ri.FloatSexpVector([random.random() for i in range(n)])
+    f_itemwise = ri.rternalize(f_scalar)
+    t_item = min(timeit.repeat(lambda: r_vapply(x, f_itemwise),
+                               number=1, repeat=repeat))
+    print('%24s %12s %8s' % ('mode', 'time (s)', 'speedup'))
+    print('%24s %12.4f %8.1f' % ('vapply', t_item, 1))
+    for chunksize in (None, 2 ** 16):
+        f = ri.rternalize(f_vectorized, vectorized=True,
+                          chunksize=chunksize)
+        t = min(timeit.repeat(lambda: f(x), number=1, repeat=repeat))
+        print('%24s %12.4f %8.1f' % ('vectorized (chunksize=%s)' % chunksize,
+                                     t, t_item / t))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run(n)
@@ -0,0 +1,63 @@
+"""
+Benchmark sending R vectors to an other process with shared memory.
+
+An R vector of doubles is pickled and unpickled in a child process,
+with the default pickling (R serialization) and with the content
+of the vector in shared memory (`rpy2.rinterface_lib.sharedmemory`).
+
+Usage:
+
+    python benchmark_sharedmemory.py [SIZE ...]
+"""
+
+import multiprocessing
+import pickle
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import sharedmemory
+
+ri.initr()
+
+
+def receive(conn):
+    while True:
+        data = conn.recv_bytes()
+        if not data:
+            break
+        x = pickle.loads(data)
+        conn.send(len(x))
+
+
+def send(conn, data):
+    conn.send_bytes(data)
+    conn.recv()
+
+
+def run(sizes, repeat=3):
+    ctx = multiprocessing.get_context('fork')
+    conn, child_conn = ctx.Pipe()
+    process = ctx.Process(target=receive, args=(child_conn, ))
+    process.start()
+    print('%12s %16s %16s %8s' % ('size', 'serialize (s)',
+                                  'shared mem. (s)', 'speedup'))
+    try:
+        for size in sizes:
+            x = ri.baseenv['runif'](size)
+            t_serialize = min(timeit.repeat(
+                lambda: send(conn, pickle.dumps(x)),
+                number=1, repeat=repeat))
+            t_shared = min(timeit.repeat(
+                lambda: send(conn, sharedmemory.dumps(x)[0]),
+                number=1, repeat=repeat))
+            print('%12i %16.4f %16.4f %8.1f' % (size, t_serialize, t_shared,
+                                                t_serialize / t_shared))
+    finally:
+        conn.send_bytes(b'')
+        process.join()
+
+
+if __name__ == '__main__':
+    sizes = ([int(x) for x in sys.argv[1:]] if len(sys.argv) > 1
+             else [10**4, 10**6, 10**8])
+    run(sizes)
@@ -0,0 +1,49 @@
+"""
+Benchmark slicing R vectors.
+
+Slices of R vectors of doubles are copied in bulk (one memmove for
+contiguous slices). This is compared to building the slice from the
+elements one by one (the behavior of rpy2 before slices were copied
+in bulk).
+
+Usage:
+
+    python benchmark_slice.py [N_ELEMENTS]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import openrlib
+
+ri.initr()
+
+
+def getslice_elements(vec, i):
+    cdata = vec.__sexp__._cdata
+    return ri.FloatSexpVector.from_iterable(
+        [openrlib.REAL_ELT(cdata, i_c)
+         for i_c in range(*i.indices(len(vec)))]
+    )
+
+
+def run(n, repeat=3):
+    vec = ri.FloatSexpVector(range(n))
+    print('vector of %i doubles' % n)
+    print('%12s %16s %12s %8s' % ('slice', 'elements (s)', 'bulk (s)',
+                                  'speedup'))
+    for i in (slice(None), slice(None, None, 2)):
+        t_elements = min(timeit.repeat(lambda: getslice_elements(vec, i),
+                                       number=1, repeat=repeat))
+        t_bulk = min(timeit.repeat(lambda: vec[i],
+                                   number=1, repeat=repeat))
+        print('%12s %16.4f %12.4f %8.1f' % ('[%s:%s:%s]' % (
+            '' if i.start is None else i.start,
+            '' if i.stop is None else i.stop,
+            '' if i.step is None else i.step), t_elements, t_bulk,
+            t_elements / t_bulk))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
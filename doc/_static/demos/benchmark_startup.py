@@ -0,0 +1,47 @@
+"""
+Benchmark starting Python processes that initialize the embedded R.
+
+Importing `rpy2.rinterface` and calling `initr()` is timed in new
+Python processes, first without a startup snapshot and then with one
+(see `python -m rpy2.situation snapshot`).
+
+Usage:
+
+    python benchmark_startup.py [N]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+import rpy2.situation
+
+CODE = 'import rpy2.rinterface as ri; ri.initr()'
+
+
+def start(n, env):
+    for i in range(n):
+        subprocess.run((sys.executable, '-c', CODE), env=env, check=True)
+
+
+def run(n, repeat=3):
+    print('%i Python processes running "%s"' % (n, CODE))
+    print('%15s %14s %8s' % ('no snapshot (s)', 'snapshot (s)', 'speedup'))
+    env = dict(os.environ)
+    env[rpy2.situation.ENVVAR_STARTUP_SNAPSHOT] = ''
+    t_nosnapshot = min(timeit.repeat(lambda: start(n, env),
+                                     number=1, repeat=repeat))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'startup_snapshot.json')
+        rpy2.situation.write_startup_snapshot(path)
+        env[rpy2.situation.ENVVAR_STARTUP_SNAPSHOT] = path
+        t_snapshot = min(timeit.repeat(lambda: start(n, env),
+                                       number=1, repeat=repeat))
+    print('%15.4f %14.4f %8.1f' % (t_nosnapshot, t_snapshot,
+                                   t_nosnapshot / t_snapshot))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    run(n)
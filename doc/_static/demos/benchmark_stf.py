@@ -0,0 +1,57 @@
+"""
+Benchmark wrapping R closures as SignatureTranslatedFunction objects.
+
+The translation of the signature of a SignatureTranslatedFunction is
+only made when first needed, and cached by parameter names. Wrapping all
+the closures in a namespace is compared to wrapping them and
+translating their signatures right away (the behavior of rpy2 before
+the translation was lazy).
+
+Usage:
+
+    python benchmark_stf.py [NAMESPACE]
+"""
+
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2.robjects import functions
+
+ri.initr()
+
+
+def closures(namespace):
+    env = ri.baseenv['asNamespace'](namespace)
+    res = []
+    for name in env.keys():
+        obj = env.find(name)
+        if obj.typeof == ri.RTYPES.CLOSXP:
+            res.append(obj)
+    return res
+
+
+def wrap_eager(funcs):
+    functions._PRM_TRANSLATE_CACHE.clear()
+    for f in funcs:
+        functions.SignatureTranslatedFunction(f)._prm_translate
+
+
+def wrap_lazy(funcs):
+    for f in funcs:
+        functions.SignatureTranslatedFunction(f)
+
+
+def run(namespace, repeat=3):
+    funcs = closures(namespace)
+    print('%i closures in %s' % (len(funcs), namespace))
+    print('%12s %12s %8s' % ('eager (s)', 'lazy (s)', 'speedup'))
+    t_eager = min(timeit.repeat(lambda: wrap_eager(funcs),
+                                number=1, repeat=repeat))
+    t_lazy = min(timeit.repeat(lambda: wrap_lazy(funcs),
+                               number=1, repeat=repeat))
+    print('%12.4f %12.4f %8.1f' % (t_eager, t_lazy, t_eager / t_lazy))
+
+
+if __name__ == '__main__':
+    namespace = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    run(namespace)
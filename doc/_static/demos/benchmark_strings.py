@@ -0,0 +1,76 @@
+"""
+Benchmark the conversion of Python strings to R and back.
+
+The bulk conversions (used by default for R vectors of strings) are
+compared to the conversion of one string at a time, for sequences with
+mostly unique strings and for sequences with few distinct strings (with
+and without the cache of R string scalars).
+
+Usage:
+
+    python benchmark_strings.py [N_ITEMS]
+"""
+
+import random
+import sys
+import timeit
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import conversion
+from rpy2.rinterface_lib import sexp
+
+ri.initr()
+
+
+def make_data(n):
+    return {
+        'unique': ['https://example.org/item/%i' % i for i in range(n)],
+        'few distinct': ['level%i' % random.randint(0, 20)
+                         for i in range(n)],
+    }
+
+
+def to_r_itemwise(data):
+    cls = ri.StrSexpVector
+    return cls.from_iterable(data,
+                             populate_func=sexp._populate_r_vector,
+                             set_elt=cls._R_SET_VECTOR_ELT,
+                             cast_value=cls._CAST_IN)
+
+
+def to_r_cached(data):
+    conversion.enable_charsxp_cache()
+    try:
+        return ri.StrSexpVector(data)
+    finally:
+        conversion.disable_charsxp_cache()
+
+
+def to_py_itemwise(vec):
+    return [vec[i] for i in range(len(vec))]
+
+
+def run(n, repeat=3):
+    print('%i items' % n)
+    print('%14s %10s %14s %10s %8s' % ('data', 'direction', 'path',
+                                       'time (s)', 'speedup'))
+    for name, data in make_data(n).items():
+        vec = ri.StrSexpVector(data)
+        for direction, paths in (
+                ('to R', (('itemwise', to_r_itemwise, data),
+                          ('bulk', ri.StrSexpVector, data),
+                          ('bulk+cache', to_r_cached, data))),
+                ('to Python', (('itemwise', to_py_itemwise, vec),
+                               ('bulk', list, vec)))):
+            t_ref = None
+            for path, func, arg in paths:
+                t = min(timeit.repeat(lambda: func(arg),
+                                      number=1, repeat=repeat))
+                if t_ref is None:
+                    t_ref = t
+                print('%14s %10s %14s %10.4f %8.1f' % (name, direction,
+                                                       path, t, t_ref / t))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
@@ -0,0 +1,63 @@
+"""
+Benchmark importing R packages with `importr()` and a symbol cache.
+
+Importing a package computes the translation of its R symbols and of
+the parameter names of its R functions. This is compared to importing
+it with a warm symbol cache, where the translations are read from an
+SQLite file.
+
+Each package is loaded in R before the timings, so that only the time
+spent by rpy2 is measured.
+
+Usage:
+
+    python benchmark_symbol_cache.py [PACKAGE ...]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+import warnings
+from rpy2.robjects import functions
+from rpy2.robjects import packages
+
+
+def import_uncached(name):
+    functions._PRM_TRANSLATE_CACHE.clear()
+    packages.importr(name, on_conflict='warn')
+
+
+def import_cached(name, path):
+    functions._PRM_TRANSLATE_CACHE.clear()
+    packages.importr(name, on_conflict='warn', symbol_cache=path)
+
+
+def run(names, repeat=3):
+    print('%12s %10s %14s %12s %8s' % ('package', 'symbols', 'uncached (s)',
+                                       'cached (s)', 'speedup'))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'symbols.sqlite')
+        for name in names:
+            if not packages.isinstalled(name):
+                print('%12s (not installed)' % name)
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                pack = packages.importr(name, on_conflict='warn',
+                                        symbol_cache=path)
+                t_uncached = min(timeit.repeat(
+                    lambda: import_uncached(name),
+                    number=1, repeat=repeat))
+                t_cached = min(timeit.repeat(
+                    lambda: import_cached(name, path),
+                    number=1, repeat=repeat))
+            print('%12s %10i %14.4f %12.4f %8.1f' % (name, len(pack._rpy2r),
+                                                     t_uncached, t_cached,
+                                                     t_uncached / t_cached))
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] if len(sys.argv) > 1 else ['base', 'stats',
+                                                    'utils', 'Matrix']
+    run(names)
@@ -5,7 +5,6 @@ import atexit
 import collections
 import contextlib
 import contextvars
-import csv
 import enum
 import functools
 import inspect
@@ -14,13 +13,12 @@ import os
 import math
 import platform
 import signal
-import subprocess
-import tempfile
 import textwrap
 import threading
 import typing
 import warnings
 from typing import Union
+import rpy2.situation
 from rpy2.rinterface_lib import openrlib
 import rpy2.rinterface_lib._rinterface_capi as _rinterface
 import rpy2.rinterface_lib.embedded as embedded
@@ -115,10 +113,123 @@ def local_context(
         evaluation_context.reset(token)
 
 
+ParseCacheInfo = collections.namedtuple(
+    'ParseCacheInfo', ('hits', 'misses', 'maxsize', 'currsize')
+)
+
+
+class _ParseCache(object):
+    """Bounded LRU cache of parsed R code.
+
+    The cached R expressions are protected from R's garbage collection
+    by the Python objects in the cache."""
+
+    def __init__(self, maxsize: int = 0):
+        self._lock = threading.Lock()
+        self._cache: collections.OrderedDict[
+            typing.Tuple[str, int], 'ExprSexpVector'
+        ] = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def _reset_lock(self) -> None:
+        # The lock may have been held by an other thread when the
+        # process was forked.
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError('maxsize must be >= 0.')
+        with self._lock:
+            self._maxsize = value
+            while len(self._cache) > value:
+                self._cache.popitem(last=False)
+
+    def get(self, key: typing.Tuple[str, int]
+            ) -> typing.Optional['ExprSexpVector']:
+        with self._lock:
+            res = self._cache.get(key)
+            if res is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+        return res
+
+    def put(self, key: typing.Tuple[str, int],
+            value: 'ExprSexpVector') -> None:
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def info(self) -> ParseCacheInfo:
+        with self._lock:
+            return ParseCacheInfo(self._hits, self._misses,
+                                  self._maxsize, len(self._cache))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_parse_cache = _ParseCache()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_parse_cache._reset_lock)
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Statistics for the cache of parsed R code.
+
+    :return: A named tuple (hits, misses, maxsize, currsize)."""
+    return _parse_cache.info()
+
+
+def parse_cache_clear() -> None:
+    """Clear the cache of parsed R code and its statistics."""
+    _parse_cache.clear()
+
+
+def set_parse_cache_maxsize(maxsize: int) -> None:
+    """Set the maximum number of parsed R code strings to cache.
+
+    The cache is used by :func:`parse`, and therefore by
+    :func:`evalr`, when the maximum size is larger than 0. The
+    default is 0 (no cache).
+
+    Cached R expressions are shared between callers, and should
+    not be modified in place.
+
+    :param maxsize: The maximum number of entries. The least recently
+      used entries are discarded when the cache is full."""
+    _parse_cache.maxsize = maxsize
+
+
 @_cdata_res_to_rinterface
+def _parse(text: str, num: int):
+    robj = StrSexpVector([text])
+    with memorymanagement.rmemory() as rmemory:
+        res = _rinterface._parse(robj.__sexp__._cdata, num, rmemory)
+    return res
+
+
 def parse(text: str, num: int = -1):
     """Parse a string as R code.
 
+    The parsed R code is cached when a cache size was set with
+    :func:`set_parse_cache_maxsize`.
+
     :param text: A string with R code to parse.
     :param num: The maximum number of lines to parse. If -1, no
       limit is applied.
@@ -126,9 +237,13 @@ def parse(text: str, num: int = -1):
 
     if not isinstance(text, str):
         raise TypeError('text must be a string.')
-    robj = StrSexpVector([text])
-    with memorymanagement.rmemory() as rmemory:
-        res = _rinterface._parse(robj.__sexp__._cdata, num, rmemory)
+    if _parse_cache.maxsize == 0:
+        return _parse(text, num)
+    key = (text, num)
+    res = _parse_cache.get(key)
+    if res is None:
+        res = _parse(text, num)
+        _parse_cache.put(key, res)
     return res
 
 
@@ -430,6 +545,36 @@ class SexpVectorWithNumpyInterface(SexpVectorCCompatibleAbstract, SexpVector):
             )
         )
 
+    @classmethod
+    @_cdata_res_to_rinterface
+    def from_buffer_view(cls, obj):
+        """Create an R vector using the memory of a Python buffer.
+
+        The object can be anything implementing the buffer protocol
+        (memoryview, numpy array, Arrow buffer, etc...) as long as it is
+        C-contiguous and its items have the same C representation as
+        the R vector. Its content is not copied: R sees an ordinary
+        vector (an ALTREP object) reading directly from the buffer, and
+        the Python object is kept alive for as long as R needs it.
+
+        R makes its own copy of the data the first time it requests
+        to write to the vector, leaving the buffer unchanged. Changes
+        made to the buffer from Python are visible in R until then.
+
+        This is only available in the cffi API mode."""
+        if not embedded.isready():
+            raise embedded.RNotReadyError('Embedded R is not ready to use.')
+        mview = memoryview(obj)
+        if not mview.c_contiguous:
+            raise ValueError('The buffer must be C-contiguous.')
+        if not cls._check_C_compatible(mview):
+            cls._raise_incompatible_C_size(mview)
+        n = mview.nbytes // mview.itemsize
+        with memorymanagement.rmemory() as rmemory:
+            res = _rinterface.altrep_from_buffer(cls._R_TYPE, mview, n,
+                                                 rmemory)
+        return res
+
 
 class ByteSexpVector(SexpVectorWithNumpyInterface):
     """Array of bytes.
@@ -442,6 +587,7 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
     _NP_TYPESTR = '|u1'
 
     _R_GET_PTR = staticmethod(openrlib.RAW)
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_raw)
 
     @staticmethod
     def _CAST_IN(x: typing.Any) -> int:
@@ -474,12 +620,7 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
             i_c = _rinterface._python_index_to_c(cdata, i)
             res = openrlib.RAW_ELT(cdata, i_c)
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.RAW_ELT(
-                    cdata, i_c
-                ) for i_c in range(*i.indices(len(self)))
-                ]
-            )
+            res = self._getslice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -491,10 +632,7 @@ class ByteSexpVector(SexpVectorWithNumpyInterface):
             i_c = _rinterface._python_index_to_c(cdata, i)
             openrlib.RAW(cdata)[i_c] = self._CAST_IN(value)
         elif isinstance(i, slice):
-            for i_c, v in zip(range(*i.indices(len(self))), value):
-                if v > 255:
-                    raise ValueError('byte must be in range(0, 256)')
-                openrlib.RAW(cdata)[i_c] = self._CAST_IN(v)
+            self._setslice(i, value, self._CAST_IN)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -512,6 +650,7 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
     _R_VECTOR_ELT = staticmethod(openrlib.LOGICAL_ELT)
     _R_SET_VECTOR_ELT = openrlib.SET_LOGICAL_ELT
     _R_GET_PTR = staticmethod(openrlib.LOGICAL)
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_logical)
 
     @staticmethod
     def _CAST_IN(x):
@@ -533,10 +672,7 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
             res = (na_values.NA_Logical  # type: ignore
                    if elt == NA_Logical else bool(elt))
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.LOGICAL_ELT(cdata, i_c)
-                 for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._getslice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -549,9 +685,7 @@ class BoolSexpVector(SexpVectorWithNumpyInterface):
             openrlib.SET_LOGICAL_ELT(cdata, i_c,
                                      int(value))
         elif isinstance(i, slice):
-            for i_c, v in zip(range(*i.indices(len(self))), value):
-                openrlib.SET_LOGICAL_ELT(cdata, i_c,
-                                         int(v))
+            self._setslice(i, value, int)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -577,6 +711,7 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
 
     _R_GET_PTR = staticmethod(openrlib.INTEGER)
     _CAST_IN = staticmethod(nullable_int)
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_integer)
 
     def __getitem__(self, i: Union[int, slice]) -> Union[int, 'IntSexpVector']:
         cdata = self.__sexp__._cdata
@@ -586,11 +721,7 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
             if res == NA_Integer:
                 res = NA_Integer
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.INTEGER_ELT(
-                    cdata, i_c
-                ) for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._getslice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -603,9 +734,7 @@ class IntSexpVector(SexpVectorWithNumpyInterface):
             openrlib.SET_INTEGER_ELT(cdata, i_c,
                                      int(value))
         elif isinstance(i, slice):
-            for i_c, v in zip(range(*i.indices(len(self))), value):
-                openrlib.SET_INTEGER_ELT(cdata, i_c,
-                                         int(v))
+            self._setslice(i, value, int)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -624,6 +753,7 @@ class FloatSexpVector(SexpVectorWithNumpyInterface):
 
     _CAST_IN = staticmethod(float)
     _R_GET_PTR = staticmethod(openrlib.REAL)
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_real)
 
     def __getitem__(
             self, i: Union[int, slice]
@@ -633,10 +763,7 @@ class FloatSexpVector(SexpVectorWithNumpyInterface):
             i_c = _rinterface._python_index_to_c(cdata, i)
             res = openrlib.REAL_ELT(cdata, i_c)
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.REAL_ELT(
-                    cdata, i_c) for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._getslice(i)
         else:
             raise TypeError('Indices must be integers or slices, not %s' %
                             type(i))
@@ -649,9 +776,7 @@ class FloatSexpVector(SexpVectorWithNumpyInterface):
             openrlib.SET_REAL_ELT(cdata, i_c,
                                   float(value))
         elif isinstance(i, slice):
-            for i_c, v in zip(range(*i.indices(len(self))), value):
-                openrlib.SET_REAL_ELT(cdata, i_c,
-                                      float(v))
+            self._setslice(i, value, float)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -665,6 +790,7 @@ class ComplexSexpVector(SexpVectorCCompatibleAbstract, SexpVector):
     _R_TYPE = openrlib.rlib.CPLXSXP
     _R_GET_PTR = staticmethod(openrlib.COMPLEX)
     _R_SIZEOF_ELT = _rinterface.ffi.sizeof('Rcomplex')
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_complex)
 
     @staticmethod
     def _R_VECTOR_ELT(x, i):
@@ -696,10 +822,7 @@ class ComplexSexpVector(SexpVectorCCompatibleAbstract, SexpVector):
             _ = openrlib.COMPLEX_ELT(cdata, i_c)
             res = complex(_.r, _.i)
         elif isinstance(i, slice):
-            res = type(self).from_iterable(
-                [openrlib.COMPLEX_ELT(
-                    cdata, i_c) for i_c in range(*i.indices(len(self)))]
-            )
+            res = self._getslice(i)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -711,8 +834,7 @@ class ComplexSexpVector(SexpVectorCCompatibleAbstract, SexpVector):
             i_c = _rinterface._python_index_to_c(cdata, i)
             openrlib.COMPLEX(cdata)[i_c] = self._CAST_IN(value)
         elif isinstance(i, slice):
-            for i_c, v in zip(range(*i.indices(len(self))), value):
-                openrlib.COMPLEX(cdata)[i_c] = self._CAST_IN(v)
+            self._setslice(i, value, self._CAST_IN)
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -967,6 +1089,127 @@ class SexpClosure(Sexp):
         """Closure of the R function."""
         return openrlib.rlib.R_ClosureEnv(self.__sexp__._cdata)
 
+    def prepare(self, *names: typing.Optional[str]) -> 'PreparedCall':
+        """Prepare a call to the R function with the given arguments.
+
+        The call is built once, and can be evaluated many times with
+        different values for the arguments. This avoids building the
+        R call for each evaluation when calling the same function with
+        the same argument names in a loop.
+
+        :param names: The names of the arguments, in order. A name that
+          is None is an unnamed (positional) argument.
+        :return: A :class:`PreparedCall`."""
+        return PreparedCall(self, names)
+
+
+class PreparedCall(object):
+    """A call to an R function with a fixed list of arguments.
+
+    The R call is built once, with its argument names, and the values
+    of the arguments are replaced in place before each evaluation.
+    Arguments for which no value was set are missing in the call.
+
+    The values of the arguments remain referenced by the call until
+    they are replaced. The call is not thread-safe: threads should
+    not share a prepared call.
+
+    >>> predict = rinterface.baseenv['get']('predict')
+    >>> call = predict.prepare(None, 'newdata')
+    >>> for df in frames:
+    ...     res = call(model, df)
+    """
+
+    def __init__(self, function: SexpClosure,
+                 names: typing.Sequence[typing.Optional[str]]):
+        self._function = function
+        self._names = tuple(names)
+        rlib = openrlib.rlib
+        with memorymanagement.rmemory() as rmemory:
+            call_r = rmemory.protect(
+                _rinterface.build_rcall_template(function.__sexp__._cdata,
+                                                 self._names)
+            )
+            self._call = conversion._cdata_to_rinterface(call_r)
+            cells = []
+            item = rlib.CDR(call_r)
+            for _ in self._names:
+                cells.append(item)
+                item = rlib.CDR(item)
+        self._cells = tuple(cells)
+
+    @property
+    def function(self) -> SexpClosure:
+        """The R function called."""
+        return self._function
+
+    @property
+    def names(self) -> typing.Tuple[typing.Optional[str], ...]:
+        """The names of the arguments (None for unnamed arguments)."""
+        return self._names
+
+    @property
+    def call(self) -> 'LangSexpVector':
+        """The R call."""
+        return self._call
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _index(self, i: typing.Union[int, str]) -> int:
+        if isinstance(i, str):
+            try:
+                return self._names.index(i)
+            except ValueError:
+                raise KeyError(i)
+        if i < 0:
+            i += len(self._cells)
+        if not 0 <= i < len(self._cells):
+            raise IndexError('index out of range')
+        return i
+
+    def __setitem__(self, i: typing.Union[int, str], value) -> None:
+        """Set the value of an argument, by position or name."""
+        cell = self._cells[self._index(i)]
+        with memorymanagement.rmemory() as rmemory:
+            openrlib.rlib.SETCAR(
+                cell, rmemory.protect(conversion._get_cdata(value))
+            )
+
+    @_cdata_res_to_rinterface
+    def __call__(self, *args,
+                 environment: typing.Optional[SexpEnvironment] = None
+                 ) -> Sexp:
+        """Evaluate the call.
+
+        :param args: The values of all the arguments, in order, or
+          nothing to evaluate the call with the values already set.
+        :param environment: An optional R environment to evaluate the
+          call. If None, the environment in the context variable
+          `evaluation_context` is used.
+        :return: The result of the call."""
+        if args and len(args) != len(self._cells):
+            raise ValueError('%i arguments expected (%i given).' %
+                             (len(self._cells), len(args)))
+        if environment is None:
+            environment = evaluation_context.get()
+        error_occured = _rinterface.ffi.new('int *', 0)
+        rlib = openrlib.rlib
+        with memorymanagement.rmemory() as rmemory:
+            for cell, value in zip(self._cells, args):
+                rlib.SETCAR(
+                    cell, rmemory.protect(conversion._get_cdata(value))
+                )
+            res = rmemory.protect(
+                rlib.R_tryEval(
+                    self._call.__sexp__._cdata,
+                    environment.__sexp__._cdata,
+                    error_occured)
+            )
+            if error_occured[0]:
+                raise embedded.RRuntimeError(_rinterface._geterrmessage())
+        return res
+
 
 class SexpS4(Sexp):
     """R "S4" object.
@@ -1131,17 +1374,22 @@ def initr(
             logger.info('R is already initialized. No need to initialize.')
             return None
 
-        _setrenvvars(_ENVVAR_ACTION_MAP)
+        with rpy2.situation._startup_phase('R environment variables'):
+            _setrenvvars(_ENVVAR_ACTION_MAP)
         if embedded.is_r_externally_initialized():
             embedded._setinitialized()
         else:
-            status = embedded._initr(interactive=interactive,
-                                     _want_setcallbacks=_want_setcallbacks,
-                                     _c_stack_limit=_c_stack_limit)
+            with rpy2.situation._startup_phase('R initialization'):
+                status = embedded._initr(
+                    interactive=interactive,
+                    _want_setcallbacks=_want_setcallbacks,
+                    _c_stack_limit=_c_stack_limit
+                )
             embedded.set_python_process_info()
         atexit.register(endr, 0)
-        _rinterface._register_external_symbols()
-        _post_initr_setup()
+        with rpy2.situation._startup_phase('rpy2 setup'):
+            _rinterface._register_external_symbols()
+            _post_initr_setup()
     return status
 
 
@@ -1189,61 +1437,20 @@ def _ensure_utf8_locale(l10n):
         return False
 
 
-# TODO: This function could be used by situation.py. May be better to
-# place elsewhere.
 def _getrenvvars(
         baselinevars: typing.Optional[typing.MutableMapping[str, str]] = None,
         r_home: typing.Optional[str] = None
 ) -> typing.Tuple[typing.Tuple[str, str], ...]:
-    """Get the environment variables defined by the R front-end script."""
-    if baselinevars is None:
-        baselinevars = os.environ
+    """Get the environment variables defined by the R front-end script.
+
+    They are read from a valid startup snapshot if present (see
+    :func:`rpy2.situation.write_startup_snapshot`), otherwise R
+    is called in a subprocess."""
     if r_home is None:
         r_home = openrlib.R_HOME
         if r_home is None:
             raise RuntimeError('Unable to determine R_HOME.')
-
-    # Use a temporary file to write the environment variables. Windows
-    # has a file locking system that requires a slightly more complicated
-    # implementation than it would otherwise be on other OSes.
-    temp_fh = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-    temp_fh.close()
-    try:
-        if os.name == 'nt':
-            temp_name = temp_fh.name.replace('\\', '/')
-        else:
-            temp_name = temp_fh.name
-        cmd = (
-            os.path.join(r_home, 'bin', 'Rscript'),
-            '-e',
-            ';'.join(
-                (
-                    'x <- Sys.getenv()',
-                    'dataf <- data.frame(key=names(x), val=as.character(x))',
-                    f'write.csv(dataf, file="{temp_name}", row.names=FALSE)'
-                )
-            )
-        )
-        subprocess.run(cmd)
-        res = []
-        with open(temp_fh.name, mode='r') as _:
-            reader = csv.reader(_)
-            assert tuple(next(reader)) == ('key', 'val')
-            for row in reader:
-                if len(row) != 2:
-                    raise ValueError(
-                        f'Invalid environment variable row: {row}'
-                    )
-                k, v = row
-                if (
-                        (k not in baselinevars)
-                        or
-                        (baselinevars[k] != v)
-                ):
-                    res.append((k, v))
-    finally:
-        os.remove(temp_fh.name)
-    return tuple(res)
+    return rpy2.situation.get_r_envvars(r_home, baselinevars)
 
 
 def _setrenvvars(action_map: typing.Dict[str, _ENVVAR_ACTION]):
@@ -1345,9 +1552,130 @@ def _find_first(nodes, of_type):
     )
 
 
+# R type for the result of a vectorized function, by numpy dtype kind.
+_VECTORIZED_RTYPES = {
+    'b': RTYPES.LGLSXP,
+    'i': RTYPES.INTSXP,
+    'u': RTYPES.INTSXP,
+    'f': RTYPES.REALSXP
+}
+
+# Functions coercing an R vector to a wider type, by R type.
+_VECTORIZED_COERCE = {
+    RTYPES.INTSXP: 'as.integer',
+    RTYPES.REALSXP: 'as.double'
+}
+
+
+@_cdata_res_to_rinterface
+def _allocvector(rtype: RTYPES, n: int):
+    with memorymanagement.rmemory() as rmemory:
+        res = rmemory.protect(openrlib.rlib.Rf_allocVector(rtype, n))
+    return res
+
+
+def _vectorized(function: typing.Callable,
+                chunksize: typing.Optional[int]) -> typing.Callable:
+    """Wrap a function for the vectorized mode of rternalize().
+
+    R vectors that numpy can map to an array are passed to the function
+    as numpy views (no copy). Whenever `chunksize` is not None, the
+    arguments with the length of the first array are passed in slices
+    of at most `chunksize` items, the function must return an array
+    with the length of each slice, and the results are written into a
+    single R vector allocated once. Otherwise the function is called
+    once and what it returns (an array, or a scalar) is copied into
+    a new R vector.
+
+    The numpy views are read-only, as writing into them would modify
+    the R vectors of the caller. Integer results that do not fit in
+    R integers (int64 from numpy reductions, for example) are returned
+    as R floats rather than wrapped around."""
+    import numpy
+
+    int_info = numpy.iinfo(numpy.int32)
+
+    def as_array(obj):
+        if isinstance(obj, SexpVectorWithNumpyInterface):
+            res = numpy.asarray(obj)
+            res.flags.writeable = False
+            return res
+        return obj
+
+    def rtype_for(value):
+        try:
+            rtype = _VECTORIZED_RTYPES[value.dtype.kind]
+        except KeyError:
+            raise TypeError(
+                f'Cannot return an array of type {value.dtype} '
+                'to R from a vectorized function.'
+            )
+        # The smallest int32 is NA_integer_ in R.
+        if (
+                rtype == RTYPES.INTSXP
+                and not numpy.can_cast(value.dtype, numpy.int32)
+                and value.size
+                and (value.min() <= int_info.min
+                     or value.max() > int_info.max)
+        ):
+            rtype = RTYPES.REALSXP
+        return rtype
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        args = [as_array(x) for x in args]
+        kwargs = {k: as_array(v) for k, v in kwargs.items()}
+        arrays = [x for x in (*args, *kwargs.values())
+                  if isinstance(x, numpy.ndarray)]
+        n = len(arrays[0]) if arrays and arrays[0].ndim == 1 else 0
+        if chunksize is None or n <= chunksize:
+            value = function(*args, **kwargs)
+            if isinstance(value, Sexp):
+                return value
+            value = numpy.asarray(value)
+            res = _allocvector(rtype_for(value), value.size)
+            numpy.asarray(res)[:] = value.reshape(-1, order='F')
+            return res
+
+        def chunk(x, start, end):
+            if (isinstance(x, numpy.ndarray) and x.ndim == 1
+                    and len(x) == n):
+                return x[start:end]
+            return x
+
+        res = None
+        for start in range(0, n, chunksize):
+            end = min(start + chunksize, n)
+            value = numpy.asarray(
+                function(*(chunk(x, start, end) for x in args),
+                         **{k: chunk(v, start, end)
+                            for k, v in kwargs.items()})
+            )
+            if value.shape != (end - start, ):
+                raise ValueError(
+                    'A vectorized function called by chunks must return '
+                    'an array with the length of the chunk '
+                    f'({end - start}), not with shape {value.shape}.'
+                )
+            rtype = rtype_for(value)
+            if res is None:
+                res = _allocvector(rtype, n)
+                res_view = numpy.asarray(res)
+            elif rtype in _VECTORIZED_COERCE and rtype > res.typeof:
+                # Earlier chunks fitted in a narrower R type.
+                res = baseenv[_VECTORIZED_COERCE[rtype]](res)
+                res_view = numpy.asarray(res)
+            res_view[start:end] = value
+        return res
+
+    return wrapper
+
+
 def rternalize(
         function: typing.Optional[typing.Callable] = None, *,
-        signature: bool = False
+        signature: bool = False,
+        vectorized: bool = False,
+        chunksize: typing.Optional[int] = None
 ) -> typing.Union[SexpClosure, functools.partial]:
     """ Make a Python function callable from R.
 
@@ -1426,21 +1754,70 @@ def rternalize(
     positional-or-keyword are considered to be positional arguments in a
     function call.
 
+    With `vectorized=True` the function is written for numpy arrays
+    rather than for R objects. R vectors of logicals, integers, floats
+    and bytes are passed as numpy views on the R data (logical vectors
+    are arrays of 32-bit integers), and the array or scalar returned is
+    converted to an R vector of logicals, integers or floats. This
+    allows using numpy or numba kernels as R functions with one Python
+    call per call from R rather than per element:
+
+    .. code-block:: python
+       @rternalize(vectorized=True)
+       def rosenbrock(p):
+           return numpy.sum(100 * (p[1:] - p[:-1] ** 2) ** 2 +
+                            (1 - p[:-1]) ** 2)
+
+    >>> res = ri.evalr('stats::optim')(ri.FloatSexpVector([-1.2, 1]),
+    ...                                  rosenbrock)
+
+    When `chunksize` is also given, the function must be element-wise:
+    arguments with the length of the first vector are passed in slices
+    of at most `chunksize` items and the arrays returned are written
+    into one R vector allocated for the complete result.
+
+    The arrays passed to the function are read-only views, and must be
+    copied before being modified in place. Integer results that do not
+    fit in R integers are returned as R floats.
+
     :param function: A Python callable object. This is a positional
     argument with a default value `None` to allow the decorator function
     without parentheses when optional argument is not wanted.
 
+    :param signature: Give the R function a signature matching the
+    one of the Python function.
+
+    :param vectorized: Pass R vectors to the function as numpy arrays
+    and return its result as an R vector. This requires numpy.
+
+    :param chunksize: In vectorized mode, the maximum number of items
+    passed to the function in one call (None for no maximum).
+
     :return: A wrapped R object that can be use like any other rpy2
     object.
     """
     if not embedded.isinitialized():
         raise embedded.RNotReadyError('The embedded R is not yet initialized.')
 
+    if chunksize is not None:
+        if not vectorized:
+            raise ValueError('chunksize can only be used with '
+                             'vectorized=True.')
+        if chunksize < 1:
+            raise ValueError('chunksize must be a positive integer.')
+
     if function is None:
-        return functools.partial(rternalize, signature=signature)
+        return functools.partial(rternalize, signature=signature,
+                                 vectorized=vectorized, chunksize=chunksize)
 
     assert callable(function)
-    rpy_fun = SexpExtPtr.from_pyobject(function)
+    if vectorized:
+        function = _vectorized(function, chunksize)
+    # The layout of the function's parameters is computed here once
+    # and stored with it in the external pointer.
+    rpy_fun = SexpExtPtr.from_pyobject(
+        _rinterface._RternalizedFunction(function)
+    )
 
     if not signature:
         template = parse("""
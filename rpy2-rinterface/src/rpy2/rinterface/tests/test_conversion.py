@@ -1,10 +1,39 @@
 import pytest
+import rpy2.rinterface as ri
 from rpy2.rinterface_lib import _rinterface_capi as _rinterface
 import rpy2.rinterface_lib.conversion
 
+ri.initr()
+
 
 def test__int_to_sexp():
     with pytest.raises(ValueError):
             rpy2.rinterface_lib.conversion._int_to_sexp(
                 _rinterface._MAX_INT + 1
             )
+
+
+def test_charsxp_cache():
+    conversion = rpy2.rinterface_lib.conversion
+    assert conversion.charsxp_cache_info() is None
+    conversion.enable_charsxp_cache(maxsize=2)
+    try:
+        v = ri.StrSexpVector(['a', 'b', 'a', None])
+        assert tuple(v) == ('a', 'b', 'a', ri.NA_Character)
+        info = conversion.charsxp_cache_info()
+        assert info.misses == 3
+        assert info.hits == 0
+        assert info.currsize == 2
+        v = ri.StrSexpVector(['b', 'c', 'a'])
+        assert tuple(v) == ('b', 'c', 'a')
+        info = conversion.charsxp_cache_info()
+        assert info.hits == 2
+        assert info.misses == 4
+        assert info.currsize == 2
+        ri.evalr('gc()')
+        v = ri.StrSexpVector(['c', 'a'])
+        assert tuple(v) == ('c', 'a')
+        assert conversion.charsxp_cache_info().hits == 4
+    finally:
+        conversion.disable_charsxp_cache()
+    assert conversion.charsxp_cache_info() is None
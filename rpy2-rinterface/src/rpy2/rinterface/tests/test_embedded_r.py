@@ -13,6 +13,12 @@ import tempfile
 import textwrap
 import time
 
+try:
+    import numpy
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
 SKIP_KNOWN_ISSUES = True
 
 rinterface.initr()
@@ -136,6 +142,33 @@ def test_parse_invalid_string():
         rinterface.parse(3)
 
 
+def test_parse_cache():
+    rinterface.parse_cache_clear()
+    rinterface.set_parse_cache_maxsize(2)
+    try:
+        xp = rinterface.parse('2 + 3')
+        assert rinterface.parse('2 + 3') is xp
+        assert rinterface.parse('2 + 3', num=1) is not xp
+        assert rinterface.parse_cache_info() == (1, 2, 2, 2)
+        rinterface.parse('4 + 5')
+        assert rinterface.parse_cache_info().currsize == 2
+        assert rinterface.parse('2 + 3') is not xp
+        res = rinterface.evalr('4 + 5')
+        assert tuple(res) == (9, )
+        assert rinterface.parse_cache_info().hits == 2
+        rinterface.parse_cache_clear()
+        assert rinterface.parse_cache_info() == (0, 0, 2, 0)
+    finally:
+        rinterface.set_parse_cache_maxsize(0)
+    assert rinterface.parse('2 + 3') is not rinterface.parse('2 + 3')
+    assert rinterface.parse_cache_info().misses == 0
+
+
+def test_parse_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        rinterface.set_parse_cache_maxsize(-1)
+
+
 @pytest.mark.parametrize(
     'envir',
     (None, rinterface.globalenv, rinterface.ListSexpVector([])))
@@ -261,6 +294,116 @@ def test_rternalize_formals():
     assert list(rnames(rformals(rfun))) == ['a', 'b', 'c', 'd', 'e']
 
 
+def test_rternalize_layout_once(monkeypatch):
+    def f(x, y=1):
+        return x[0] + y[0]
+    rfun = rinterface.rternalize(f)
+
+    def from_function(*args):
+        raise AssertionError('The layout should be computed once.')
+    monkeypatch.setattr(rinterface._rinterface._ParameterLayout,
+                        'from_function', from_function)
+    assert rfun(1, y=2)[0] == 3
+
+
+@pytest.mark.parametrize('signature', (True, False))
+def test_rternalize_positional_only(signature):
+    def f(x, y, /, *args):
+        return x[0] + y[0] + len(args)
+    rfun = rinterface.rternalize(f, signature=signature)
+    assert rfun(1, 2)[0] == 3
+    assert rfun(1, 2, 3, 4)[0] == 5
+    assert rfun(x=1, y=2)[0] == 3
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized():
+    seen = []
+
+    def f(x, y):
+        seen.append((type(x), len(x), type(y)))
+        return x * 2 + y
+
+    rfun = rinterface.rternalize(f, vectorized=True)
+    res = rfun(rinterface.FloatSexpVector([1, 2, 3]),
+               rinterface.IntSexpVector([1]))
+    assert isinstance(res, rinterface.FloatSexpVector)
+    assert tuple(res) == (3, 5, 7)
+    assert seen == [(numpy.ndarray, 3, numpy.ndarray)]
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_scalar():
+    rfun = rinterface.rternalize(lambda x: (x ** 2).sum(), vectorized=True)
+    optim = rinterface.evalr('stats::optim')
+    res = optim(rinterface.FloatSexpVector([1.5, -2]), rfun)
+    assert len(res[0]) == 2
+    assert all(abs(x) < 1e-2 for x in res[0])
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_chunks():
+    chunks = []
+
+    def f(x, offset):
+        chunks.append(len(x))
+        return x + offset[0]
+
+    rfun = rinterface.rternalize(f, vectorized=True, chunksize=4)
+    res = rfun(rinterface.IntSexpVector(range(10)),
+               rinterface.IntSexpVector([100]))
+    assert isinstance(res, rinterface.IntSexpVector)
+    assert tuple(res) == tuple(range(100, 110))
+    assert chunks == [4, 4, 2]
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+@pytest.mark.parametrize('chunksize', (None, 2))
+def test_rternalize_vectorized_int_overflow(chunksize):
+    def f(x):
+        return x.astype(numpy.int64) * 2 ** 31
+
+    rfun = rinterface.rternalize(f, vectorized=True, chunksize=chunksize)
+    res = rfun(rinterface.IntSexpVector([0, 0, 1]))
+    assert isinstance(res, rinterface.FloatSexpVector)
+    assert tuple(res) == (0, 0, 2 ** 31)
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_int64():
+    rfun = rinterface.rternalize(lambda x: numpy.arange(len(x)),
+                                 vectorized=True)
+    res = rfun(rinterface.FloatSexpVector([1, 2, 3]))
+    assert isinstance(res, rinterface.IntSexpVector)
+    assert tuple(res) == (0, 1, 2)
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_readonly():
+    def f(x):
+        x[0] = 100
+        return x
+
+    rfun = rinterface.rternalize(f, vectorized=True)
+    x = rinterface.IntSexpVector([1, 2])
+    with pytest.raises(rinterface.embedded.RRuntimeError):
+        rfun(x)
+    assert tuple(x) == (1, 2)
+
+
+@pytest.mark.skipif(not has_numpy, reason='Package numpy is not installed.')
+def test_rternalize_vectorized_chunks_length_mismatch():
+    rfun = rinterface.rternalize(lambda x: x.sum(), vectorized=True,
+                                 chunksize=2)
+    with pytest.raises(rinterface.embedded.RRuntimeError):
+        rfun(rinterface.FloatSexpVector([1, 2, 3]))
+
+
+def test_rternalize_chunksize_not_vectorized():
+    with pytest.raises(ValueError):
+        rinterface.rternalize(lambda x: x, chunksize=10)
+
+
 def test_external_python():
     def f(x):
         return 3
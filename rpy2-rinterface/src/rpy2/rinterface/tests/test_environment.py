@@ -67,6 +67,29 @@ def test_setitem_baseenv_invalid():
         rinterface.baseenv['pi'] = 42
 
 
+def test_setitem_nocopy():
+    x = rinterface.IntSexpVector([1, 2, 3])
+    rinterface.globalenv['x'] = x
+    try:
+        assert rinterface.globalenv['x'].rid == x.rid
+        # Modifying the object in R makes a copy.
+        rinterface.evalr('x[1] <- 10L')
+        assert tuple(rinterface.globalenv['x']) == (10, 2, 3)
+        assert tuple(x) == (1, 2, 3)
+    finally:
+        del rinterface.globalenv['x']
+
+
+def test_assign_copy():
+    x = rinterface.IntSexpVector([1, 2, 3])
+    rinterface.globalenv.assign('x', x, copy=True)
+    try:
+        assert rinterface.globalenv['x'].rid != x.rid
+        assert tuple(rinterface.globalenv['x']) == (1, 2, 3)
+    finally:
+        del rinterface.globalenv['x']
+
+
 def test_find_invalid_notstring():
     with pytest.raises(TypeError):
         rinterface.globalenv.find(None)
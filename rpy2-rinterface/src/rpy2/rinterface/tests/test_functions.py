@@ -159,6 +159,43 @@ def test_missing_arg():
     assert fun(missing)[0]
 
 
+def test_prepared_call():
+    fun = rinterface.baseenv['eval'](
+        rinterface.parse('function(x, y=2) { if (missing(x)) NA else x - y }')
+    )
+    call = fun.prepare(None, 'y')
+    assert len(call) == 2
+    assert call.names == (None, 'y')
+    assert call.call.typeof == rinterface.RTYPES.LANGSXP
+    assert call(10, 3)[0] == 7
+    assert call(20, 5)[0] == 15
+    call['y'] = 1
+    assert call()[0] == 19
+    call[0] = rinterface.IntSexpVector([5])
+    assert call()[0] == 4
+
+
+def test_prepared_call_missing():
+    fun = rinterface.baseenv['eval'](
+        rinterface.parse('function(x, y=2) { missing(x) }')
+    )
+    call = fun.prepare('x')
+    assert call()[0]
+    assert not call(1)[0]
+
+
+def test_prepared_call_errors():
+    call = rinterface.baseenv['sum'].prepare(None, None)
+    with pytest.raises(ValueError):
+        call(1)
+    with pytest.raises(KeyError):
+        call['foo'] = 1
+    with pytest.raises(IndexError):
+        call[2] = 1
+    with pytest.raises(rinterface.embedded.RRuntimeError):
+        call(2, 'a')
+
+
 def test_scalar_convert_integer():
     assert 'integer' == rinterface.baseenv['typeof'](int(1))[0]
 
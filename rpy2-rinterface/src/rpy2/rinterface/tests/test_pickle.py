@@ -0,0 +1,100 @@
+import pickle
+import pytest
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import sexp
+
+ri.initr()
+
+identical = ri.baseenv['identical']
+
+
+@pytest.mark.parametrize(
+    'cls,values',
+    ((ri.BoolSexpVector, (True, False, ri.NA_Logical)),
+     (ri.IntSexpVector, (1, 2, ri.NA_Integer)),
+     (ri.FloatSexpVector, (1.1, 2.2, ri.NA_Real)),
+     (ri.ComplexSexpVector, (1+2j, 3+4j)),
+     (ri.ByteSexpVector, b'abc'))
+)
+@pytest.mark.parametrize('protocol', (2, 4, 5))
+def test_pickle_vector(cls, values, protocol):
+    v = cls(values)
+    assert sexp._native_payload(v, protocol) is not None
+    v_again = pickle.loads(pickle.dumps(v, protocol=protocol))
+    assert type(v_again) is cls
+    assert identical(v, v_again)[0]
+
+
+def test_pickle_vector_empty():
+    v = ri.FloatSexpVector([])
+    v_again = pickle.loads(pickle.dumps(v, protocol=5))
+    assert identical(v, v_again)[0]
+
+
+def test_pickle_matrix():
+    m = ri.baseenv['matrix'](ri.IntSexpVector(range(6)), nrow=2)
+    m_again = pickle.loads(pickle.dumps(m))
+    assert tuple(m_again.do_slot('dim')) == (2, 3)
+    assert identical(m, m_again)[0]
+
+
+def test_pickle_out_of_band():
+    v = ri.FloatSexpVector(range(1000))
+    buffers = []
+    data = pickle.dumps(v, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert buffers[0].raw().nbytes == 1000 * 8
+    # The vector is not in the pickled data.
+    assert len(data) < 1000
+    v_again = pickle.loads(data, buffers=buffers)
+    assert identical(v, v_again)[0]
+
+
+def test_pickle_dataframe():
+    df = ri.evalr(
+        'data.frame(x = c(1.5, 2.5), '
+        'y = factor(c("a", "b")), '
+        'z = c("foo", NA), '
+        'stringsAsFactors = FALSE)'
+    )
+    assert sexp._native_payload(df, 5) is not None
+    buffers = []
+    data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    df_again = pickle.loads(data, buffers=buffers)
+    assert type(df_again) is type(df)
+    assert identical(df, df_again)[0]
+
+
+@pytest.mark.parametrize(
+    'rcode',
+    ('list(1, "a")',
+     'function(x) x',
+     'new.env()',
+     'c("a", "b")',
+     'data.frame(x = I(list(1, 2)))')
+)
+def test_pickle_fallback(rcode):
+    x = ri.evalr(rcode)
+    assert sexp._native_payload(x, 5) is None
+    x_again = pickle.loads(pickle.dumps(x, protocol=5))
+    assert ri.baseenv['all.equal'](x, x_again)[0] is True
+
+
+def test_pickle_fallback_s4():
+    x = ri.evalr(
+        'setClass("Rpy2PickleTest", representation(x = "numeric")); '
+        'new("Rpy2PickleTest", x = 1)'
+    )
+    assert sexp._native_payload(x, 5) is None
+    x_again = pickle.loads(pickle.dumps(x))
+    assert identical(x, x_again)[0]
+
+
+def test_unpickle_invalid_version():
+    with pytest.raises(ValueError):
+        sexp._from_native_payload(
+            ri.IntSexpVector,
+            (sexp._NATIVE_PAYLOAD_VERSION + 1, ri.RTYPES.INTSXP, 0, None,
+             b'')
+        )
@@ -150,6 +150,33 @@ def test___sexp__():
     assert d.get(sexp2_rid) is None
 
 
+def test_preserved_info():
+    info = rinterface._rinterface.preserved_info()
+    assert info.objects == len(rinterface._rinterface.protected_rids())
+    assert info.objects + info.free_slots == info.slots
+    n = 10000
+    sexps = [rinterface.IntSexpVector([i]) for i in range(n)]
+    info_more = rinterface._rinterface.preserved_info()
+    assert info_more.objects >= info.objects + n
+    assert info_more.objects + info_more.free_slots == info_more.slots
+    del sexps
+    gc.collect()
+    info_less = rinterface._rinterface.preserved_info()
+    assert info_less.objects <= info_more.objects - n
+    assert info_less.slots == info_more.slots
+
+
+def test_preserved_slot_reuse():
+    sexps = [rinterface.IntSexpVector([i]) for i in range(10000)]
+    del sexps
+    gc.collect()
+    slots = rinterface._rinterface.preserved_info().slots
+    # Released slots are used again.
+    sexps = [rinterface.IntSexpVector([i]) for i in range(10000)]
+    assert rinterface._rinterface.preserved_info().slots == slots
+    assert tuple(sexps[-1]) == (9999, )
+
+
 def test_rclass_get():
     sexp = rinterface.baseenv.find('character')(1)
     assert len(sexp.rclass) == 1
@@ -178,6 +205,20 @@ def test_rclass_get_sym():
     assert tuple(fit[9].rclass) == ('call', )
 
 
+def test_rclass_key():
+    rclass_key = rinterface.sexp.rclass_key
+    x = rinterface.IntSexpVector([1, 2, 3])
+    y = rinterface.IntSexpVector([4])
+    assert rclass_key(x.__sexp__) == rclass_key(y.__sexp__)
+    assert rclass_key(x.__sexp__)[1:] == ('integer', )
+    x.rclass = rinterface.StrSexpVector(['foo', 'bar'])
+    assert rclass_key(x.__sexp__) != rclass_key(y.__sexp__)
+    y.rclass = rinterface.StrSexpVector(['foo', 'bar'])
+    assert rclass_key(x.__sexp__) == rclass_key(y.__sexp__)
+    y.rclass = rinterface.StrSexpVector(['foo', 'baz'])
+    assert rclass_key(x.__sexp__) != rclass_key(y.__sexp__)
+
+
 def test_rclass_set():
     sexp = rinterface.IntSexpVector([1, 2, 3])
     sexp.rclass = rinterface.StrSexpVector(['foo'])
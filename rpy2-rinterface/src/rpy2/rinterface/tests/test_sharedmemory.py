@@ -0,0 +1,112 @@
+import io
+import pickle
+import pytest
+import rpy2.rinterface as ri
+from rpy2.rinterface_lib import sharedmemory
+
+ri.initr()
+
+
+@pytest.mark.parametrize(
+    'cls,values',
+    ((ri.BoolSexpVector, (True, False, ri.NA_Logical)),
+     (ri.IntSexpVector, (1, 2, ri.NA_Integer)),
+     (ri.FloatSexpVector, (1.1, 2.2, ri.NA_Real)),
+     (ri.ComplexSexpVector, (1+2j, 3+4j)),
+     (ri.ByteSexpVector, b'abc'))
+)
+@pytest.mark.parametrize('copy', (True, False))
+def test_to_shared(cls, values, copy):
+    v = cls(values)
+    handle = sharedmemory.to_shared(v)
+    assert handle.length == len(v)
+    handle = pickle.loads(pickle.dumps(handle))
+    v_again = handle.to_sexp(copy=copy)
+    assert type(v_again) is cls
+    assert ri.baseenv['identical'](v, v_again)[0]
+
+
+def test_to_shared_attributes():
+    v = ri.IntSexpVector((1, 2, 3, 4))
+    v.do_slot_assign('dim', ri.IntSexpVector((2, 2)))
+    v.do_slot_assign('foo', ri.StrSexpVector(('bar', )))
+    v_again = sharedmemory.to_shared(v).to_sexp()
+    assert tuple(v_again.do_slot('dim')) == (2, 2)
+    assert tuple(v_again.do_slot('foo')) == ('bar', )
+
+
+def test_to_shared_empty():
+    v = ri.FloatSexpVector([])
+    v_again = sharedmemory.to_shared(v).to_sexp()
+    assert len(v_again) == 0
+
+
+def test_to_shared_invalid():
+    with pytest.raises(ValueError):
+        sharedmemory.to_shared(ri.StrSexpVector(('a', )))
+
+
+def test_to_sexp_unlink():
+    handle = sharedmemory.to_shared(ri.IntSexpVector((1, 2)))
+    handle.to_sexp(unlink=False)
+    assert tuple(handle.to_sexp()) == (1, 2)
+    with pytest.raises(FileNotFoundError):
+        handle.to_sexp()
+
+
+def test_unlink():
+    handle = sharedmemory.to_shared(ri.IntSexpVector((1, 2)))
+    handle.unlink()
+    with pytest.raises(FileNotFoundError):
+        handle.to_sexp()
+
+
+def test_dumps():
+    v = ri.FloatSexpVector((1.1, 2.2, 3.3))
+    s = ri.StrSexpVector(('a', 'b'))
+    data, handles = sharedmemory.dumps((v, s))
+    assert len(handles) == 1
+    v_again, s_again = pickle.loads(data)
+    assert tuple(v_again) == tuple(v)
+    assert tuple(s_again) == tuple(s)
+    # The segments are removed once loaded.
+    with pytest.raises(FileNotFoundError):
+        pickle.loads(data)
+    sharedmemory.unlink(handles)
+
+
+def test_dumps_not_loaded():
+    data, handles = sharedmemory.dumps(ri.IntSexpVector((1, 2)))
+    sharedmemory.unlink(handles)
+    with pytest.raises(FileNotFoundError):
+        pickle.loads(data)
+
+
+def test_dumps_error(monkeypatch):
+    class Unpicklable(object):
+        def __reduce__(self):
+            raise TypeError('Cannot pickle this.')
+
+    unlinked = []
+    unlink = sharedmemory.unlink
+
+    def unlink_recorded(handles):
+        unlinked.extend(handles)
+        unlink(handles)
+
+    monkeypatch.setattr(sharedmemory, 'unlink', unlink_recorded)
+    with pytest.raises(TypeError):
+        sharedmemory.dumps((ri.IntSexpVector((1, 2)), Unpicklable()))
+    # The segments created before the error are removed.
+    assert len(unlinked) == 1
+    with pytest.raises(FileNotFoundError):
+        unlinked[0].to_sexp()
+
+
+def test_dumps_min_nbytes():
+    v = ri.FloatSexpVector((1.1, 2.2, 3.3))
+    f = io.BytesIO()
+    pickler = sharedmemory.SharedMemoryPickler(f, min_nbytes=1024)
+    pickler.dump(v)
+    assert pickler.handles == []
+    assert tuple(pickle.loads(f.getvalue())) == tuple(v)
@@ -0,0 +1,90 @@
+import os
+import pytest
+import rpy2.situation
+
+
+@pytest.fixture
+def fake_r(tmp_path, monkeypatch):
+    """An R HOME with an R executable, and R subprocesses stubbed."""
+    r_home = tmp_path / 'R'
+    (r_home / 'bin').mkdir(parents=True)
+    r_exec = r_home / 'bin' / ('R.exe' if os.name == 'nt' else 'R')
+    r_exec.write_text('')
+    monkeypatch.setenv('R_HOME', str(r_home))
+    monkeypatch.setenv(rpy2.situation.ENVVAR_STARTUP_SNAPSHOT,
+                       str(tmp_path / 'snapshot.json'))
+    monkeypatch.setenv('FOO', 'foo')
+    monkeypatch.setattr(rpy2.situation, 'r_ld_library_path_from_subprocess',
+                        lambda r_home: '/r/lib')
+    monkeypatch.setattr(
+        rpy2.situation, 'r_envvars_from_subprocess',
+        lambda r_home, baselinevars: tuple(
+            (k, v) for k, v in (('R_HOME', r_home),
+                                ('R_SHARE_DIR', 'share'),
+                                ('FOO', 'foo'))
+            if baselinevars.get(k) != v
+        )
+    )
+    monkeypatch.setattr(rpy2.situation, '_SNAPSHOTS', {})
+    return str(r_home), str(r_exec)
+
+
+def test_get_startup_snapshot_path_disabled(monkeypatch):
+    monkeypatch.setenv(rpy2.situation.ENVVAR_STARTUP_SNAPSHOT, '')
+    assert rpy2.situation.get_startup_snapshot_path() is None
+    assert rpy2.situation.read_startup_snapshot() is None
+
+
+def test_startup_snapshot(fake_r):
+    r_home, r_exec = fake_r
+    assert rpy2.situation.get_startup_snapshot(r_home) is None
+    snapshot = rpy2.situation.write_startup_snapshot()
+    assert snapshot['r_home'] == r_home
+    assert rpy2.situation.get_startup_snapshot(r_home) == snapshot
+    assert rpy2.situation.get_r_ld_library_path(r_home) == '/r/lib'
+    assert (rpy2.situation.get_r_envvars(r_home, {})
+            == (('R_HOME', r_home), ('R_SHARE_DIR', 'share')))
+    assert (rpy2.situation.get_r_envvars(r_home, {'R_HOME': r_home})
+            == (('R_SHARE_DIR', 'share'), ))
+
+
+def test_startup_snapshot_invalid(fake_r):
+    r_home, r_exec = fake_r
+    rpy2.situation.write_startup_snapshot()
+    st = os.stat(r_exec)
+    os.utime(r_exec, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert rpy2.situation.get_startup_snapshot(r_home) is None
+    assert rpy2.situation.get_startup_snapshot(r_home + 'x') is None
+    # R_HOME was not obtained from the R in the PATH.
+    assert rpy2.situation.get_startup_snapshot() is None
+
+
+@pytest.mark.parametrize(
+    'name,value',
+    (('R_LIBS_USER', '/foo'),
+     ('LD_LIBRARY_PATH', '/foo'),
+     ('HOME', '/foo'))
+)
+def test_startup_snapshot_invalid_environ(fake_r, monkeypatch, name, value):
+    r_home, r_exec = fake_r
+    rpy2.situation.write_startup_snapshot()
+    assert rpy2.situation.get_startup_snapshot(r_home) is not None
+    monkeypatch.setenv(name, value)
+    assert rpy2.situation.get_startup_snapshot(r_home) is None
+
+
+def test_startup_snapshot_invalid_renviron(fake_r, tmp_path, monkeypatch):
+    r_home, r_exec = fake_r
+    monkeypatch.chdir(tmp_path)
+    rpy2.situation.write_startup_snapshot()
+    (tmp_path / '.Renviron').write_text('R_FOO=foo\n')
+    assert rpy2.situation.get_startup_snapshot(r_home) is None
+
+
+def test_startup_timings(monkeypatch):
+    monkeypatch.setattr(rpy2.situation, '_STARTUP_TIMINGS', {})
+    with rpy2.situation._startup_phase('foo'):
+        pass
+    timings = rpy2.situation.get_startup_timings()
+    assert tuple(timings.keys()) == ('foo', )
+    assert timings['foo'] >= 0
@@ -13,6 +13,11 @@ def test_init_from_seqr():
         assert x == y
 
 
+def test_init_from_seq_int_na():
+    v = ri.BoolSexpVector([2, 0, ri.NA_Logical, None])
+    assert tuple(v) == (True, False, ri.NA_Logical, ri.NA_Logical)
+
+
 def test_from_int_memoryview():
     a = array.array('i', (True, False, True))
     mv = memoryview(a)
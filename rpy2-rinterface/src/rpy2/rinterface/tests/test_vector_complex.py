@@ -59,6 +59,19 @@ def test_setslice_negative():
     assert vec[1] == 100+3j
 
 
+def test_getslice_step():
+    values = [1+2j, 5+7j, 0+1j, 3-1j]
+    vec = ri.ComplexSexpVector(values)
+    assert tuple(vec[::-2]) == tuple(values[::-2])
+
+
+def test_setslice_step():
+    values = [1+2j, 5+7j, 0+1j, 3-1j]
+    vec = ri.ComplexSexpVector(values)
+    vec[1::2] = [10j, 20j]
+    assert tuple(vec) == (1+2j, 10j, 0+1j, 20j)
+
+
 def test_index():
     vec = ri.ComplexSexpVector([1+2j, 5+7j, 0+1j])
     assert vec.index(5+7j) == 1
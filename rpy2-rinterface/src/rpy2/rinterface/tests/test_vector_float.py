@@ -1,9 +1,15 @@
 import array
 import pytest
 import rpy2.rinterface as ri
+from rpy2.rinterface_lib import ffi_proxy
+from rpy2.rinterface_lib import openrlib
 
 ri.initr()
 
+IS_API_MODE = (ffi_proxy.get_ffi_mode(openrlib._rinterface_cffi)
+               ==
+               ffi_proxy.InterfaceType.API)
+
 
 def test_init_from_seq():
     seq = (1.0, 2.0, 3.0)
@@ -48,6 +54,41 @@ def test_from_long_memoryview():
         ri.FloatSexpVector.from_memoryview(mv)
 
 
+@pytest.mark.skipif(not IS_API_MODE,
+                    reason='ALTREP vectors require the API mode.')
+def test_from_buffer_view():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    vec = ri.FloatSexpVector.from_buffer_view(a)
+    assert tuple(vec) == (1.0, 2.0, 3.0)
+    assert ri.baseenv['sum'](vec)[0] == 6.0
+    a[0] = 10.0
+    assert vec[0] == 10.0
+
+
+@pytest.mark.skipif(not IS_API_MODE,
+                    reason='ALTREP vectors require the API mode.')
+def test_from_buffer_view_copy_on_write():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    vec = ri.FloatSexpVector.from_buffer_view(a)
+    vec[0] = 10.0
+    assert tuple(vec) == (10.0, 2.0, 3.0)
+    assert tuple(a) == (1.0, 2.0, 3.0)
+
+
+def test_from_buffer_view_invalid():
+    a = array.array('i', range(3))
+    with pytest.raises(ValueError):
+        ri.FloatSexpVector.from_buffer_view(a)
+
+
+@pytest.mark.skipif(IS_API_MODE,
+                    reason='ALTREP vectors are available in the API mode.')
+def test_from_buffer_view_abi():
+    a = array.array('d', (1.0, 2.0, 3.0))
+    with pytest.raises(NotImplementedError):
+        ri.FloatSexpVector.from_buffer_view(a)
+
+
 def test_getitem():
     vec = ri.FloatSexpVector([1.0, 2.0, 3.0])
     assert vec[1] == 2.0
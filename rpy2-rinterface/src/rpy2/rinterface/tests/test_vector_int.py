@@ -27,6 +27,14 @@ def test_init_from_seq_invalid_item():
         ri.IntSexpVector(seq)
 
 
+def test_init_from_seq_na():
+    v = ri.IntSexpVector([1, ri.NA_Integer, float('nan'), 2.0])
+    assert v[0] == 1
+    assert v[1] is ri.NA_Integer
+    assert v[2] is ri.NA_Integer
+    assert v[3] == 2
+
+
 @pytest.mark.skip(reason='WIP')
 @pytest.mark.skipif(struct.calcsize('P') < 8,
                     reason='Only relevant on 64 architectures.')
@@ -115,6 +123,40 @@ def test_setslice_negative():
     assert vec[1] == 33
 
 
+@pytest.mark.parametrize(
+    'i',
+    (slice(None, None, 2), slice(None, None, -1), slice(7, 1, -3),
+     slice(2, 2), slice(1, None)))
+def test_getslice_step(i):
+    values = list(range(10))
+    vec = ri.IntSexpVector(values)
+    assert tuple(vec[i]) == tuple(values[i])
+
+
+@pytest.mark.parametrize(
+    'i',
+    (slice(None, None, 2), slice(None, None, -1), slice(7, 1, -3),
+     slice(1, None)))
+def test_setslice_step(i):
+    values = list(range(10))
+    vec = ri.IntSexpVector(values)
+    new_values = [-x for x in values[i]]
+    vec[i] = new_values
+    values[i] = new_values
+    assert tuple(vec) == tuple(values)
+    vec[i] = ri.IntSexpVector([x * 2 for x in new_values])
+    values[i] = [x * 2 for x in new_values]
+    assert tuple(vec) == tuple(values)
+
+
+def test_setslice_overlap():
+    vec = ri.IntSexpVector([1, 2, 3, 4])
+    vec[1:] = vec[:3]
+    assert tuple(vec) == (1, 1, 2, 3)
+    vec[::2] = vec[1::2]
+    assert tuple(vec) == (1, 1, 3, 3)
+
+
 def test_index():
     x = ri.IntSexpVector((1, 2, 3))
     assert x.index(1) == 0
@@ -1,3 +1,5 @@
+import array
+import sys
 import pytest
 import rpy2.rinterface as ri
 
@@ -18,6 +20,18 @@ def test_init_from_seq_invalid_item():
         ri.StrSexpVector(seq)
 
 
+def test_init_from_seq_na():
+    seq = ['foo', None, ri.NA_Character, '\u21a7']
+    v = ri.StrSexpVector(seq)
+    assert tuple(v) == ('foo', ri.NA_Character, ri.NA_Character, '\u21a7')
+
+
+def test_init_from_seq_charsxp():
+    charsxp = ri.StrSexpVector(['bar']).get_charsxp(0)
+    v = ri.StrSexpVector(['foo', charsxp])
+    assert tuple(v) == ('foo', 'bar')
+
+
 def test_getitem():
     vec = ri.StrSexpVector(['foo', 'bar', 'baz'])
     assert vec[1] == 'bar'
@@ -50,6 +64,19 @@ def test_getslice_negative():
     assert vec_s[0] == 'bar'
 
 
+def test_getslice_na_non_ascii():
+    vec = ri.StrSexpVector(['foo', None, '\u21a7', 'baz'])
+    vec_s = vec[1:3]
+    assert tuple(vec_s) == (ri.NA_Character, '\u21a7')
+
+
+def test_iter_chunks(monkeypatch):
+    monkeypatch.setattr(ri.StrSexpVector, '_ITER_CHUNKSIZE', 2)
+    seq = ['a', None, '\u21a7', 'b', 'c']
+    vec = ri.StrSexpVector(seq)
+    assert tuple(vec) == ('a', ri.NA_Character, '\u21a7', 'b', 'c')
+
+
 def test_setslice():
     vec = ri.StrSexpVector(['foo', 'bar', 'baz'])
     vec[0:2] = ['boo', 'noo']
@@ -90,3 +117,50 @@ def test_non_asciil():
     sexp = ri.evalr('c("ěščřžýáíé", "abc", "百折不撓")')
     assert all(isinstance(x, str) for x in sexp)
     
+
+def test_from_memoryview_ucs4():
+    numpy = pytest.importorskip('numpy')
+    a = numpy.array(['foo', '↧', ''])
+    v = ri.StrSexpVector.from_memoryview(memoryview(a))
+    assert tuple(v) == ('foo', '↧', '')
+
+
+def test_from_memoryview_ucs4_invalid():
+    numpy = pytest.importorskip('numpy')
+    a = numpy.array(['foo', 'b\x00r'])
+    with pytest.raises(ValueError):
+        ri.StrSexpVector.from_memoryview(memoryview(a))
+    with pytest.raises(ValueError):
+        ri.StrSexpVector.from_memoryview(memoryview(b'abc'))
+
+
+def test_from_utf8_buffer():
+    buf = 'foo↧bar'.encode('utf-8')
+    lengths = array.array('i', [3, -1, 3, 3, 0])
+    v = ri.StrSexpVector.from_utf8_buffer(buf, lengths)
+    assert tuple(v) == ('foo', ri.NA_Character, '↧', 'bar', '')
+
+
+@pytest.mark.parametrize(
+    'buf,lengths',
+    ((b'foo', [4]),
+     (b'f\x00o', [3]))
+)
+def test_from_utf8_buffer_invalid(buf, lengths):
+    with pytest.raises(ValueError):
+        ri.StrSexpVector.from_utf8_buffer(buf, array.array('i', lengths))
+
+
+def test_to_ucs4_buffer():
+    v = ri.StrSexpVector(['foo', '↧', ''])
+    buf, width = v.to_ucs4_buffer()
+    assert width == 3
+    assert bytes(buf) == ''.join(
+        x.ljust(width, '\x00') for x in v
+    ).encode('utf-32-le' if sys.byteorder == 'little' else 'utf-32-be')
+
+
+def test_to_ucs4_buffer_na():
+    v = ri.StrSexpVector(['foo', None])
+    with pytest.raises(ValueError):
+        v.to_ucs4_buffer()
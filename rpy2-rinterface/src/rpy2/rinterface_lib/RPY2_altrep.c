@@ -0,0 +1,206 @@
+/* ALTREP vectors backed by a buffer not managed by R.
+
+   This source is appended to the one for the cffi API mode, after
+   the R API declarations, and the functions are declared for cffi
+   in RPY2_altrep.h.
+
+   The vectors are read-only views: data1 is an external pointer with
+   the address of the buffer, and a length (a double scalar) as its
+   tag. data2 is R_NilValue until R requests a writeable pointer to
+   the data, at which point the content of the buffer is copied into
+   a regular R vector stored in data2 and used from then on. */
+
+# include <string.h>
+
+/* Subset of include/R_ext/Altrep.h */
+typedef struct { SEXP ptr; } R_altrep_class_t;
+
+R_altrep_class_t R_make_altreal_class(const char *cname, const char *pname,
+                                      DllInfo *info);
+R_altrep_class_t R_make_altinteger_class(const char *cname,
+                                         const char *pname, DllInfo *info);
+R_altrep_class_t R_make_altlogical_class(const char *cname,
+                                         const char *pname, DllInfo *info);
+R_altrep_class_t R_make_altraw_class(const char *cname, const char *pname,
+                                     DllInfo *info);
+SEXP R_new_altrep(R_altrep_class_t aclass, SEXP data1, SEXP data2);
+SEXP R_altrep_data1(SEXP x);
+SEXP R_altrep_data2(SEXP x);
+void R_set_altrep_data2(SEXP x, SEXP v);
+
+void R_set_altrep_Length_method(R_altrep_class_t cls,
+                                R_xlen_t (*fun)(SEXP));
+void R_set_altvec_Dataptr_method(R_altrep_class_t cls,
+                                 void *(*fun)(SEXP, Rboolean));
+void R_set_altvec_Dataptr_or_null_method(R_altrep_class_t cls,
+                                         const void *(*fun)(SEXP));
+void R_set_altreal_Elt_method(R_altrep_class_t cls,
+                              double (*fun)(SEXP, R_xlen_t));
+void R_set_altreal_Get_region_method(
+    R_altrep_class_t cls, R_xlen_t (*fun)(SEXP, R_xlen_t, R_xlen_t, double *));
+void R_set_altinteger_Elt_method(R_altrep_class_t cls,
+                                 int (*fun)(SEXP, R_xlen_t));
+void R_set_altinteger_Get_region_method(
+    R_altrep_class_t cls, R_xlen_t (*fun)(SEXP, R_xlen_t, R_xlen_t, int *));
+void R_set_altlogical_Elt_method(R_altrep_class_t cls,
+                                 int (*fun)(SEXP, R_xlen_t));
+void R_set_altlogical_Get_region_method(
+    R_altrep_class_t cls, R_xlen_t (*fun)(SEXP, R_xlen_t, R_xlen_t, int *));
+void R_set_altraw_Elt_method(R_altrep_class_t cls,
+                             Rbyte (*fun)(SEXP, R_xlen_t));
+void R_set_altraw_Get_region_method(
+    R_altrep_class_t cls, R_xlen_t (*fun)(SEXP, R_xlen_t, R_xlen_t, Rbyte *));
+
+/* Subset of include/Rinternals.h not in R_API.h */
+int (TYPEOF)(SEXP x);
+SEXP R_ExternalPtrTag(SEXP s);
+
+static R_altrep_class_t rpy2_altreal_buffer_class;
+static R_altrep_class_t rpy2_altinteger_buffer_class;
+static R_altrep_class_t rpy2_altlogical_buffer_class;
+static R_altrep_class_t rpy2_altraw_buffer_class;
+static int rpy2_altrep_initialized = 0;
+
+static size_t rpy2_altrep_eltsize(SEXP x) {
+  SEXPTYPE type = TYPEOF(x);
+  if (type == REALSXP) {
+    return sizeof(double);
+  } else if (type == INTSXP || type == LGLSXP) {
+    return sizeof(int);
+  } else {
+    return sizeof(Rbyte);
+  }
+}
+
+static R_xlen_t rpy2_altrep_Length(SEXP x) {
+  return (R_xlen_t) REAL(R_ExternalPtrTag(R_altrep_data1(x)))[0];
+}
+
+static const void *rpy2_altrep_Dataptr_or_null(SEXP x) {
+  SEXP data2 = R_altrep_data2(x);
+  if (data2 != R_NilValue) {
+    return DATAPTR(data2);
+  }
+  return R_ExternalPtrAddr(R_altrep_data1(x));
+}
+
+static void *rpy2_altrep_Dataptr(SEXP x, Rboolean writeable) {
+  if (writeable && R_altrep_data2(x) == R_NilValue) {
+    R_xlen_t n = rpy2_altrep_Length(x);
+    SEXP data2 = Rf_protect(Rf_allocVector(TYPEOF(x), n));
+    memcpy(DATAPTR(data2), R_ExternalPtrAddr(R_altrep_data1(x)),
+           n * rpy2_altrep_eltsize(x));
+    R_set_altrep_data2(x, data2);
+    Rf_unprotect(1);
+  }
+  return (void *) rpy2_altrep_Dataptr_or_null(x);
+}
+
+static R_xlen_t rpy2_altrep_copy_region(SEXP x, R_xlen_t i, R_xlen_t n,
+                                        void *buf) {
+  R_xlen_t length = rpy2_altrep_Length(x);
+  size_t eltsize = rpy2_altrep_eltsize(x);
+  R_xlen_t ncopy = (length - i) < n ? (length - i) : n;
+  if (ncopy <= 0) {
+    return 0;
+  }
+  memcpy(buf, (const char *) rpy2_altrep_Dataptr_or_null(x) + i * eltsize,
+         ncopy * eltsize);
+  return ncopy;
+}
+
+static double rpy2_altreal_Elt(SEXP x, R_xlen_t i) {
+  return ((const double *) rpy2_altrep_Dataptr_or_null(x))[i];
+}
+
+static R_xlen_t rpy2_altreal_Get_region(SEXP x, R_xlen_t i, R_xlen_t n,
+                                        double *buf) {
+  return rpy2_altrep_copy_region(x, i, n, buf);
+}
+
+static int rpy2_altinteger_Elt(SEXP x, R_xlen_t i) {
+  return ((const int *) rpy2_altrep_Dataptr_or_null(x))[i];
+}
+
+static R_xlen_t rpy2_altinteger_Get_region(SEXP x, R_xlen_t i, R_xlen_t n,
+                                           int *buf) {
+  return rpy2_altrep_copy_region(x, i, n, buf);
+}
+
+static Rbyte rpy2_altraw_Elt(SEXP x, R_xlen_t i) {
+  return ((const Rbyte *) rpy2_altrep_Dataptr_or_null(x))[i];
+}
+
+static R_xlen_t rpy2_altraw_Get_region(SEXP x, R_xlen_t i, R_xlen_t n,
+                                       Rbyte *buf) {
+  return rpy2_altrep_copy_region(x, i, n, buf);
+}
+
+static void rpy2_altrep_set_common_methods(R_altrep_class_t cls) {
+  R_set_altrep_Length_method(cls, rpy2_altrep_Length);
+  R_set_altvec_Dataptr_method(cls, rpy2_altrep_Dataptr);
+  R_set_altvec_Dataptr_or_null_method(cls, rpy2_altrep_Dataptr_or_null);
+}
+
+static void rpy2_altrep_init(DllInfo *dll) {
+  rpy2_altreal_buffer_class = R_make_altreal_class(
+      "rpy2_buffer_real", "rpy2", dll);
+  rpy2_altrep_set_common_methods(rpy2_altreal_buffer_class);
+  R_set_altreal_Elt_method(rpy2_altreal_buffer_class, rpy2_altreal_Elt);
+  R_set_altreal_Get_region_method(rpy2_altreal_buffer_class,
+                                  rpy2_altreal_Get_region);
+
+  rpy2_altinteger_buffer_class = R_make_altinteger_class(
+      "rpy2_buffer_integer", "rpy2", dll);
+  rpy2_altrep_set_common_methods(rpy2_altinteger_buffer_class);
+  R_set_altinteger_Elt_method(rpy2_altinteger_buffer_class,
+                              rpy2_altinteger_Elt);
+  R_set_altinteger_Get_region_method(rpy2_altinteger_buffer_class,
+                                     rpy2_altinteger_Get_region);
+
+  rpy2_altlogical_buffer_class = R_make_altlogical_class(
+      "rpy2_buffer_logical", "rpy2", dll);
+  rpy2_altrep_set_common_methods(rpy2_altlogical_buffer_class);
+  R_set_altlogical_Elt_method(rpy2_altlogical_buffer_class,
+                              rpy2_altinteger_Elt);
+  R_set_altlogical_Get_region_method(rpy2_altlogical_buffer_class,
+                                     rpy2_altinteger_Get_region);
+
+  rpy2_altraw_buffer_class = R_make_altraw_class(
+      "rpy2_buffer_raw", "rpy2", dll);
+  rpy2_altrep_set_common_methods(rpy2_altraw_buffer_class);
+  R_set_altraw_Elt_method(rpy2_altraw_buffer_class, rpy2_altraw_Elt);
+  R_set_altraw_Get_region_method(rpy2_altraw_buffer_class,
+                                 rpy2_altraw_Get_region);
+  rpy2_altrep_initialized = 1;
+}
+
+/* Create an R vector of type REALSXP, INTSXP, LGLSXP, or RAWSXP with
+   the n items in buf as its content. The buffer must remain valid
+   until finalizer is called with the external pointer in data1 as
+   its argument. The returned vector is not protected. */
+SEXP rpy2_altrep_from_buffer(SEXPTYPE type, void *buf, R_xlen_t n,
+                             R_CFinalizer_t finalizer) {
+  R_altrep_class_t cls;
+  if (!rpy2_altrep_initialized) {
+    rpy2_altrep_init(R_getEmbeddingDllInfo());
+  }
+  if (type == REALSXP) {
+    cls = rpy2_altreal_buffer_class;
+  } else if (type == INTSXP) {
+    cls = rpy2_altinteger_buffer_class;
+  } else if (type == LGLSXP) {
+    cls = rpy2_altlogical_buffer_class;
+  } else if (type == RAWSXP) {
+    cls = rpy2_altraw_buffer_class;
+  } else {
+    return R_NilValue;
+  }
+  SEXP length = Rf_protect(Rf_ScalarReal((double) n));
+  SEXP data1 = Rf_protect(R_MakeExternalPtr((DL_FUNC) buf, length,
+                                            R_NilValue));
+  R_RegisterCFinalizer(data1, finalizer);
+  SEXP res = R_new_altrep(cls, data1, R_NilValue);
+  Rf_unprotect(2);
+  return res;
+}
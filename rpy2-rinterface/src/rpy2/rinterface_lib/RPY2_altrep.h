@@ -0,0 +1,5 @@
+/* ALTREP vectors backed by a buffer not managed by R. */
+
+SEXP rpy2_altrep_from_buffer(SEXPTYPE type, void *buf, R_xlen_t n,
+                             R_CFinalizer_t finalizer);
+SEXP R_altrep_data1(SEXP x);
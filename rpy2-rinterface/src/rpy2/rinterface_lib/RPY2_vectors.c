@@ -0,0 +1,266 @@
+/* Bulk population of R vectors from C arrays.
+
+   This source is appended to the one for the cffi API mode, after
+   the R API declarations, and the functions are declared for cffi
+   in RPY2_vectors.h. The R vector x must be allocated with a length
+   of at least n. */
+
+# include <stdint.h>
+# include <string.h>
+
+/* Anything that is neither NA nor 0 is TRUE. */
+void rpy2_fill_logical(SEXP x, const int *src, R_xlen_t n) {
+  int *dest = LOGICAL(x);
+  for (R_xlen_t i = 0; i < n; i++) {
+    dest[i] = (src[i] == R_NaInt) ? R_NaInt : (src[i] != 0);
+  }
+}
+
+void rpy2_fill_integer(SEXP x, const int *src, R_xlen_t n) {
+  memcpy(INTEGER(x), src, n * sizeof(int));
+}
+
+void rpy2_fill_real(SEXP x, const double *src, R_xlen_t n) {
+  memcpy(REAL(x), src, n * sizeof(double));
+}
+
+/* src contains n (real, imaginary) pairs. */
+void rpy2_fill_complex(SEXP x, const double *src, R_xlen_t n) {
+  Rcomplex *dest = COMPLEX(x);
+  for (R_xlen_t i = 0; i < n; i++) {
+    dest[i].r = src[2 * i];
+    dest[i].i = src[2 * i + 1];
+  }
+}
+
+void rpy2_fill_raw(SEXP x, const Rbyte *src, R_xlen_t n) {
+  memcpy(RAW(x), src, n * sizeof(Rbyte));
+}
+
+/* buf contains the n strings concatenated, with lengths[i] the number
+   of bytes for the i-th string. A negative length is an NA. If charsxps
+   is not NULL, a non-NULL charsxps[i] is used as the i-th string and
+   lengths[i] is ignored (and must be 0). */
+void rpy2_fill_string(SEXP x, const char *buf, const int *lengths,
+                      SEXP *charsxps, R_xlen_t n, cetype_t encoding) {
+  const char *s = buf;
+  for (R_xlen_t i = 0; i < n; i++) {
+    if (charsxps != NULL && charsxps[i] != NULL) {
+      SET_STRING_ELT(x, i, charsxps[i]);
+    } else if (lengths[i] < 0) {
+      SET_STRING_ELT(x, i, R_NaString);
+    } else {
+      SET_STRING_ELT(x, i, Rf_mkCharLenCE(s, lengths[i], encoding));
+      s += lengths[i];
+    }
+  }
+}
+
+/* Check that concatenated strings can be used with rpy2_fill_string():
+   the strings must fit in the bufsize bytes of buf and not contain a nul.
+   The index of the first string failing this is returned, or -1. */
+R_xlen_t rpy2_check_string_buffer(const char *buf, R_xlen_t bufsize,
+                                   const int *lengths, R_xlen_t n) {
+  const char *s = buf;
+  for (R_xlen_t i = 0; i < n; i++) {
+    if (lengths[i] < 0) {
+      continue;
+    }
+    if (lengths[i] > bufsize - (s - buf) ||
+        memchr(s, 0, lengths[i]) != NULL) {
+      return i;
+    }
+    s += lengths[i];
+  }
+  return -1;
+}
+
+void *vmaxget(void);
+void vmaxset(const void *);
+char *R_alloc(size_t, int);
+
+/* Translate the strings x[start], ..., x[start + n - 1] to UTF-8 in
+   two passes. rpy2_string_utf8_lengths() sets lengths[i] to the number
+   of bytes for the translated string (-1 for an NA) and returns the
+   total. rpy2_string_utf8_copy() then concatenates the translated
+   strings into buf, allocated with at least that total. The memory
+   used by R for a translation is released after each string. */
+R_xlen_t rpy2_string_utf8_lengths(SEXP x, R_xlen_t start, R_xlen_t n,
+                                  int *lengths) {
+  R_xlen_t total = 0;
+  for (R_xlen_t i = 0; i < n; i++) {
+    SEXP elt = STRING_ELT(x, start + i);
+    if (elt == R_NaString) {
+      lengths[i] = -1;
+    } else {
+      const void *vmax = vmaxget();
+      lengths[i] = (int) strlen(Rf_translateCharUTF8(elt));
+      vmaxset(vmax);
+      total += lengths[i];
+    }
+  }
+  return total;
+}
+
+void rpy2_string_utf8_copy(SEXP x, R_xlen_t start, R_xlen_t n, char *buf) {
+  char *dest = buf;
+  for (R_xlen_t i = 0; i < n; i++) {
+    SEXP elt = STRING_ELT(x, start + i);
+    if (elt != R_NaString) {
+      const void *vmax = vmaxget();
+      const char *s = Rf_translateCharUTF8(elt);
+      size_t len = strlen(s);
+      memcpy(dest, s, len);
+      dest += len;
+      vmaxset(vmax);
+    }
+  }
+}
+
+/* Conversion between R strings and fixed-width UCS-4 strings, the
+   representation of strings in numpy arrays of kind "U". Each string
+   in a buffer is made of width code points, padded with zeros. */
+
+/* Write the UTF-8 encoding of the code point c in dest and return the
+   number of bytes, or 0 if c is not a valid code point. */
+static int rpy2_ucs4_to_utf8(uint32_t c, char *dest) {
+  if (c < 0x80) {
+    dest[0] = (char) c;
+    return 1;
+  } else if (c < 0x800) {
+    dest[0] = (char) (0xC0 | (c >> 6));
+    dest[1] = (char) (0x80 | (c & 0x3F));
+    return 2;
+  } else if (c < 0x10000) {
+    if (c >= 0xD800 && c <= 0xDFFF) {
+      return 0;
+    }
+    dest[0] = (char) (0xE0 | (c >> 12));
+    dest[1] = (char) (0x80 | ((c >> 6) & 0x3F));
+    dest[2] = (char) (0x80 | (c & 0x3F));
+    return 3;
+  } else if (c < 0x110000) {
+    dest[0] = (char) (0xF0 | (c >> 18));
+    dest[1] = (char) (0x80 | ((c >> 12) & 0x3F));
+    dest[2] = (char) (0x80 | ((c >> 6) & 0x3F));
+    dest[3] = (char) (0x80 | (c & 0x3F));
+    return 4;
+  }
+  return 0;
+}
+
+/* Decode the nul-terminated UTF-8 string s and return the number of
+   code points, or -1 if s is not valid UTF-8. The code points are
+   written in dest unless it is NULL. */
+static R_xlen_t rpy2_utf8_to_ucs4(const char *s, uint32_t *dest) {
+  const unsigned char *p = (const unsigned char *) s;
+  R_xlen_t count = 0;
+  while (*p) {
+    uint32_t c;
+    int n_cont;
+    uint32_t min_c;
+    if (*p < 0x80) {
+      c = *p;
+      n_cont = 0;
+      min_c = 0;
+    } else if ((*p & 0xE0) == 0xC0) {
+      c = *p & 0x1F;
+      n_cont = 1;
+      min_c = 0x80;
+    } else if ((*p & 0xF0) == 0xE0) {
+      c = *p & 0x0F;
+      n_cont = 2;
+      min_c = 0x800;
+    } else if ((*p & 0xF8) == 0xF0) {
+      c = *p & 0x07;
+      n_cont = 3;
+      min_c = 0x10000;
+    } else {
+      return -1;
+    }
+    p++;
+    for (int k = 0; k < n_cont; k++, p++) {
+      if ((*p & 0xC0) != 0x80) {
+        return -1;
+      }
+      c = (c << 6) | (*p & 0x3F);
+    }
+    if (c < min_c || c > 0x10FFFF || (c >= 0xD800 && c <= 0xDFFF)) {
+      return -1;
+    }
+    if (dest != NULL) {
+      dest[count] = c;
+    }
+    count++;
+  }
+  return count;
+}
+
+/* Set the n strings in buf as the items of x, encoded in UTF-8. The
+   index of the first string with an invalid code point or an embedded
+   nul is returned (x is then only filled up to that index), or -1 if
+   all strings were set. */
+R_xlen_t rpy2_fill_string_ucs4(SEXP x, const uint32_t *buf, R_xlen_t width,
+                               R_xlen_t n) {
+  R_xlen_t res = -1;
+  const void *vmax = vmaxget();
+  char *utf8 = R_alloc(4 * width + 1, sizeof(char));
+  for (R_xlen_t i = 0; i < n && res < 0; i++) {
+    const uint32_t *s = buf + i * width;
+    R_xlen_t len = width;
+    while (len > 0 && s[len - 1] == 0) {
+      len--;
+    }
+    char *dest = utf8;
+    for (R_xlen_t j = 0; j < len; j++) {
+      int n_bytes = (s[j] == 0) ? 0 : rpy2_ucs4_to_utf8(s[j], dest);
+      if (n_bytes == 0) {
+        res = i;
+        break;
+      }
+      dest += n_bytes;
+    }
+    if (res < 0) {
+      SET_STRING_ELT(x, i,
+                     Rf_mkCharLenCE(utf8, (int) (dest - utf8), CE_UTF8));
+    }
+  }
+  vmaxset(vmax);
+  return res;
+}
+
+/* Return the number of code points in the longest string of x, -1 if
+   x has an NA, or -2 if a string cannot be translated to valid UTF-8. */
+R_xlen_t rpy2_string_ucs4_width(SEXP x) {
+  R_xlen_t width = 0;
+  R_xlen_t n = Rf_xlength(x);
+  for (R_xlen_t i = 0; i < n; i++) {
+    SEXP elt = STRING_ELT(x, i);
+    if (elt == R_NaString) {
+      return -1;
+    }
+    const void *vmax = vmaxget();
+    R_xlen_t len = rpy2_utf8_to_ucs4(Rf_translateCharUTF8(elt), NULL);
+    vmaxset(vmax);
+    if (len < 0) {
+      return -2;
+    }
+    if (len > width) {
+      width = len;
+    }
+  }
+  return width;
+}
+
+/* Write the strings in x to buf, zero-initialized and with room for
+   Rf_xlength(x) strings of width code points. The strings must all have
+   been checked with rpy2_string_ucs4_width(). */
+void rpy2_string_ucs4_copy(SEXP x, uint32_t *buf, R_xlen_t width) {
+  R_xlen_t n = Rf_xlength(x);
+  for (R_xlen_t i = 0; i < n; i++) {
+    const void *vmax = vmaxget();
+    rpy2_utf8_to_ucs4(Rf_translateCharUTF8(STRING_ELT(x, i)),
+                      buf + i * width);
+    vmaxset(vmax);
+  }
+}
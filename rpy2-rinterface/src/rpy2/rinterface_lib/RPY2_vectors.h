@@ -0,0 +1,18 @@
+/* Bulk population of R vectors from C arrays. */
+
+void rpy2_fill_logical(SEXP x, const int *src, R_xlen_t n);
+void rpy2_fill_integer(SEXP x, const int *src, R_xlen_t n);
+void rpy2_fill_real(SEXP x, const double *src, R_xlen_t n);
+void rpy2_fill_complex(SEXP x, const double *src, R_xlen_t n);
+void rpy2_fill_raw(SEXP x, const Rbyte *src, R_xlen_t n);
+void rpy2_fill_string(SEXP x, const char *buf, const int *lengths,
+                      SEXP *charsxps, R_xlen_t n, cetype_t encoding);
+R_xlen_t rpy2_check_string_buffer(const char *buf, R_xlen_t bufsize,
+                                   const int *lengths, R_xlen_t n);
+R_xlen_t rpy2_string_utf8_lengths(SEXP x, R_xlen_t start, R_xlen_t n,
+                                  int *lengths);
+void rpy2_string_utf8_copy(SEXP x, R_xlen_t start, R_xlen_t n, char *buf);
+R_xlen_t rpy2_fill_string_ucs4(SEXP x, const uint32_t *buf, R_xlen_t width,
+                               R_xlen_t n);
+R_xlen_t rpy2_string_ucs4_width(SEXP x);
+void rpy2_string_ucs4_copy(SEXP x, uint32_t *buf, R_xlen_t width);
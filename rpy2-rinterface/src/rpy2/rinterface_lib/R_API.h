@@ -196,6 +196,8 @@ SEXP R_do_slot(SEXP sexp, SEXP name);
 SEXP R_do_slot_assign(SEXP sexp, SEXP name, SEXP value);
 
 SEXP (ATTRIB)(SEXP x);
+int (IS_S4_OBJECT)(SEXP x);
+Rboolean Rf_inherits(SEXP, const char *);
 
 SEXP Rf_asChar(SEXP sexp);
 
@@ -277,6 +279,7 @@ R_xlen_t Rf_xlength(SEXP);
 SEXP R_lsInternal3(SEXP, Rboolean, Rboolean);
 
 SEXP Rf_duplicate(SEXP s);
+void MARK_NOT_MUTABLE(SEXP x);
 
 SEXP Rf_defineVar(SEXP sym, SEXP s, SEXP env);
 
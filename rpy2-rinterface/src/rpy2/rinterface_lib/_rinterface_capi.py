@@ -4,6 +4,7 @@ import abc
 import enum
 import inspect
 import logging
+import sys
 from typing import Tuple
 import typing
 import warnings
@@ -12,6 +13,7 @@ from rpy2.rinterface_lib import openrlib
 from rpy2.rinterface_lib import conversion
 from rpy2.rinterface_lib import embedded
 from rpy2.rinterface_lib import memorymanagement
+from rpy2.rinterface_lib import na_values
 
 from _cffi_backend import FFI  # type: ignore
 
@@ -25,6 +27,8 @@ ffi = openrlib.ffi
 _MAX_INT: int = 2**32-1
 
 _R_PRESERVED = dict()  # type: typing.Dict[int, int]
+# R ID -> slot in _PRESERVED_SLOTS.
+_R_PRESERVED_SLOTS = dict()  # type: typing.Dict[int, int]
 _PY_PASSENGER = dict()
 
 FFI_MODE = ffi_proxy.get_ffi_mode(openrlib._rinterface_cffi)
@@ -38,8 +42,73 @@ def get_rid(cdata: FFI.CData) -> int:
     return int(ffi.cast('uintptr_t', cdata))
 
 
+class PreservedInfo(typing.NamedTuple):
+    objects: int
+    slots: int
+    free_slots: int
+    blocks: int
+
+
+class _SlotTable(object):
+    """Table of slots preserving R objects from collection.
+
+    R's own mechanism (`R_PreserveObject()`/`R_ReleaseObject()`) keeps
+    a linked list of the preserved objects, and releasing an object
+    means searching that list. Here the R objects are in the slots of
+    R lists (the blocks, themselves preserved by R), and free slots
+    are in a free list: adding or removing an object is O(1).
+    New blocks are allocated when there are no free slots left."""
+
+    def __init__(self, blocksize: int):
+        self.blocksize = blocksize
+        self._blocks: typing.List[FFI.CData] = []
+        self._free: typing.List[int] = []
+
+    def add(self, cdata: FFI.CData) -> int:
+        """Put an R object in a free slot, and return the slot."""
+        while True:
+            try:
+                slot = self._free.pop()
+                break
+            except IndexError:
+                self._grow(cdata)
+        block, i = divmod(slot, self.blocksize)
+        openrlib.rlib.SET_VECTOR_ELT(self._blocks[block], i, cdata)
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Empty a slot."""
+        block, i = divmod(slot, self.blocksize)
+        openrlib.rlib.SET_VECTOR_ELT(self._blocks[block], i,
+                                     openrlib.rlib.R_NilValue)
+        self._free.append(slot)
+
+    def _grow(self, cdata: FFI.CData) -> None:
+        rlib = openrlib.rlib
+        # The object to be added might not be protected yet.
+        rlib.Rf_protect(cdata)
+        try:
+            block = rlib.Rf_allocVector(rlib.VECSXP, self.blocksize)
+            rlib.R_PreserveObject(block)
+        finally:
+            rlib.Rf_unprotect(1)
+        start = len(self._blocks) * self.blocksize
+        self._blocks.append(block)
+        # The lowest slots are used first.
+        self._free.extend(range(start + self.blocksize - 1, start - 1, -1))
+
+    def info(self) -> PreservedInfo:
+        nslots = len(self._blocks) * self.blocksize
+        return PreservedInfo(nslots - len(self._free), nslots,
+                             len(self._free), len(self._blocks))
+
+
+_PRESERVED_SLOTS = _SlotTable(4096)
+
+
 def protected_rids() -> Tuple[Tuple[int, int], ...]:
-    """Sequence of R IDs protected from collection by rpy2."""
+    """Sequence of R IDs protected from collection by rpy2,
+    with their reference count (see also :func:`preserved_info`)."""
     keys = tuple(_R_PRESERVED.keys())
     res = []
     for k in keys:
@@ -49,6 +118,13 @@ def protected_rids() -> Tuple[Tuple[int, int], ...]:
     return tuple(res)
 
 
+def preserved_info() -> PreservedInfo:
+    """Number of R objects protected from collection by rpy2, and
+    number of slots (total and free) and blocks of slots used to
+    protect them."""
+    return _PRESERVED_SLOTS.info()
+
+
 def is_cdata_sexp(obj: typing.Any) -> bool:
     """Is the object a cffi `CData` object pointing to an R object ?"""
     if (isinstance(obj, FFI.CData) and
@@ -62,7 +138,7 @@ def _preserve(cdata: FFI.CData) -> int:
     addr = int(ffi.cast('uintptr_t', cdata))
     count = _R_PRESERVED.get(addr, 0)
     if count == 0:
-        openrlib.rlib.R_PreserveObject(cdata)
+        _R_PRESERVED_SLOTS[addr] = _PRESERVED_SLOTS.add(cdata)
     _R_PRESERVED[addr] = count + 1
     return addr
 
@@ -72,7 +148,7 @@ def _release(cdata: FFI.CData) -> None:
     count = _R_PRESERVED[addr] - 1
     if count == 0:
         del _R_PRESERVED[addr]
-        openrlib.rlib.R_ReleaseObject(cdata)
+        _PRESERVED_SLOTS.remove(_R_PRESERVED_SLOTS.pop(addr))
     else:
         _R_PRESERVED[addr] = count
 
@@ -94,6 +170,16 @@ else:
     _capsule_finalizer_c = None
 
 
+@ffi_proxy.callback(ffi_proxy._altrep_buffer_finalizer_def,
+                    openrlib._rinterface_cffi)
+def _altrep_buffer_finalizer(cdata: FFI.CData) -> None:
+    try:
+        _PY_PASSENGER.pop(get_rid(cdata), None)
+        openrlib.rlib.R_ClearExternalPtr(cdata)
+    except Exception as e:
+        warnings.warn('Exception downgraded to warning: %s' % str(e))
+
+
 class CapsuleBase:
 
     _cdata: FFI.CData
@@ -345,6 +431,266 @@ def _string_setitem(cdata: FFI.CData, i: int, CE: int, value_b) -> None:
     )
 
 
+def _fill_logical_abi(cdata: FFI.CData, values: FFI.CData, n: int) -> None:
+    na_int = openrlib.rlib.R_NaInt
+    values = ffi.new(
+        'int[]',
+        [x if x == na_int else int(x != 0) for x in ffi.unpack(values, n)]
+    )
+    ffi.memmove(openrlib.LOGICAL(cdata), values, n * ffi.sizeof('int'))
+
+
+def _fill_integer_abi(cdata: FFI.CData, values: FFI.CData, n: int) -> None:
+    ffi.memmove(openrlib.INTEGER(cdata), values, n * ffi.sizeof('int'))
+
+
+def _fill_real_abi(cdata: FFI.CData, values: FFI.CData, n: int) -> None:
+    ffi.memmove(openrlib.REAL(cdata), values, n * ffi.sizeof('double'))
+
+
+def _fill_complex_abi(cdata: FFI.CData, values: FFI.CData, n: int) -> None:
+    ffi.memmove(openrlib.COMPLEX(cdata), values, n * ffi.sizeof('Rcomplex'))
+
+
+def _fill_raw_abi(cdata: FFI.CData, values: FFI.CData, n: int) -> None:
+    ffi.memmove(openrlib.RAW(cdata), values, n)
+
+
+def _fill_string_abi(cdata: FFI.CData, buf: FFI.CData, lengths: FFI.CData,
+                     charsxps: FFI.CData, n: int, encoding: int) -> None:
+    rlib = openrlib.rlib
+    offset = 0
+    for i in range(n):
+        length = lengths[i]
+        if charsxps != ffi.NULL and charsxps[i] != ffi.NULL:
+            rlib.SET_STRING_ELT(cdata, i, charsxps[i])
+        elif length < 0:
+            rlib.SET_STRING_ELT(cdata, i, rlib.R_NaString)
+        else:
+            rlib.SET_STRING_ELT(
+                cdata, i, rlib.Rf_mkCharLenCE(buf + offset, length, encoding)
+            )
+            offset += length
+
+
+def _check_string_buffer_abi(buf: FFI.CData, bufsize: int,
+                             lengths: FFI.CData, n: int) -> int:
+    offset = 0
+    for i in range(n):
+        length = lengths[i]
+        if length < 0:
+            continue
+        if (
+                length > bufsize - offset
+                or
+                b'\x00' in ffi.buffer(buf + offset, length)[:]
+        ):
+            return i
+        offset += length
+    return -1
+
+
+def _string_utf8_lengths_abi(cdata: FFI.CData, start: int, n: int,
+                             lengths: FFI.CData) -> int:
+    rlib = openrlib.rlib
+    total = 0
+    for i in range(n):
+        elt = rlib.STRING_ELT(cdata, start + i)
+        if elt == rlib.R_NaString:
+            lengths[i] = -1
+        else:
+            lengths[i] = len(ffi.string(rlib.Rf_translateCharUTF8(elt)))
+            total += lengths[i]
+    return total
+
+
+def _string_utf8_copy_abi(cdata: FFI.CData, start: int, n: int,
+                          buf: FFI.CData) -> None:
+    rlib = openrlib.rlib
+    offset = 0
+    for i in range(n):
+        elt = rlib.STRING_ELT(cdata, start + i)
+        if elt != rlib.R_NaString:
+            s = ffi.string(rlib.Rf_translateCharUTF8(elt))
+            ffi.memmove(buf + offset, s, len(s))
+            offset += len(s)
+
+
+_UCS4_CODEC = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+def _fill_string_ucs4_abi(cdata: FFI.CData, buf: FFI.CData, width: int,
+                          n: int) -> int:
+    rlib = openrlib.rlib
+    data = ffi.buffer(buf, 4 * width * n)
+    for i in range(n):
+        try:
+            s = (data[(4 * width * i):(4 * width * (i + 1))]
+                 .decode(_UCS4_CODEC)
+                 .rstrip('\x00'))
+            s_b = s.encode('utf-8')
+        except UnicodeError:
+            return i
+        if b'\x00' in s_b:
+            return i
+        rlib.SET_STRING_ELT(
+            cdata, i, rlib.Rf_mkCharLenCE(s_b, len(s_b), rlib.CE_UTF8)
+        )
+    return -1
+
+
+def _string_ucs4_width_abi(cdata: FFI.CData) -> int:
+    rlib = openrlib.rlib
+    width = 0
+    for i in range(rlib.Rf_xlength(cdata)):
+        elt = rlib.STRING_ELT(cdata, i)
+        if elt == rlib.R_NaString:
+            return -1
+        try:
+            s = ffi.string(rlib.Rf_translateCharUTF8(elt)).decode('utf-8')
+        except UnicodeDecodeError:
+            return -2
+        width = max(width, len(s))
+    return width
+
+
+def _string_ucs4_copy_abi(cdata: FFI.CData, buf: FFI.CData,
+                          width: int) -> None:
+    rlib = openrlib.rlib
+    for i in range(rlib.Rf_xlength(cdata)):
+        s_b = (ffi.string(rlib.Rf_translateCharUTF8(rlib.STRING_ELT(cdata, i)))
+               .decode('utf-8')
+               .encode(_UCS4_CODEC))
+        ffi.memmove(buf + width * i, s_b, len(s_b))
+
+
+if FFI_MODE is ffi_proxy.InterfaceType.ABI:
+    _fill_logical = _fill_logical_abi
+    _fill_integer = _fill_integer_abi
+    _fill_real = _fill_real_abi
+    _fill_complex = _fill_complex_abi
+    _fill_raw = _fill_raw_abi
+    _fill_string = _fill_string_abi
+    _check_string_buffer = _check_string_buffer_abi
+    _string_utf8_lengths = _string_utf8_lengths_abi
+    _string_utf8_copy = _string_utf8_copy_abi
+    _fill_string_ucs4 = _fill_string_ucs4_abi
+    _string_ucs4_width = _string_ucs4_width_abi
+    _string_ucs4_copy = _string_ucs4_copy_abi
+elif FFI_MODE is ffi_proxy.InterfaceType.API:
+    _fill_logical = openrlib.rlib.rpy2_fill_logical
+    _fill_integer = openrlib.rlib.rpy2_fill_integer
+    _fill_real = openrlib.rlib.rpy2_fill_real
+    _fill_complex = openrlib.rlib.rpy2_fill_complex
+    _fill_raw = openrlib.rlib.rpy2_fill_raw
+    _fill_string = openrlib.rlib.rpy2_fill_string
+    _check_string_buffer = openrlib.rlib.rpy2_check_string_buffer
+    _string_utf8_lengths = openrlib.rlib.rpy2_string_utf8_lengths
+    _string_utf8_copy = openrlib.rlib.rpy2_string_utf8_copy
+    _fill_string_ucs4 = openrlib.rlib.rpy2_fill_string_ucs4
+    _string_ucs4_width = openrlib.rlib.rpy2_string_ucs4_width
+    _string_ucs4_copy = openrlib.rlib.rpy2_string_ucs4_copy
+else:
+    raise ImportError('cffi mode unknown: %s' % FFI_MODE)
+
+
+# The functions populate_bulk_* fill an R vector from a Python sequence
+# with one conversion of the whole sequence to a C array by cffi followed
+# by one copy into the R vector, rather than one call to R per item.
+# They raise TypeError, ValueError, or OverflowError before the R vector
+# is modified when an item is not of a type that can be handled in bulk.
+# The caller is then expected to use the slower path with a casting
+# function for each item.
+
+def populate_bulk_logical(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    values = ffi.new('int[]', seq)
+    _fill_logical(cdata, values, len(values))
+
+
+def populate_bulk_integer(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    values = ffi.new('int[]', seq)
+    _fill_integer(cdata, values, len(values))
+
+
+def populate_bulk_real(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    values = ffi.new('double[]', seq)
+    _fill_real(cdata, values, len(values))
+
+
+def populate_bulk_complex(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    if not all(isinstance(x, complex) for x in seq):
+        raise TypeError('Not all items are of type complex.')
+    values = ffi.new('double[]',
+                     [part for x in seq for part in (x.real, x.imag)])
+    _fill_complex(cdata, values, len(seq))
+
+
+def populate_bulk_raw(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    values = ffi.new('Rbyte[]', seq)
+    _fill_raw(cdata, values, len(values))
+
+
+def _encode_str_sequence(
+        seq: typing.Sequence, encoding: str
+) -> typing.Tuple[bytes, typing.List[int]]:
+    """Concatenate the encoded strings in a sequence.
+
+    Items that are None or NA_Character have a length of -1 and
+    nothing in the concatenated bytes."""
+    try:
+        encoded = [x.encode(encoding) for x in seq]
+        lengths = [len(x) for x in encoded]
+    except AttributeError:
+        encoded = []
+        lengths = []
+        for x in seq:
+            if isinstance(x, str):
+                x_b = x.encode(encoding)
+                encoded.append(x_b)
+                lengths.append(len(x_b))
+            elif x is None or x is na_values.NA_Character:
+                lengths.append(-1)
+            else:
+                raise TypeError('Not a str or an NA: %s' % type(x))
+    buf = b''.join(encoded)
+    if b'\x00' in buf:
+        raise ValueError('Embedded nul in a string.')
+    return buf, lengths
+
+
+def populate_bulk_string(seq: typing.Sequence, cdata: FFI.CData) -> None:
+    conversion._str_sequence_to_strsxp(seq, cdata)
+
+
+def altrep_from_buffer(rtype: int, obj, n: int, rmemory,
+                       keepalive=None) -> FFI.CData:
+    """Create an R vector that uses the memory of a Python buffer.
+
+    The R vector is an ALTREP object reading the n items in the buffer
+    without copying them. The buffer, and the object keepalive if not
+    None, are kept alive until R no longer needs them. This is only
+    available in API mode."""
+    if FFI_MODE is not ffi_proxy.InterfaceType.API:
+        raise NotImplementedError(
+            'R vectors using Python buffers require the cffi API mode.'
+        )
+    buf = ffi.from_buffer(obj)
+    res = rmemory.protect(
+        openrlib.rlib.rpy2_altrep_from_buffer(
+            rtype, buf, n, openrlib.rlib._altrep_buffer_finalizer
+        )
+    )
+    if res == openrlib.rlib.R_NilValue:
+        raise ValueError('Invalid R type for an ALTREP buffer: %s' % rtype)
+    # The cdata object for the buffer keeps a reference to obj. Items
+    # in a tuple are released last to first, so the buffer is released
+    # before keepalive (for example the owner of the memory for obj).
+    _PY_PASSENGER[get_rid(openrlib.rlib.R_altrep_data1(res))] = (
+        buf if keepalive is None else (keepalive, buf)
+    )
+    return res
+
+
 def _has_slot(cdata: FFI.CData, name_b) -> bool:
     res = openrlib.rlib.R_has_slot(cdata, name_b)
     return bool(res)
@@ -379,6 +725,33 @@ def build_rcall(rfunction,
     return rcall
 
 
+def build_rcall_template(rfunction,
+                         names: typing.Sequence[typing.Optional[str]]):
+    """Build an R call with missing arguments.
+
+    The arguments are tagged with the names, when not None, and
+    their values can be set later with SETCAR."""
+    rlib = openrlib.rlib
+    with memorymanagement.rmemory() as rmemory:
+        rcall = rmemory.protect(
+            rlib.Rf_allocLang(len(names)+1)
+        )
+        rlib.SETCAR(rcall, rfunction)
+        item = rlib.CDR(rcall)
+        for key in names:
+            if key is not None:
+                _assert_valid_slotname(key)
+                rlib.SET_TAG(
+                    item,
+                    rlib.Rf_installChar(
+                        conversion._str_to_charsxp(key)
+                    )
+                )
+            rlib.SETCAR(item, rlib.R_MissingArg)
+            item = rlib.CDR(item)
+    return rcall
+
+
 def _evaluated_promise(function):
     def _(*args, **kwargs):
         robj = function(*args, **kwargs)
@@ -550,6 +923,155 @@ def unserialize(cdata: FFI.CData, cdata_env: FFI.CData) -> FFI.CData:
         return res
 
 
+class _ParameterLayout(typing.NamedTuple):
+    """Layout of the parameters of a Python function, as needed to map
+    the arguments in an R call to the arguments in a Python call."""
+    posonly: typing.Tuple[str, ...]
+    positionalorkw: typing.Tuple[str, ...]
+    has_ellipsis: bool
+    # True if all parameters are POSITIONAL_ONLY or VAR_POSITIONAL.
+    positional_only: bool
+
+    @classmethod
+    def from_function(cls, func: typing.Callable) -> '_ParameterLayout':
+        # R and Python function definitions differ. In R all arguments
+        # are optionally named, that is like "positional or keyword"
+        # arguments in Python. "positional or keyword" happens to be
+        # default for arguments without a default *unless* the ellipsis
+        # `*args` is used, in which case all arguments prior to it become
+        # positional-only. We will want to skip naming positional-only
+        # arguments although R might.
+        params = inspect.signature(func).parameters.values()
+        py_posonly = []
+        py_has_ellipsis = False
+        py_positionalorkw = []
+        for param in params:
+            if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+                py_posonly.append(param.name)
+            elif (param.kind is inspect.Parameter.VAR_POSITIONAL
+                  or
+                  param.kind is inspect.Parameter.VAR_KEYWORD):
+                py_has_ellipsis = True
+            elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                py_positionalorkw.append(param.name)
+            else:
+                # KEYWORD_ONLY from now on.
+                break
+        positional_only = all(
+            param.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                           inspect.Parameter.VAR_POSITIONAL)
+            for param in params
+        )
+        return cls(tuple(py_posonly), tuple(py_positionalorkw),
+                   py_has_ellipsis, positional_only)
+
+
+class _RternalizedFunction(object):
+    """A Python function and the layout of its parameters.
+
+    This is the object in the R external pointer for an "rternalized"
+    function, letting the layout be computed once rather than for
+    each call from R."""
+
+    __slots__ = ('function', 'layout')
+
+    def __init__(self, function: typing.Callable):
+        self.function = function
+        try:
+            self.layout: typing.Optional[_ParameterLayout] = (
+                _ParameterLayout.from_function(function)
+            )
+        except (TypeError, ValueError):
+            # Callable without a signature. This is reported when
+            # called from R.
+            self.layout = None
+
+
+def _rargs_to_python(
+        rargs: FFI.CData, layout: _ParameterLayout
+) -> typing.Tuple[typing.List, typing.Dict[str, typing.Any]]:
+    """Convert the arguments in an R call to Python arguments for
+    a function with the given layout of parameters."""
+    rlib = openrlib.rlib
+    py_posonly = layout.posonly
+    py_positionalorkw = layout.positionalorkw
+    py_has_ellipsis = layout.has_ellipsis
+    pyargs = []
+    pykwargs = {}
+    rarg_i = -1
+    while rargs != rlib.R_NilValue:
+        rarg_i += 1
+        cdata = rlib.CAR(rargs)
+        if rlib.Rf_isNull(rlib.TAG(rargs)):
+            # Unnamed argument
+            pyargs.append(conversion._cdata_to_rinterface(cdata))
+        else:
+            # Named arguments
+            rname = rlib.PRINTNAME(rlib.TAG(rargs))
+            name = conversion._rchar_to_str(
+                rname,
+                conversion._ENC_PY
+            )
+            if rarg_i < len(py_posonly):
+                if py_posonly[rarg_i] == name:
+                    # This is an unnamed argument and names are matching.
+                    pyargs.append(conversion._cdata_to_rinterface(cdata))
+                else:
+                    # The R call is considering the parameter as a named one
+                    # and the position is not conserved. This is can lead
+                    # to unnoticed issues, and difficult to debug ones when
+                    # they are. It is better to report the issue here.
+                    raise RuntimeError(
+                        'Parameter name mismatch. R call considering the argument '
+                        f'"{py_posonly[rarg_i]}" as a position-independent '
+                        'keyword argument while it is positional-only '
+                        'in the rternalized Python function.'
+                    )
+            elif (
+                    py_has_ellipsis
+                    and
+                    (rarg_i < (len(py_posonly) + len(py_positionalorkw)))
+            ):
+                if py_positionalorkw[rarg_i - len(py_posonly)] == name:
+                    # This is considered an unnamed argument and names are matching.
+                    pyargs.append(conversion._cdata_to_rinterface(cdata))
+                else:
+                    # The R call is considering the parameter as a named one
+                    # and the position is not conserved. This is can lead
+                    # to unnoticed issues, and difficult to debug ones when
+                    # they are. It is better to report the issue here.
+                    raise RuntimeError(
+                        'Parameter name mismatch. R call considering the argument '
+                        f'"{py_posonly[rarg_i]}" as a position-independent '
+                        'keyword argument while it is positional-or-keyword '
+                        'followed by an positional ellipsis `*args` in the '
+                        'rternalized Python function.'
+                    )
+            else:
+                pykwargs[name] = conversion._cdata_to_rinterface(cdata)
+        rargs = rlib.CDR(rargs)
+    return pyargs, pykwargs
+
+
+def _rargs_to_python_positional(
+        rargs: FFI.CData, layout: _ParameterLayout
+) -> typing.Tuple[typing.List, typing.Dict[str, typing.Any]]:
+    """Same as _rargs_to_python() but streamlined for functions with
+    only positional parameters called from R without named arguments."""
+    rlib = openrlib.rlib
+    nil = rlib.R_NilValue
+    cdata_to_rinterface = conversion._cdata_to_rinterface
+    pyargs = []
+    rargs_i = rargs
+    while rargs_i != nil:
+        if rlib.TAG(rargs_i) != nil:
+            # Named arguments require the checks on names.
+            return _rargs_to_python(rargs, layout)
+        pyargs.append(cdata_to_rinterface(rlib.CAR(rargs_i)))
+        rargs_i = rlib.CDR(rargs_i)
+    return pyargs, {}
+
+
 @ffi_proxy.callback(ffi_proxy._evaluate_in_r_def,
                     openrlib._rinterface_cffi)
 def _evaluate_in_r(rargs: FFI.CData) -> FFI.CData:
@@ -568,91 +1090,21 @@ def _evaluate_in_r(rargs: FFI.CData) -> FFI.CData:
             return rlib.R_NilValue
         handle = rlib.R_ExternalPtrAddr(cdata)
         func = ffi.from_handle(handle)
-        pyargs = []
-        pykwargs = {}
-        # R and Python function definitions differ. In R all arguments
-        # are optionally named, that is like "positional or keyword" arguments
-        # in Python. "positional or keyword" happens to be default for
-        # arguments without a default *unless* the ellipsis `*args` is used,
-        # in which case all arguments prior to it become positional-only.
-        # We will want to skip naming positional-only arguments although R
-        # might.
-        # TODO: Extraction information by inspecting the signature of the
-        # Python function will be done for each call. This is a performance burden.
-        # Is there a way to do it at "rternalization" time and access the result at
-        # call time?
-        # TODO: An other optimization would be to have a streamlined path for
-        # function that only have POSITIONAL_ONLY parameters (or may be
-        # POSITIONAL_ONLY and/or KEYWORD_ONLY).
-        pyfunc_params_iter = inspect.signature(func).parameters.items()
-        py_posonly = []
-        py_has_ellipsis = False
-        py_positionalorkw = []
-        for paramname, paramval in pyfunc_params_iter:
-            if paramval.kind is inspect.Parameter.POSITIONAL_ONLY:
-                py_posonly.append(paramname)
-            elif (paramval.kind is inspect.Parameter.VAR_POSITIONAL
-                  or
-                  paramval.kind is inspect.Parameter.VAR_KEYWORD):
-                py_has_ellipsis = True
-            elif paramval.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                py_positionalorkw.append(paramname)
-            else:
-                # KEYWORD_ONLY from now on.
-                break
-        rarg_i = -1
+        # The layout of the parameters is computed once when the function
+        # is rternalized. An external pointer to a Python function can
+        # also be made without rpy2's rternalize().
+        if isinstance(func, _RternalizedFunction):
+            layout = func.layout
+            func = func.function
+        else:
+            layout = None
+        if layout is None:
+            layout = _ParameterLayout.from_function(func)
         rargs = rlib.CDR(rargs)
-        while rargs != rlib.R_NilValue:
-            rarg_i += 1
-            cdata = rlib.CAR(rargs)
-            if rlib.Rf_isNull(rlib.TAG(rargs)):
-                # Unnamed argument
-                pyargs.append(conversion._cdata_to_rinterface(cdata))
-            else:
-                # Named arguments
-                rname = rlib.PRINTNAME(rlib.TAG(rargs))
-                name = conversion._rchar_to_str(
-                    rname,
-                    conversion._ENC_PY
-                )
-                if rarg_i < len(py_posonly):
-                    if py_posonly[rarg_i] == name:
-                        # This is an unnamed argument and names are matching.
-                        pyargs.append(conversion._cdata_to_rinterface(cdata))
-                    else:
-                        # The R call is considering the parameter as a named one
-                        # and the position is not conserved. This is can lead
-                        # to unnoticed issues, and difficult to debug ones when
-                        # they are. It is better to report the issue here.
-                        raise RuntimeError(
-                            'Parameter name mismatch. R call considering the argument '
-                            f'"{py_posonly[rarg_i]}" as a position-independent '
-                            'keyword argument while it is positional-only '
-                            'in the rternalized Python function.'
-                        )
-                elif (
-                        py_has_ellipsis
-                        and
-                        (rarg_i < (len(py_posonly) + len(py_positionalorkw)))
-                ):
-                    if py_positionalorkw[rarg_i - len(py_posonly)] == name:
-                        # This is considered an unnamed argument and names are matching.
-                        pyargs.append(conversion._cdata_to_rinterface(cdata))
-                    else:
-                        # The R call is considering the parameter as a named one
-                        # and the position is not conserved. This is can lead
-                        # to unnoticed issues, and difficult to debug ones when
-                        # they are. It is better to report the issue here.
-                        raise RuntimeError(
-                            'Parameter name mismatch. R call considering the argument '
-                            f'"{py_posonly[rarg_i]}" as a position-independent '
-                            'keyword argument while it is positional-or-keyword '
-                            'followed by an positional ellipsis `*args` in the '
-                            'rternalized Python function.'
-                        )
-                else:
-                    pykwargs[name] = conversion._cdata_to_rinterface(cdata)
-            rargs = rlib.CDR(rargs)
+        if layout.positional_only:
+            pyargs, pykwargs = _rargs_to_python_positional(rargs, layout)
+        else:
+            pyargs, pykwargs = _rargs_to_python(rargs, layout)
 
         res = func(*pyargs, **pykwargs)
         # The object is whatever the "rternalized" function `func`
@@ -199,6 +199,10 @@ def createbuilder_api():
         source = eventloop_c
     rpy2_h = read_source('RPY2.h')
     source += rpy2_h
+    rpy2_vectors_h = read_source('RPY2_vectors.h')
+    source += read_source('RPY2_vectors.c')
+    rpy2_altrep_h = read_source('RPY2_altrep.h')
+    source += read_source('RPY2_altrep.c')
 
     # Get various compiling flags from R itself.
     r_home = situation.get_r_home()
@@ -250,6 +254,7 @@ def createbuilder_api():
         x.extern_python_def
         for x in [
                 ffi_proxy._capsule_finalizer_def,
+                ffi_proxy._altrep_buffer_finalizer_def,
                 ffi_proxy._evaluate_in_r_def,
                 ffi_proxy._consoleflush_def,
                 ffi_proxy._consoleread_def,
@@ -280,6 +285,8 @@ def createbuilder_api():
 
     ffibuilder.cdef('\n'.join(cdef_r))
     ffibuilder.cdef(rpy2_h)
+    ffibuilder.cdef(rpy2_vectors_h)
+    ffibuilder.cdef(rpy2_altrep_h)
     ffibuilder.cdef(callback_defns_api)
 
     # Add eventloop definitions (only available on POSIX).
@@ -3,14 +3,20 @@
 # TODO: rename the module with a prefix _ to indicate that this should
 #   not be used outside of rpy2's own code
 
+from collections import OrderedDict
 from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Literal
+from typing import NamedTuple
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 from rpy2.rinterface_lib import openrlib
 from rpy2.rinterface_lib import _rinterface_capi as _rinterface
+from rpy2.rinterface_lib import na_values
 
 ffi = openrlib.ffi
 
@@ -251,6 +257,217 @@ def _str_to_symsxp(obj: str, encoding: str):
     return s
 
 
+class CharsxpCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CharsxpCache(object):
+    """Bounded LRU cache from Python strings to R string scalars.
+
+    The R string scalars (`CHARSXP`) are protected from R's garbage
+    collection by keeping them in the slots of an R list, itself
+    preserved until the cache is released. The cache is only valid
+    for the encodings in use when it was created.
+
+    This class is not thread safe!"""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError('The maximum size must be at least 1.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.encodings = (_ENC_PY, _ENC_R)
+        # Python string -> (slot in the R list, CHARSXP).
+        self._entries: (
+            'OrderedDict[str, Tuple[int, _rinterface.FFI.CData]]'
+        ) = OrderedDict()
+        rlib = openrlib.rlib
+        self._store = rlib.Rf_protect(
+            rlib.Rf_allocVector(rlib.VECSXP, maxsize)
+        )
+        rlib.R_PreserveObject(self._store)
+        rlib.Rf_unprotect(1)
+
+    def get(self, val: str):
+        """Get the CHARSXP for a Python string, or None if not cached."""
+        entry = self._entries.get(val)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(val)
+        return entry[1]
+
+    def put(self, val: str, charsxp) -> None:
+        """Add a CHARSXP for a Python string, evicting the least recently
+        used entry if the cache is full."""
+        if val in self._entries:
+            return
+        if len(self._entries) < self.maxsize:
+            slot = len(self._entries)
+        else:
+            slot, _ = self._entries.popitem(last=False)[1]
+        openrlib.rlib.SET_VECTOR_ELT(self._store, slot, charsxp)
+        self._entries[val] = (slot, charsxp)
+
+    def info(self) -> CharsxpCacheInfo:
+        return CharsxpCacheInfo(self.hits, self.misses,
+                                self.maxsize, len(self._entries))
+
+    def release(self) -> None:
+        """Empty the cache and let R free the cached string scalars."""
+        self._entries.clear()
+        if self._store is not None:
+            openrlib.rlib.R_ReleaseObject(self._store)
+            self._store = None
+
+
+_CHARSXP_CACHE: Optional[CharsxpCache] = None
+
+
+def enable_charsxp_cache(maxsize: int = 4096) -> None:
+    """Cache the R string scalars for the most recently converted strings.
+
+    When converting a sequence of Python strings to an R vector, the
+    strings found in the cache are not encoded and looked up by R again,
+    and the other strings are only encoded once per distinct value.
+    This is beneficial for sequences with few distinct values, and
+    a cost for sequences with mostly unique values. An existing cache
+    is replaced by an empty one."""
+    global _CHARSXP_CACHE
+    with openrlib.lock:
+        if _CHARSXP_CACHE is not None:
+            _CHARSXP_CACHE.release()
+        _CHARSXP_CACHE = CharsxpCache(maxsize)
+
+
+def disable_charsxp_cache() -> None:
+    """Release the cache of R string scalars, if any."""
+    global _CHARSXP_CACHE
+    with openrlib.lock:
+        if _CHARSXP_CACHE is not None:
+            _CHARSXP_CACHE.release()
+            _CHARSXP_CACHE = None
+
+
+def charsxp_cache_info() -> Optional[CharsxpCacheInfo]:
+    """Hits, misses, and size of the cache of R string scalars.
+
+    :return: None if the cache is not enabled."""
+    cache = _CHARSXP_CACHE
+    return None if cache is None else cache.info()
+
+
+def _str_sequence_to_strsxp(seq: Sequence, cdata) -> None:
+    """Set the strings in a Python sequence as the items of an R vector.
+
+    The R vector of strings must have the length of the sequence. The
+    strings are encoded and concatenated in Python, and the R string
+    scalars are created in one loop in C. Items that are None or
+    NA_Character are R NAs. A TypeError or ValueError is raised before
+    the R vector is modified if an item is neither a string nor an NA,
+    or if a string has embedded nul characters.
+
+    This function is not thread safe!"""
+    cache = _CHARSXP_CACHE
+    if cache is not None and cache.encodings == (_ENC_PY, _ENC_R):
+        _str_sequence_to_strsxp_cached(seq, cdata, cache)
+    else:
+        buf, lengths = _rinterface._encode_str_sequence(seq, _ENC_PY)
+        _rinterface._fill_string(cdata, ffi.from_buffer(buf),
+                                 ffi.new('int[]', lengths), ffi.NULL,
+                                 len(lengths), _ENC_R)
+
+
+def _str_sequence_to_strsxp_cached(seq: Sequence, cdata,
+                                   cache: CharsxpCache) -> None:
+    """Same as _str_sequence_to_strsxp() but using a CharsxpCache.
+
+    Only the distinct strings not in the cache are encoded, and the
+    R string scalars created for them are added to the cache."""
+    rlib = openrlib.rlib
+    n = len(seq)
+    charsxps = ffi.new('SEXP[]', n)
+    lengths = ffi.new('int[]', n)
+    missed: Dict[str, List[int]] = {}
+    for i, x in enumerate(seq):
+        if isinstance(x, str):
+            charsxp = cache.get(x)
+            if charsxp is None:
+                missed.setdefault(x, []).append(i)
+            else:
+                charsxps[i] = charsxp
+        elif x is None or x is na_values.NA_Character:
+            lengths[i] = -1
+        else:
+            raise TypeError('Not a str or an NA: %s' % type(x))
+    buf, missed_lengths = _rinterface._encode_str_sequence(list(missed),
+                                                           _ENC_PY)
+    missed_strsxp = rlib.Rf_protect(
+        rlib.Rf_allocVector(rlib.STRSXP, len(missed_lengths))
+    )
+    try:
+        _rinterface._fill_string(missed_strsxp, ffi.from_buffer(buf),
+                                 ffi.new('int[]', missed_lengths), ffi.NULL,
+                                 len(missed_lengths), _ENC_R)
+        for j, (x, indices) in enumerate(missed.items()):
+            charsxp = rlib.STRING_ELT(missed_strsxp, j)
+            cache.put(x, charsxp)
+            for i in indices:
+                charsxps[i] = charsxp
+        # All the strings are now CHARSXPs.
+        _rinterface._fill_string(cdata, ffi.NULL, lengths, charsxps, n,
+                                 _ENC_R)
+    finally:
+        rlib.Rf_unprotect(1)
+
+
+def _strsxp_to_str_list(cdata, start: int, n: int) -> List[Optional[str]]:
+    """Convert the items start, ..., start + n - 1 of an R vector of
+    strings to Python strings.
+
+    The translation of the R strings to UTF-8 is done in one loop in C,
+    and R NAs are None.
+
+    This function is not thread safe!"""
+    rlib = openrlib.rlib
+    if _ENC_PY != 'utf-8':
+        res: List[Optional[str]] = []
+        for i in range(start, start + n):
+            elt = rlib.STRING_ELT(cdata, i)
+            res.append(None if elt == rlib.R_NaString
+                       else _rchar_to_str(elt, _ENC_PY))
+        return res
+    lengths = ffi.new('int[]', n)
+    total = _rinterface._string_utf8_lengths(cdata, start, n, lengths)
+    buf = ffi.new('char[]', total)
+    _rinterface._string_utf8_copy(cdata, start, n, buf)
+    data = ffi.buffer(buf)[:]
+    res = []
+    offset = 0
+    if data.isascii():
+        # Character and byte offsets are the same.
+        text = data.decode('ascii')
+        for length in ffi.unpack(lengths, n):
+            if length < 0:
+                res.append(None)
+            else:
+                res.append(text[offset:(offset + length)])
+                offset += length
+    else:
+        for length in ffi.unpack(lengths, n):
+            if length < 0:
+                res.append(None)
+            else:
+                res.append(data[offset:(offset + length)].decode('utf-8'))
+                offset += length
+    return res
+
+
 _PY_R_MAP = {}  # type: Dict[Type, Union[Callable, None, bool]]
 
 
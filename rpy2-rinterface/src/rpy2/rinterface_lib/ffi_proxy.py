@@ -92,6 +92,10 @@ _capsule_finalizer_def: SignatureDefinition = SignatureDefinition(
     '_capsule_finalizer',
     'void', ('SEXP',))
 
+_altrep_buffer_finalizer_def: SignatureDefinition = SignatureDefinition(
+    '_altrep_buffer_finalizer',
+    'void', ('SEXP',))
+
 _evaluate_in_r_def: SignatureDefinition = SignatureDefinition(
     '_evaluate_in_r',
     'SEXP', ('SEXP args',))
@@ -13,7 +13,8 @@ cffi_mode_request = rpy2.situation.get_cffi_mode()
 
 # TODO: Separate the functions in the module from the side-effect of
 # finding R_HOME and opening the shared library.
-R_HOME = rpy2.situation.get_r_home()
+with rpy2.situation._startup_phase('R_HOME'):
+    R_HOME = rpy2.situation.get_r_home()
 
 if os.name == 'nt':
     if R_HOME is not None:
@@ -46,44 +47,61 @@ if os.name == 'nt':
     else:
         logging.warning('R_HOME is None.')
 else:
-    LD_LIBRARY_PATH = (
-        rpy2.situation.r_ld_library_path_from_subprocess(R_HOME)
-        if R_HOME is not None
-        else ''
-    )
+    with rpy2.situation._startup_phase('LD_LIBRARY_PATH'):
+        LD_LIBRARY_PATH = (
+            rpy2.situation.get_r_ld_library_path(R_HOME)
+            if R_HOME is not None
+            else ''
+        )
 
-if cffi_mode_request == rpy2.situation.CFFI_MODE.API:
-    import _rinterface_cffi_api as _rinterface_cffi  # type: ignore
-    cffi_mode = rpy2.situation.CFFI_MODE.API
-elif cffi_mode_request == rpy2.situation.CFFI_MODE.ABI:
-    import _rinterface_cffi_abi as _rinterface_cffi  # type: ignore
-    cffi_mode = rpy2.situation.CFFI_MODE.ABI
-elif cffi_mode_request == rpy2.situation.CFFI_MODE.ANY:
-    try:
+with rpy2.situation._startup_phase('cffi module'):
+    if cffi_mode_request == rpy2.situation.CFFI_MODE.API:
         import _rinterface_cffi_api as _rinterface_cffi  # type: ignore
         cffi_mode = rpy2.situation.CFFI_MODE.API
-    except ImportError as ie_api:
-        logger.warning(
-            f'Error importing in API mode: {repr(ie_api)}'
-        )
+    elif cffi_mode_request == rpy2.situation.CFFI_MODE.ABI:
+        import _rinterface_cffi_abi as _rinterface_cffi  # type: ignore
+        cffi_mode = rpy2.situation.CFFI_MODE.ABI
+    elif cffi_mode_request == rpy2.situation.CFFI_MODE.ANY:
         try:
-            import _rinterface_cffi_abi as _rinterface_cffi  # type: ignore
-            cffi_mode = rpy2.situation.CFFI_MODE.ABI
-            logger.warning('Trying to import in ABI mode.')
-        except ImportError as ie_abi:
-            logger.error(f'Failed to import the API mode with "{ie_api}" '
-                         'and unable to import the ABI mode.')
-            raise ie_abi
-else:
-    raise ImportError(
-        f'cffi mode requested invalid: {cffi_mode_request}'
-    )
+            import _rinterface_cffi_api as _rinterface_cffi  # type: ignore
+            cffi_mode = rpy2.situation.CFFI_MODE.API
+        except ImportError as ie_api:
+            logger.warning(
+                f'Error importing in API mode: {repr(ie_api)}'
+            )
+            try:
+                import _rinterface_cffi_abi as _rinterface_cffi  # type: ignore
+                cffi_mode = rpy2.situation.CFFI_MODE.ABI
+                logger.warning('Trying to import in ABI mode.')
+            except ImportError as ie_abi:
+                logger.error(f'Failed to import the API mode with "{ie_api}" '
+                             'and unable to import the ABI mode.')
+                raise ie_abi
+    else:
+        raise ImportError(
+            f'cffi mode requested invalid: {cffi_mode_request}'
+        )
 ffi = _rinterface_cffi.ffi
 
 lock = threading.Lock()
 rlock = threading.RLock()
 
 
+def _reset_locks() -> None:
+    """Replace the locks in the child process after a fork.
+
+    Other threads of the parent process may have been holding them
+    when the process was forked, and only the forking thread exists
+    in the child."""
+    global lock, rlock
+    lock = threading.Lock()
+    rlock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
 def _dlopen_rlib(r_home: typing.Optional[str]):
     """Open R's shared C library.
 
@@ -99,10 +117,11 @@ def _dlopen_rlib(r_home: typing.Optional[str]):
     return rlib
 
 
-if ffi_proxy.get_ffi_mode(_rinterface_cffi) == ffi_proxy.InterfaceType.API:
-    rlib = _rinterface_cffi.lib
-else:
-    rlib = _dlopen_rlib(R_HOME)
+with rpy2.situation._startup_phase('R shared library'):
+    if ffi_proxy.get_ffi_mode(_rinterface_cffi) == ffi_proxy.InterfaceType.API:
+        rlib = _rinterface_cffi.lib
+    else:
+        rlib = _dlopen_rlib(R_HOME)
 
 
 # R macros and functions
@@ -5,6 +5,7 @@ import collections.abc
 from collections import OrderedDict
 import enum
 import itertools
+import pickle
 import typing
 from rpy2.rinterface_lib import embedded
 from rpy2.rinterface_lib import memorymanagement
@@ -130,19 +131,29 @@ class Sexp(SupportsSEXP):
         ]
 
     def __getstate__(self) -> bytes:
-        with memorymanagement.rmemory() as rmemory:
-            ser = rmemory.protect(
-                _rinterface.serialize(
-                    self.__sexp__._cdata,
-                    globalenv.__sexp__._cdata)
-            )
-            n = openrlib.rlib.Rf_xlength(ser)
-            res = bytes(_rinterface.ffi.buffer(openrlib.rlib.RAW(ser), n))
-        return res
+        return serialize(self.__sexp__._cdata)
 
     def __setstate__(self, state: bytes) -> None:
         self._sexpobject = unserialize(state)
 
+    def __reduce_ex__(self, protocol):
+        """Pickle the R object.
+
+        Vectors that are C arrays (logical, integer, double, complex, and
+        raw vectors), and data frames with such columns or with string
+        columns, are pickled as their C arrays and their attributes. With
+        pickle protocol 5 or above the arrays are
+        :class:`pickle.PickleBuffer` objects, which can be sent out-of-band
+        without copies. Other R objects are serialized by R."""
+        payload = _native_payload(self, protocol)
+        if payload is None:
+            return super().__reduce_ex__(protocol)
+        # The instance dict is pickled as a state, after the object is
+        # memoized, as it can refer to the object (delegators in robjects).
+        return (_from_native_payload, (type(self), payload),
+                getattr(self, '__dict__', None) or None,
+                None, None, _set_native_state)
+
     @property
     def rclass(self) -> 'StrSexpVector':
         """Get or set the R "class" attribute for the object."""
@@ -424,6 +435,19 @@ class SexpEnvironment(Sexp):
         return res
 
     def __setitem__(self, key: str, value) -> None:
+        self.assign(key, value)
+
+    def assign(self, key: str, value, copy: bool = False) -> None:
+        """Assign a value to a symbol in this R environment.
+
+        Unless a copy is requested the R object is not copied. It is
+        marked as shared, and R code modifying the object through the
+        symbol then modifies a copy, but changes made in place from
+        Python (for example through a memoryview) are visible to R.
+
+        :param key: The symbol (a non-empty string).
+        :param value: The value (an R object).
+        :param copy: Assign a copy of the R object (default: False)."""
         # TODO: move body to _rinterface-level function
         if not isinstance(key, str):
             raise TypeError('The key must be a non-empty string.')
@@ -433,17 +457,19 @@ class SexpEnvironment(Sexp):
            (self.__sexp__._cdata == openrlib.rlib.R_EmptyEnv):
             raise ValueError('Cannot remove variables from the base or '
                              'empty environments.')
-        # TODO: call to Rf_duplicate needed ?
         with memorymanagement.rmemory() as rmemory:
             symbol = rmemory.protect(
                 conversion._str_to_symsxp(key, conversion._ENC_PY)
             )
             cdata = rmemory.protect(conversion._get_cdata(value))
-            cdata_copy = rmemory.protect(
-                openrlib.rlib.Rf_duplicate(cdata)
-            )
+            if copy:
+                cdata = rmemory.protect(
+                    openrlib.rlib.Rf_duplicate(cdata)
+                )
+            else:
+                openrlib.rlib.MARK_NOT_MUTABLE(cdata)
             openrlib.rlib.Rf_defineVar(symbol,
-                                       cdata_copy,
+                                       cdata,
                                        self.__sexp__._cdata)
 
     def __len__(self) -> int:
@@ -549,8 +575,6 @@ NULL = NULLType()
 VT = typing.TypeVar('VT', bound='SexpVector')
 
 
-# TODO: move to _rinterface-level function (as ABI / API compatibility
-# will have API-defined code compile for efficiency).
 def _populate_r_vector(iterable, r_vector, set_elt, cast_value) -> None:
     for i, v in enumerate(iterable):
         set_elt(r_vector, i, cast_value(v))
@@ -584,28 +608,57 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
     def _R_GET_PTR(o):
         pass
 
+    # Optional function to populate the R vector from a Python sequence
+    # in one call (see _rinterface.populate_bulk_real for an example).
+    _R_POPULATE_BULK: typing.Optional[
+        typing.Callable[[typing.Sequence, typing.Any], None]
+    ] = None
+
     @classmethod
     @_cdata_res_to_rinterface
     def from_iterable(cls, iterable,
                       populate_func=None,
                       set_elt=None,
                       cast_value=None) -> VT:
-        """Create an R vector/array from an iterable."""
+        """Create an R vector/array from an iterable.
+
+        When neither of populate_func, set_elt, or cast_value is specified
+        and the class has a bulk population function, the vector is
+        populated in one call, falling back to casting and setting
+        items one by one if the iterable contains items the bulk
+        function cannot handle."""
         if not embedded.isready():
             raise embedded.RNotReadyError('Embedded R is not ready to use.')
+        n = len(iterable)
+        populate_bulk = None
+        if (
+                populate_func is None and set_elt is None
+                and cast_value is None
+        ):
+            populate_bulk = cls._R_POPULATE_BULK
+            if (
+                    populate_bulk is not None
+                    and not isinstance(iterable, (list, tuple))
+            ):
+                iterable = list(iterable)
         if populate_func is None:
             populate_func = _populate_r_vector
         if set_elt is None:
             set_elt = cls._R_SET_VECTOR_ELT
         if cast_value is None:
             cast_value = cls._CAST_IN
-        n = len(iterable)
         with memorymanagement.rmemory() as rmemory:
             r_vector = rmemory.protect(
                 openrlib.rlib.Rf_allocVector(
                     cls._R_TYPE, n)
             )
-            populate_func(iterable, r_vector, set_elt, cast_value)
+            if populate_bulk is None:
+                populate_func(iterable, r_vector, set_elt, cast_value)
+            else:
+                try:
+                    populate_bulk(iterable, r_vector)
+                except (TypeError, ValueError, OverflowError):
+                    populate_func(iterable, r_vector, set_elt, cast_value)
         return r_vector
 
     @classmethod
@@ -728,13 +781,13 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
                 openrlib.lock.release()
         elif isinstance(i, slice):
             n_items = len(self)
-            for i_c, v in zip(range(*i.indices(n_items)), value):
-                try:
-                    openrlib.lock.acquire()
+            try:
+                openrlib.lock.acquire()
+                for i_c, v in zip(range(*i.indices(n_items)), value):
                     self._R_SET_VECTOR_ELT(cdata, i_c,
                                            v.__sexp__._cdata)
-                finally:
-                    openrlib.lock.release()
+            finally:
+                openrlib.lock.release()
         else:
             raise TypeError(
                 'Indices must be integers or slices, not %s' % type(i))
@@ -757,6 +810,57 @@ class SexpVectorAbstract(SupportsSEXP, typing.Generic[VT],
         raise ValueError("'%s' is not in R vector" % item)
 
 
+# Sizes and struct formats of the machine words used by _words_view().
+_WORD_FORMATS: typing.Tuple[
+    typing.Tuple[int, typing.Literal['Q', 'I', 'H', 'B']], ...
+] = ((8, 'Q'), (4, 'I'), (2, 'H'), (1, 'B'))
+
+
+def _words_view(cdata, get_ptr, n: int,
+                itemsize: int) -> typing.Tuple[memoryview, int]:
+    """View on the C array of an R vector as machine words.
+
+    Returns the memoryview and the number of words per element."""
+    for size, fmt in _WORD_FORMATS:
+        if itemsize % size == 0:
+            break
+    mview = memoryview(
+        _rinterface.ffi.buffer(get_ptr(cdata), n * itemsize)
+    ).cast(fmt)
+    return mview, itemsize // size
+
+
+def _words_slice(r: range, m: int, j: int) -> slice:
+    """Slice of the j-th words for the elements in a range, with m
+    words per element."""
+    stop = r[-1] * m + j + (1 if r.step > 0 else -1)
+    return slice(r.start * m + j, stop if stop >= 0 else None, r.step * m)
+
+
+def _copy_elements(dest_cdata, dest_n: int, dest_range: range,
+                   src_cdata, src_n: int, src_range: range,
+                   get_ptr, itemsize: int) -> None:
+    """Copy elements between the C arrays of R vectors of the same type.
+
+    Contiguous ranges are copied with one memmove, and strided ranges
+    with memoryview slice assignments (one per machine word in an
+    element)."""
+    n = len(dest_range)
+    if n == 0:
+        return
+    if dest_range.step == 1 and src_range.step == 1:
+        _rinterface.ffi.memmove(get_ptr(dest_cdata) + dest_range.start,
+                                get_ptr(src_cdata) + src_range.start,
+                                n * itemsize)
+    else:
+        dest_mv, m = _words_view(dest_cdata, get_ptr, dest_n, itemsize)
+        src_mv, _ = _words_view(src_cdata, get_ptr, src_n, itemsize)
+        for j in range(m):
+            dest_mv[_words_slice(dest_range, m, j)] = (
+                src_mv[_words_slice(src_range, m, j)]
+            )
+
+
 class SexpVectorCCompatibleAbstract(
         SexpVectorAbstract,
         metaclass=abc.ABCMeta
@@ -767,6 +871,58 @@ class SexpVectorCCompatibleAbstract(
     def _R_SIZEOF_ELT(self):
         pass
 
+    @_cdata_res_to_rinterface
+    def _getslice(self, i: slice):
+        """New R vector with the elements in a slice."""
+        cdata = self.__sexp__._cdata
+        with openrlib.lock:
+            n = openrlib.rlib.Rf_xlength(cdata)
+            src_range = range(*i.indices(n))
+            n_res = len(src_range)
+            with memorymanagement.rmemory() as rmemory:
+                res = rmemory.protect(
+                    openrlib.rlib.Rf_allocVector(self._R_TYPE, n_res)
+                )
+                _copy_elements(res, n_res, range(n_res),
+                               cdata, n, src_range,
+                               self._R_GET_PTR, self._R_SIZEOF_ELT)
+        return res
+
+    def _setslice(self, i: slice, value, cast_value) -> None:
+        """Set the elements in a slice.
+
+        The values are copied in bulk when they are an R vector of the
+        same type, or can be made into one, with as many elements as
+        the slice. Otherwise the elements are set one by one with the
+        values returned by `cast_value`."""
+        cdata = self.__sexp__._cdata
+        n = len(self)
+        dest_range = range(*i.indices(n))
+        src = None
+        if (
+                isinstance(value, collections.abc.Sized)
+                and len(value) == len(dest_range)
+        ):
+            if isinstance(value, Sexp) and value.typeof == self._R_TYPE:
+                src = value
+            else:
+                try:
+                    src = type(self).from_object(value)
+                except (TypeError, ValueError):
+                    src = None
+        if src is None:
+            # Iterating over the values can require the lock.
+            values = [cast_value(v) for _, v in zip(dest_range, value)]
+        with openrlib.lock:
+            if src is None:
+                for i_c, v in zip(dest_range, values):
+                    self._R_SET_VECTOR_ELT(cdata, i_c, v)
+            else:
+                _copy_elements(cdata, n, dest_range,
+                               src.__sexp__._cdata, len(dest_range),
+                               range(len(dest_range)),
+                               self._R_GET_PTR, self._R_SIZEOF_ELT)
+
     @classmethod
     def _raise_incompatible_C_size(cls, mview):
         msg = (
@@ -830,6 +986,7 @@ class StrSexpVector(SexpVector):
     _R_VECTOR_ELT = staticmethod(openrlib.rlib.STRING_ELT)
     _R_SET_VECTOR_ELT = staticmethod(openrlib.rlib.SET_STRING_ELT)
     _CAST_IN = staticmethod(_as_charsxp_cdata)
+    _R_POPULATE_BULK = staticmethod(_rinterface.populate_bulk_string)
 
     def __getitem__(
             self,
@@ -845,15 +1002,38 @@ class StrSexpVector(SexpVector):
             else:
                 res = item
         elif isinstance(i, slice):
-            res = self.from_iterable(
-                [_rinterface._string_getitem(cdata, i_c)
-                 for i_c in range(*i.indices(len(self)))]
-            )
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                with openrlib.lock:
+                    items = conversion._strsxp_to_str_list(
+                        cdata, start, max(0, stop - start)
+                    )
+            else:
+                items = [_rinterface._string_getitem(cdata, i_c)
+                         for i_c in range(start, stop, step)]
+            res = self.from_iterable(items)
         else:
             raise TypeError('Indices must be integers or slices,'
                             ' not %s' % type(i))
         return res
 
+    # Number of strings converted at once when iterating.
+    _ITER_CHUNKSIZE = 2 ** 16
+
+    def __iter__(self) -> typing.Iterator[
+            typing.Union[str, 'NACharacterType']
+    ]:
+        cdata = self.__sexp__._cdata
+        n = len(self)
+        na = typing.cast('NACharacterType', na_values.NA_Character)
+        for start in range(0, n, self._ITER_CHUNKSIZE):
+            with openrlib.lock:
+                items = conversion._strsxp_to_str_list(
+                    cdata, start, min(self._ITER_CHUNKSIZE, n - start)
+                )
+            for item in items:
+                yield na if item is None else item
+
     def __setitem__(
             self,
             i: typing.Union[int, slice],
@@ -924,6 +1104,104 @@ class StrSexpVector(SexpVector):
         finally:
             openrlib.lock.release()
 
+    @classmethod
+    @_cdata_res_to_rinterface
+    def from_memoryview(cls, mview: memoryview) -> 'StrSexpVector':
+        """Create an R vector of strings from a memoryview of fixed-width
+        UCS-4 strings.
+
+        This is the representation of strings in numpy arrays of kind
+        "U" (format "<width>w" for the memoryview). Trailing nul
+        characters are removed, as numpy does. The memoryview must be
+        one-dimensional and contiguous, or a :class:`ValueError` is
+        raised. A :class:`ValueError` is also raised if a string has
+        an embedded nul or an invalid character."""
+        if not embedded.isready():
+            raise embedded.RNotReadyError('Embedded R is not ready to use.')
+        if mview.ndim != 1 or not mview.contiguous:
+            raise ValueError('The memory view must be one-dimensional '
+                             'and contiguous.')
+        if not mview.format.endswith('w') or mview.itemsize % 4:
+            raise ValueError('The memory view must be for fixed-width '
+                             'UCS-4 strings, not of format %s.' %
+                             mview.format)
+        n = len(mview)
+        width = mview.itemsize // 4
+        with memorymanagement.rmemory() as rmemory:
+            r_vector = rmemory.protect(
+                openrlib.rlib.Rf_allocVector(cls._R_TYPE, n)
+            )
+            with openrlib.lock:
+                i_invalid = _rinterface._fill_string_ucs4(
+                    r_vector,
+                    _rinterface.ffi.from_buffer('uint32_t[]', mview),
+                    width, n
+                )
+        if i_invalid >= 0:
+            raise ValueError('Embedded nul or invalid character in the '
+                             'string at index %i.' % i_invalid)
+        return r_vector
+
+    @classmethod
+    @_cdata_res_to_rinterface
+    def from_utf8_buffer(cls, buf, lengths) -> 'StrSexpVector':
+        """Create an R vector of strings from concatenated UTF-8 strings.
+
+        :param:buf: A buffer with the bytes for all the strings.
+        :param:lengths: A buffer of C ints with the number of bytes
+        for each string. A negative length is an NA, with no bytes
+        in buf.
+
+        This is the representation of strings in Arrow arrays. A
+        :class:`ValueError` is raised if there are not enough bytes
+        in the buffer, or if a string has an embedded nul."""
+        if not embedded.isready():
+            raise embedded.RNotReadyError('Embedded R is not ready to use.')
+        ffi = _rinterface.ffi
+        buf_c = ffi.from_buffer(buf)
+        lengths_c = ffi.from_buffer('int[]', lengths)
+        n = len(lengths_c)
+        i_invalid = _rinterface._check_string_buffer(buf_c, len(buf_c),
+                                                     lengths_c, n)
+        if i_invalid >= 0:
+            raise ValueError('Embedded nul in the string at index %i, or '
+                             'not enough bytes in the buffer.' % i_invalid)
+        with memorymanagement.rmemory() as rmemory:
+            r_vector = rmemory.protect(
+                openrlib.rlib.Rf_allocVector(cls._R_TYPE, n)
+            )
+            with openrlib.lock:
+                _rinterface._fill_string(r_vector, buf_c, lengths_c,
+                                         ffi.NULL, n, openrlib.rlib.CE_UTF8)
+        return r_vector
+
+    def to_ucs4_buffer(self) -> typing.Tuple[bytearray, int]:
+        """Copy the strings to a buffer of fixed-width UCS-4 strings.
+
+        This is the representation of strings in numpy arrays of
+        kind "U", and `numpy.frombuffer(buf, dtype='U%i' % width)`
+        is a view on the strings.
+
+        :return: A tuple (buffer, width), with width the number of
+        characters in the longest string. A :class:`ValueError` is
+        raised if there are R NAs, since they cannot be represented."""
+        cdata = self.__sexp__._cdata
+        n = len(self)
+        with openrlib.lock:
+            width = _rinterface._string_ucs4_width(cdata)
+            if width == -1:
+                raise ValueError('NAs cannot be represented as fixed-width '
+                                 'strings.')
+            elif width < 0:
+                raise ValueError('Strings that cannot be translated to '
+                                 'UTF-8.')
+            width = max(width, 1)
+            buf = bytearray(4 * width * n)
+            _rinterface._string_ucs4_copy(
+                cdata, _rinterface.ffi.from_buffer('uint32_t[]', buf), width
+            )
+        return buf, width
+
 
 class RVersion(metaclass=Singleton):
 
@@ -972,6 +1250,58 @@ _TYPE2STR = {
 }
 
 
+def _implicit_rclass(
+        scaps: _rinterface.CapsuleBase,
+        rmemory: memorymanagement.ProtectionTracker
+) -> typing.Tuple[str, ...]:
+    """Names in the implicit class of an object without a class attribute.
+
+    This performs the equivalent of R_data_class() (src/main/attrib.c in
+    the R source code)."""
+    rlib = openrlib.rlib
+    classname: typing.Tuple[str, ...]
+    dim = rmemory.protect(
+        rlib.Rf_getAttrib(scaps._cdata,
+                          rlib.R_DimSymbol))
+    ndim = rlib.Rf_length(dim)
+    if ndim > 0:
+        if ndim == 2:
+            if int(RVersion()['major']) >= 4:
+                classname = ('matrix', 'array')
+            else:
+                classname = ('matrix', )
+        else:
+            classname = ('array', )
+    else:
+        typeof = RTYPES(scaps.typeof)
+        if typeof in (RTYPES.CLOSXP,
+                      RTYPES.SPECIALSXP,
+                      RTYPES.BUILTINSXP):
+            classname = ('function', )
+        elif typeof == RTYPES.REALSXP:
+            classname = ('numeric', )
+        elif typeof == RTYPES.SYMSXP:
+            classname = ('name', )
+        elif typeof == RTYPES.LANGSXP:
+            symb = rlib.CAR(scaps._cdata)
+            if openrlib.rlib.Rf_isSymbol(symb):
+                symb_rstr = openrlib.rlib.PRINTNAME(symb)
+                symb_str = conversion._rchar_to_str(
+                    symb_rstr,
+                    conversion._ENC_PY
+                )
+                if symb_str in ('if', 'while', 'for', '=',
+                                '<-', '(', '{'):
+                    classname = (symb_str, )
+                else:
+                    classname = ('call', )
+            else:
+                classname = ('call', )
+        else:
+            classname = (_TYPE2STR.get(typeof, str(typeof)), )
+    return classname
+
+
 def rclass_get(scaps: _rinterface.CapsuleBase) -> StrSexpVector:
     """ Get the R class name.
 
@@ -985,52 +1315,41 @@ def rclass_get(scaps: _rinterface.CapsuleBase) -> StrSexpVector:
             rlib.Rf_getAttrib(scaps._cdata,
                               rlib.R_ClassSymbol))
         if rlib.Rf_length(classes) == 0:
-            classname: typing.Tuple[str, ...]
-            dim = rmemory.protect(
-                rlib.Rf_getAttrib(scaps._cdata,
-                                  rlib.R_DimSymbol))
-            ndim = rlib.Rf_length(dim)
-            if ndim > 0:
-                if ndim == 2:
-                    if int(RVersion()['major']) >= 4:
-                        classname = ('matrix', 'array')
-                    else:
-                        classname = ('matrix', )
-                else:
-                    classname = ('array', )
-            else:
-                typeof = RTYPES(scaps.typeof)
-                if typeof in (RTYPES.CLOSXP,
-                              RTYPES.SPECIALSXP,
-                              RTYPES.BUILTINSXP):
-                    classname = ('function', )
-                elif typeof == RTYPES.REALSXP:
-                    classname = ('numeric', )
-                elif typeof == RTYPES.SYMSXP:
-                    classname = ('name', )
-                elif typeof == RTYPES.LANGSXP:
-                    symb = rlib.CAR(scaps._cdata)
-                    if openrlib.rlib.Rf_isSymbol(symb):
-                        symb_rstr = openrlib.rlib.PRINTNAME(symb)
-                        symb_str = conversion._rchar_to_str(
-                            symb_rstr,
-                            conversion._ENC_PY
-                        )
-                        if symb_str in ('if', 'while', 'for', '=',
-                                        '<-', '(', '{'):
-                            classname = (symb_str, )
-                        else:
-                            classname = ('call', )
-                    else:
-                        classname = ('call', )
-                else:
-                    classname = (_TYPE2STR.get(typeof, str(typeof)), )
-            classes = StrSexpVector.from_iterable(classname)
+            classes = StrSexpVector.from_iterable(
+                _implicit_rclass(scaps, rmemory)
+            )
         else:
             classes = conversion._cdata_to_rinterface(classes)
     return classes
 
 
+def rclass_key(scaps: _rinterface.CapsuleBase) -> typing.Tuple:
+    """ Get a key identifying the R class of an object.
+
+    The key starts with the R type of the object. When the object
+    has a class attribute it is followed by the addresses of the
+    CHARSXPs for the class names. R has one CHARSXP per string, so
+    those addresses identify the names for as long as the CHARSXPs
+    exist (holding on to the result of `rclass_get()` ensures that),
+    and no R vector or Python string is created. Without a class
+    attribute it is followed by the names in the implicit class.
+    """
+    rlib = openrlib.rlib
+    typeof = scaps.typeof
+    # The class attribute is not a new R object and is protected
+    # through the object.
+    classes = rlib.Rf_getAttrib(scaps._cdata, rlib.R_ClassSymbol)
+    n = rlib.Rf_length(classes)
+    if n == 0:
+        with memorymanagement.rmemory() as rmemory:
+            return (typeof, ) + _implicit_rclass(scaps, rmemory)
+    cast = _rinterface.ffi.cast
+    return (typeof, ) + tuple(
+        int(cast('uintptr_t', rlib.STRING_ELT(classes, i)))
+        for i in range(n)
+    )
+
+
 def rclass_set(
         scaps: _rinterface.CapsuleBase,
         value: 'typing.Union[StrSexpVector, str]'
@@ -1056,6 +1375,17 @@ def rclass_set(
         openrlib.lock.release()
 
 
+def serialize(cdata) -> bytes:
+    """Serialize an R object with R."""
+    with memorymanagement.rmemory() as rmemory:
+        ser = rmemory.protect(
+            _rinterface.serialize(cdata, globalenv.__sexp__._cdata)
+        )
+        n = openrlib.rlib.Rf_xlength(ser)
+        res = bytes(_rinterface.ffi.buffer(openrlib.rlib.RAW(ser), n))
+    return res
+
+
 def unserialize(state):
     n = len(state)
     with memorymanagement.rmemory() as rmemory:
@@ -1071,6 +1401,144 @@ def unserialize(state):
     return res
 
 
+# Size of the items for R vectors that are C arrays.
+_C_ELT_SIZES: typing.Dict[int, int] = {
+    RTYPES.LGLSXP: _rinterface.ffi.sizeof('int'),
+    RTYPES.INTSXP: _rinterface.ffi.sizeof('int'),
+    RTYPES.REALSXP: _rinterface.ffi.sizeof('double'),
+    RTYPES.CPLXSXP: _rinterface.ffi.sizeof('Rcomplex'),
+    RTYPES.RAWSXP: _rinterface.ffi.sizeof('char')
+}
+
+# Version of the format of the payload for pickled R objects.
+_NATIVE_PAYLOAD_VERSION = 1
+
+
+def _serialize_attributes(cdata) -> typing.Optional[bytes]:
+    """Attributes of an R object serialized by R, or None."""
+    attributes = openrlib.rlib.ATTRIB(cdata)
+    if attributes == openrlib.rlib.R_NilValue:
+        return None
+    return serialize(attributes)
+
+
+def _set_attributes(cdata, attributes: typing.Optional[bytes]) -> None:
+    """Set the attributes serialized with _serialize_attributes()."""
+    if attributes is None:
+        return
+    rlib = openrlib.rlib
+    attributes_capsule = unserialize(attributes)
+    node = attributes_capsule._cdata
+    with memorymanagement.rmemory():
+        while node != rlib.R_NilValue:
+            rlib.Rf_setAttrib(cdata, rlib.TAG(node), rlib.CAR(node))
+            node = rlib.CDR(node)
+
+
+def _vector_payload(owner: Sexp, cdata, protocol: int) -> tuple:
+    rlib = openrlib.rlib
+    ffi = _rinterface.ffi
+    rtype = _rinterface._TYPEOF(cdata)
+    n = rlib.Rf_xlength(cdata)
+    nbytes = n * _C_ELT_SIZES[rtype]
+    if nbytes:
+        # The pointer holds a reference to the Python object owning the
+        # R vector, which keeps it alive for as long as the buffer is used.
+        ptr = ffi.gc(ffi.cast('char *', rlib.DATAPTR(cdata)),
+                     lambda ptr, owner=owner: None)
+        buf = ffi.buffer(ptr, nbytes)
+        data = pickle.PickleBuffer(buf) if protocol >= 5 else bytes(buf)
+    else:
+        data = b''
+    return (rtype, n, _serialize_attributes(cdata), data)
+
+
+def _native_payload(obj: Sexp, protocol: int) -> typing.Optional[tuple]:
+    """Payload to pickle an R object without R serialization,
+    or None if the object cannot be pickled this way."""
+    rlib = openrlib.rlib
+    cdata = obj.__sexp__._cdata
+    rtype = _rinterface._TYPEOF(cdata)
+    if rlib.IS_S4_OBJECT(cdata):
+        return None
+    with memorymanagement.rmemory():
+        if rtype in _C_ELT_SIZES:
+            return ((_NATIVE_PAYLOAD_VERSION, )
+                    + _vector_payload(obj, cdata, protocol))
+        elif (
+                rtype == RTYPES.VECSXP
+                and rlib.Rf_inherits(cdata, b'data.frame')
+        ):
+            items: typing.List[typing.Union[tuple, bytes]] = []
+            n = rlib.Rf_xlength(cdata)
+            for i in range(n):
+                item = rlib.VECTOR_ELT(cdata, i)
+                item_rtype = _rinterface._TYPEOF(item)
+                if rlib.IS_S4_OBJECT(item):
+                    return None
+                elif item_rtype in _C_ELT_SIZES:
+                    items.append(_vector_payload(obj, item, protocol))
+                elif item_rtype == RTYPES.STRSXP:
+                    items.append(serialize(item))
+                else:
+                    return None
+            return (_NATIVE_PAYLOAD_VERSION, rtype, n,
+                    _serialize_attributes(cdata), tuple(items))
+    return None
+
+
+def _cdata_from_payload(payload: tuple):
+    """Create an R object from a payload (without the version).
+
+    The R object returned is *not* protected from the R garbage
+    collection."""
+    rtype, n, attributes, data = payload
+    rlib = openrlib.rlib
+    with memorymanagement.rmemory() as rmemory:
+        res = rmemory.protect(rlib.Rf_allocVector(rtype, n))
+        if rtype == RTYPES.VECSXP:
+            for i, item in enumerate(data):
+                if isinstance(item, bytes):
+                    item_capsule = unserialize(item)
+                    rlib.SET_VECTOR_ELT(res, i, item_capsule._cdata)
+                else:
+                    rlib.SET_VECTOR_ELT(res, i, _cdata_from_payload(item))
+        else:
+            nbytes = n * _C_ELT_SIZES[rtype]
+            if memoryview(data).nbytes != nbytes:
+                raise ValueError(
+                    f'The R vector has {nbytes} bytes but the buffer '
+                    f'has {memoryview(data).nbytes}.'
+                )
+            if nbytes:
+                _rinterface.ffi.memmove(rlib.DATAPTR(res), data, nbytes)
+        _set_attributes(res, attributes)
+    return res
+
+
+def _from_native_payload(cls: typing.Type[Sexp], payload: tuple) -> Sexp:
+    """Unpickle an R object pickled with a payload."""
+    version = payload[0]
+    if version != _NATIVE_PAYLOAD_VERSION:
+        raise ValueError(
+            f'Unsupported version for a pickled R object: {version}'
+        )
+    res = cls.__new__(cls)
+    with memorymanagement.rmemory():
+        res._sexpobject = _rinterface.SexpCapsule(
+            _cdata_from_payload(payload[1:])
+        )
+    return res
+
+
+def _set_native_state(obj: Sexp, state: dict) -> None:
+    """Restore the instance dict of an R object unpickled with a payload.
+
+    This is not :meth:`Sexp.__setstate__`, which restores the R object
+    itself."""
+    obj.__dict__.update(state)
+
+
 class NAIntegerType(int, metaclass=Singleton):
 
     def __new__(cls, *args, **kwargs):
@@ -0,0 +1,276 @@
+"""Transport of R vectors between processes through shared memory.
+
+Pickling an R vector copies its content into the pickled data, and
+unpickling it copies the content back into R. For R vectors with
+atomic types that are C arrays (logical, integer, double, complex,
+and raw vectors) the content can be placed in a
+:mod:`multiprocessing.shared_memory` segment instead, with only a
+small handle (:class:`SharedVector`) pickled and sent to the other
+process. The other process maps the segment as an R vector with a
+single copy, or without copy (an ALTREP vector reading from the
+segment) in the cffi API mode.
+
+The segment is owned by the handle rather than by a process: it is
+removed once the handle has been used to create an R vector
+(unless told otherwise), or with :meth:`SharedVector.unlink`.
+Segments are not removed when their process ends, and the handles
+for segments that will not be used (for example when sending them
+failed, or when a task was cancelled) must be unlinked by the caller.
+A handle can only create an R vector once, and data pickled with
+the segments can only be unpickled once.
+On Windows a segment is also destroyed once no process has it open,
+and the handles in the process that created the segments must be kept
+alive until the segments are used.
+"""
+
+import io
+import os
+import pickle
+import sys
+import typing
+from multiprocessing import shared_memory
+from rpy2.rinterface_lib import _rinterface_capi as _rinterface
+from rpy2.rinterface_lib import conversion
+from rpy2.rinterface_lib import ffi_proxy
+from rpy2.rinterface_lib import memorymanagement
+from rpy2.rinterface_lib import openrlib
+from rpy2.rinterface_lib import sexp
+
+ffi = openrlib.ffi
+
+_ELT_SIZES = sexp._C_ELT_SIZES
+
+# Types for which an ALTREP vector can use a buffer.
+_ALTREP_TYPES = (openrlib.rlib.LGLSXP, openrlib.rlib.INTSXP,
+                 openrlib.rlib.REALSXP, openrlib.rlib.RAWSXP)
+
+
+def _open_segment(name: typing.Optional[str] = None,
+                  create: bool = False,
+                  size: int = 0) -> shared_memory.SharedMemory:
+    """Open a shared memory segment not tracked by the resource tracker
+    of the process (the handle owns the segment)."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create=create, size=size,
+                                          track=False)
+    shm = shared_memory.SharedMemory(name, create=create, size=size)
+    if os.name != 'nt':
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name,  # type: ignore[attr-defined]
+                                    'shared_memory')
+    return shm
+
+
+def _unlink_segment(shm: shared_memory.SharedMemory) -> None:
+    if os.name == 'nt':
+        return
+    if sys.version_info < (3, 13):
+        # unlink() unregisters the segment from the resource tracker.
+        from multiprocessing import resource_tracker
+        resource_tracker.register(shm._name,  # type: ignore[attr-defined]
+                                  'shared_memory')
+    shm.unlink()
+
+
+def _segment_buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise ValueError(f'The shared memory segment {shm.name} is closed.')
+    return buf
+
+
+def is_shareable(obj) -> bool:
+    """Can the R object be placed in shared memory ?"""
+    return (isinstance(obj, sexp.SexpVector)
+            and obj.typeof in _ELT_SIZES)
+
+
+class SharedVector(object):
+    """Handle to an R vector in a shared memory segment.
+
+    Handles are small objects that can be pickled and sent to
+    other processes."""
+
+    def __init__(self, name: str, rtype: int, length: int,
+                 attributes: typing.Optional[bytes] = None):
+        self.name = name
+        self.rtype = rtype
+        self.length = length
+        # Attributes of the R vector (serialized by R).
+        self.attributes = attributes
+        # On Windows a segment only exists for as long as a process
+        # has it open.
+        self._segment: typing.Optional[shared_memory.SharedMemory] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_segment'] = None
+        return state
+
+    def __repr__(self) -> str:
+        return '%s(%r, %s, %i)' % (type(self).__name__, self.name,
+                                   sexp.RTYPES(self.rtype).name,
+                                   self.length)
+
+    @property
+    def nbytes(self) -> int:
+        return self.length * _ELT_SIZES[self.rtype]
+
+    def to_sexp(self, copy: bool = False,
+                unlink: bool = True) -> sexp.SexpVector:
+        """Create an R vector from the shared memory segment.
+
+        :param copy: copy the content of the segment into a new R vector.
+        If False, and if possible (cffi API mode, and not a complex vector),
+        the R vector is an ALTREP vector reading from the segment for as
+        long as R does not modify it.
+        :param unlink: remove the segment (it remains mapped in the
+        processes using it).
+        :return: an R vector."""
+        shm = _open_segment(self.name)
+        try:
+            res = _from_segment(shm, self.rtype, self.length,
+                                self.attributes, copy)
+        finally:
+            if unlink:
+                _unlink_segment(shm)
+        return res
+
+    def unlink(self) -> None:
+        """Remove the shared memory segment without using it."""
+        shm = _open_segment(self.name)
+        shm.close()
+        _unlink_segment(shm)
+
+
+def to_shared(obj: sexp.SexpVector) -> SharedVector:
+    """Copy an R vector into a new shared memory segment.
+
+    :param obj: an R vector of type logical, integer, double,
+    complex, or raw.
+    :return: a handle for the segment."""
+    if not is_shareable(obj):
+        raise ValueError('Only R vectors of type logical, integer, double, '
+                         'complex, or raw can be placed in shared memory.')
+    cdata = obj.__sexp__._cdata
+    rtype = obj.typeof
+    n = len(obj)
+    nbytes = n * _ELT_SIZES[rtype]
+    # A segment cannot be empty.
+    shm = _open_segment(create=True, size=max(nbytes, 1))
+    try:
+        with memorymanagement.rmemory():
+            if nbytes:
+                _segment_buffer(shm)[:nbytes] = ffi.buffer(
+                    openrlib.rlib.DATAPTR(cdata), nbytes
+                )
+            attributes = sexp._serialize_attributes(cdata)
+    except Exception:
+        shm.close()
+        _unlink_segment(shm)
+        raise
+    res = SharedVector(shm.name, rtype, n, attributes)
+    if os.name == 'nt':
+        res._segment = shm
+    else:
+        shm.close()
+    return res
+
+
+@conversion._cdata_res_to_rinterface
+def _from_segment(shm: shared_memory.SharedMemory, rtype: int, n: int,
+                  attributes: typing.Optional[bytes], copy: bool):
+    nbytes = n * _ELT_SIZES[rtype]
+    buf = _segment_buffer(shm)
+    rlib = openrlib.rlib
+    with memorymanagement.rmemory() as rmemory:
+        if (
+                not copy and n
+                and rtype in _ALTREP_TYPES
+                and _rinterface.FFI_MODE is ffi_proxy.InterfaceType.API
+        ):
+            # The segment remains mapped until R no longer needs
+            # the vector.
+            res = _rinterface.altrep_from_buffer(rtype, buf[:nbytes], n,
+                                                 rmemory, keepalive=shm)
+        else:
+            res = rmemory.protect(rlib.Rf_allocVector(rtype, n))
+            if nbytes:
+                ffi.memmove(rlib.DATAPTR(res), buf[:nbytes], nbytes)
+            shm.close()
+        sexp._set_attributes(res, attributes)
+    return res
+
+
+def _from_shared(cls: type, handle: SharedVector) -> sexp.SexpVector:
+    res = handle.to_sexp()
+    if type(res) is not cls:
+        res = cls(res)
+    return res
+
+
+class SharedMemoryPickler(pickle.Pickler):
+    """Pickler placing R vectors in shared memory.
+
+    R vectors that can be placed in shared memory (see
+    :func:`is_shareable`) and are at least min_nbytes large are pickled
+    as a :class:`SharedVector` handle. Other R objects are pickled
+    as usual. The pickled data are loaded with :func:`pickle.loads`,
+    which creates the R vectors and removes the segments. The handles
+    created are in the attribute `handles`, to remove the segments with
+    :func:`unlink` if the data are not loaded.
+
+    The other parameters are the ones for :class:`pickle.Pickler`."""
+
+    def __init__(self, file, protocol=None, *, min_nbytes: int = 0,
+                 **kwargs):
+        super().__init__(file, protocol, **kwargs)
+        self.min_nbytes = min_nbytes
+        # Handles for the R vectors pickled.
+        self.handles: typing.List[SharedVector] = []
+
+    def reducer_override(self, obj):
+        if (
+                is_shareable(obj)
+                and len(obj) * _ELT_SIZES[obj.typeof] >= self.min_nbytes
+        ):
+            handle = to_shared(obj)
+            self.handles.append(handle)
+            # The instance dict is pickled after the object is memoized,
+            # as it can refer to the object (see Sexp.__reduce_ex__).
+            return (_from_shared, (type(obj), handle),
+                    getattr(obj, '__dict__', None) or None,
+                    None, None, sexp._set_native_state)
+        return NotImplemented
+
+
+def unlink(handles: typing.Iterable[SharedVector]) -> None:
+    """Remove the shared memory segments for handles, skipping the
+    segments already removed."""
+    for handle in handles:
+        try:
+            handle.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def dumps(
+        obj, protocol=None, *, min_nbytes: int = 0
+) -> typing.Tuple[bytes, typing.List[SharedVector]]:
+    """Pickle an object with R vectors placed in shared memory.
+
+    The pickled data can only be unpickled once, as this removes the
+    segments. If they are not unpickled (for example because sending
+    them failed), the caller must remove the segments with
+    :func:`unlink`. See :class:`SharedMemoryPickler`.
+
+    :return: a tuple with the pickled data and the handles for
+    the shared memory segments created."""
+    f = io.BytesIO()
+    pickler = SharedMemoryPickler(f, protocol, min_nbytes=min_nbytes)
+    try:
+        pickler.dump(obj)
+    except BaseException:
+        unlink(pickler.handles)
+        raise
+    return f.getvalue(), pickler.handles
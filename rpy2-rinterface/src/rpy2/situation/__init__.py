@@ -5,13 +5,20 @@ R version, rpy2 version, etc...).
 """
 
 import argparse
+import contextlib
+import csv
 import enum
+import json
 import locale
 import logging
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
+import typing
 from typing import Optional
 import warnings
 
@@ -23,6 +30,8 @@ else:
     r_version_folder = 'i386'
 
 ENVVAR_CFFI_TYPE: str = 'RPY2_CFFI_MODE'
+ENVVAR_STARTUP_SNAPSHOT: str = 'RPY2_STARTUP_SNAPSHOT'
+STARTUP_SNAPSHOT_VERSION: int = 2
 ENCODING_LOCALE = locale.getpreferredencoding()
 ENCODING_SYS = sys.getdefaultencoding()
 
@@ -173,6 +182,66 @@ def r_ld_library_path_from_subprocess(r_home: str) -> str:
     return r_lib_path
 
 
+def r_envvars_from_subprocess(
+        r_home: str,
+        baselinevars: typing.Optional[typing.Mapping[str, str]] = None
+) -> typing.Tuple[typing.Tuple[str, str], ...]:
+    """Get the environment variables defined by the R front-end script.
+
+    :param r_home: R HOME directory
+    :param baselinevars: environment variables to compare with. Only
+    the variables absent from it, or with a different value, are returned.
+    If `None` the environment of the current process is used.
+    :return: a tuple of (name, value) pairs."""
+    if baselinevars is None:
+        baselinevars = os.environ
+
+    # Use a temporary file to write the environment variables. Windows
+    # has a file locking system that requires a slightly more complicated
+    # implementation than it would otherwise be on other OSes.
+    temp_fh = tempfile.NamedTemporaryFile(mode='w', delete=False,
+                                          suffix='.csv')
+    temp_fh.close()
+    try:
+        if os.name == 'nt':
+            temp_name = temp_fh.name.replace('\\', '/')
+        else:
+            temp_name = temp_fh.name
+        cmd = (
+            os.path.join(r_home, 'bin', 'Rscript'),
+            '-e',
+            ';'.join(
+                (
+                    'x <- Sys.getenv()',
+                    'dataf <- data.frame(key=names(x), val=as.character(x))',
+                    f'write.csv(dataf, file="{temp_name}", row.names=FALSE)'
+                )
+            )
+        )
+        logger.debug('Looking for R environment variables with: {}'
+                     .format(' '.join(cmd)))
+        subprocess.run(cmd)
+        res = []
+        with open(temp_fh.name, mode='r') as _:
+            reader = csv.reader(_)
+            assert tuple(next(reader)) == ('key', 'val')
+            for row in reader:
+                if len(row) != 2:
+                    raise ValueError(
+                        f'Invalid environment variable row: {row}'
+                    )
+                k, v = row
+                if (
+                        (k not in baselinevars)
+                        or
+                        (baselinevars[k] != v)
+                ):
+                    res.append((k, v))
+    finally:
+        os.remove(temp_fh.name)
+    return tuple(res)
+
+
 def get_rlib_rpath(r_home: str) -> str:
     """Get the path for the R shared library/libraries."""
     lib_path = os.path.join(r_home, get_r_libnn(r_home))
@@ -204,18 +273,24 @@ def get_rlib_path(r_home: str, system: str) -> str:
     return lib_path
 
 
-def get_r_home() -> Optional[str]:
+def get_r_home(use_snapshot: bool = True) -> Optional[str]:
     """Get R's home directory (aka R_HOME).
 
     If an environment variable R_HOME is found it is returned,
     and if none is found it is trying to get it from an R executable
-    in the PATH. On Windows, a third last attempt is made by trying
-    to obtain R_HOME from the registry. If all attempt are unfruitful,
-    None is returned.
+    in the PATH (or from a valid startup snapshot for that executable,
+    see :func:`write_startup_snapshot`). On Windows, a third last attempt
+    is made by trying to obtain R_HOME from the registry. If all attempt
+    are unfruitful, None is returned.
     """
 
     r_home = os.environ.get('R_HOME')
 
+    if not r_home and use_snapshot:
+        snapshot = get_startup_snapshot()
+        if snapshot is not None:
+            r_home = snapshot['r_home']
+
     if not r_home:
         try:
             r_home = r_home_from_subprocess()
@@ -252,6 +327,263 @@ def get_r_exec(r_home: str) -> str:
     return r_exec
 
 
+_STARTUP_TIMINGS: typing.Dict[str, float] = {}
+
+
+@contextlib.contextmanager
+def _startup_phase(name: str):
+    """Record the time spent in a phase of the startup of rpy2."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _STARTUP_TIMINGS[name] = (_STARTUP_TIMINGS.get(name, 0.0)
+                                  + time.perf_counter() - t0)
+
+
+def get_startup_timings() -> typing.Dict[str, float]:
+    """Get the time (in seconds) spent in each phase of the startup.
+
+    The phases are recorded as they happen when importing
+    :mod:`rpy2.rinterface` and calling :func:`rpy2.rinterface.initr`.
+    """
+    return dict(_STARTUP_TIMINGS)
+
+
+def get_startup_snapshot_path() -> Optional[str]:
+    """Get the path for the file with the startup snapshot.
+
+    The path is in the environment variable RPY2_STARTUP_SNAPSHOT if
+    defined. If the variable is defined but empty, snapshots are disabled
+    and None is returned. Otherwise the path is in the user's cache
+    directory."""
+    path = os.environ.get(ENVVAR_STARTUP_SNAPSHOT)
+    if path is not None:
+        return path or None
+    if os.name == 'nt':
+        cache_dir = os.environ.get('LOCALAPPDATA',
+                                   os.path.expanduser('~'))
+    else:
+        cache_dir = os.environ.get('XDG_CACHE_HOME',
+                                   os.path.join(os.path.expanduser('~'),
+                                                '.cache'))
+    return os.path.join(cache_dir, 'rpy2', 'startup_snapshot.json')
+
+
+def _file_key(path: Optional[str]) -> Optional[typing.List]:
+    """Path and modification time of a file, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        return [path, os.stat(path).st_mtime_ns]
+    except OSError:
+        return None
+
+
+def _r_in_path() -> Optional[str]:
+    r_in_path = shutil.which('R')
+    return os.path.abspath(r_in_path) if r_in_path else None
+
+
+# Environment variables, other than the ones starting with "R_", that
+# R's front-end uses to define its own environment variables.
+_SNAPSHOT_ENVVARS = ('HOME', 'USERPROFILE', 'LD_LIBRARY_PATH',
+                     'DYLD_FALLBACK_LIBRARY_PATH', 'EDITOR', 'VISUAL',
+                     'PAGER', 'TMPDIR', 'TMP', 'TEMP', 'LANG', 'LC_ALL')
+
+
+def _snapshot_envvar_names(
+        names: typing.Iterable[str] = ()
+) -> typing.Set[str]:
+    res = set(_SNAPSHOT_ENVVARS)
+    res.update(names)
+    res.update(k for k in os.environ if k.startswith('R_'))
+    # R_HOME is validated with the R executable.
+    res.discard('R_HOME')
+    return res
+
+
+def _renviron_files(r_home: str) -> typing.List:
+    """Files R reads environment variables from."""
+    paths = (os.path.join(r_home, 'etc', 'Renviron.site'),
+             os.path.abspath('.Renviron'),
+             os.path.join(os.path.expanduser('~'), '.Renviron'))
+    return [_file_key(path) for path in paths]
+
+
+def write_startup_snapshot(path: Optional[str] = None,
+                           r_home: Optional[str] = None) -> dict:
+    """Write a startup snapshot.
+
+    The snapshot is a JSON file with the R home directory, R's value
+    for LD_LIBRARY_PATH, and the environment variables defined by the R
+    front-end script. These are otherwise obtained by calling R in
+    subprocesses when importing :mod:`rpy2.rinterface` and initializing R.
+    The snapshot is only used when the R executable it was made
+    from is unchanged (same path and modification time), and when the
+    environment variables R's values depend on (R's own variables,
+    HOME, LD_LIBRARY_PATH, etc...) and the Renviron files are
+    unchanged.
+
+    :param path: path of the file. If None, the path returned by
+    :func:`get_startup_snapshot_path` is used.
+    :param r_home: R HOME directory. If None, the one returned by
+    :func:`get_r_home` (without using a snapshot) is used.
+    :return: the snapshot"""
+    if path is None:
+        path = get_startup_snapshot_path()
+        if path is None:
+            raise ValueError(f'Startup snapshots are disabled '
+                             f'({ENVVAR_STARTUP_SNAPSHOT} is empty).')
+    r_in_path = None
+    if r_home is None:
+        if not os.environ.get('R_HOME'):
+            # R_HOME is obtained from the R executable in the PATH.
+            r_in_path = _file_key(_r_in_path())
+        r_home = get_r_home(use_snapshot=False)
+        if r_home is None:
+            raise ValueError('Unable to determine R home.')
+    r_exec = _file_key(get_r_exec(r_home))
+    if r_exec is None:
+        raise ValueError(f'No R executable in {r_home}.')
+    # R_HOME is left out of the baseline so the snapshot always has it.
+    baselinevars = dict(os.environ)
+    baselinevars.pop('R_HOME', None)
+    renvvars = r_envvars_from_subprocess(r_home, baselinevars)
+    # The values in the snapshot are only valid for the same values
+    # of these variables.
+    environ = {k: os.environ.get(k) for k in
+               sorted(_snapshot_envvar_names(k for k, v in renvvars))}
+    snapshot = {
+        'version': STARTUP_SNAPSHOT_VERSION,
+        'r_home': r_home,
+        'r_exec': r_exec,
+        'r_in_path': r_in_path,
+        'ld_library_path': (
+            '' if os.name == 'nt'
+            else r_ld_library_path_from_subprocess(r_home)
+        ),
+        'renvvars': [list(item) for item in renvvars],
+        'environ': environ,
+        'renviron': _renviron_files(r_home)
+    }
+    dirname = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dirname, exist_ok=True)
+    with tempfile.NamedTemporaryFile(mode='w', dir=dirname,
+                                     suffix='.tmp', delete=False) as fh:
+        json.dump(snapshot, fh, indent=1)
+    os.replace(fh.name, path)
+    _SNAPSHOTS.pop(path, None)
+    logger.info(f'Startup snapshot written to {path}')
+    return snapshot
+
+
+_SNAPSHOTS: typing.Dict[str, Optional[dict]] = {}
+
+
+def read_startup_snapshot(path: Optional[str] = None) -> Optional[dict]:
+    """Read a startup snapshot.
+
+    The file is only read once per process.
+
+    :param path: path of the file. If None, the path returned by
+    :func:`get_startup_snapshot_path` is used.
+    :return: the snapshot, or None if there is no snapshot or the
+    snapshot is for a different version of the format."""
+    if path is None:
+        path = get_startup_snapshot_path()
+        if path is None:
+            return None
+    if path in _SNAPSHOTS:
+        return _SNAPSHOTS[path]
+    snapshot = None
+    try:
+        with open(path) as fh:
+            snapshot = json.load(fh)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f'Unable to read the startup snapshot {path}: {e}')
+    if (
+            not isinstance(snapshot, dict)
+            or snapshot.get('version') != STARTUP_SNAPSHOT_VERSION
+    ):
+        if snapshot is not None:
+            logger.info(f'Ignoring startup snapshot {path} '
+                        'with a different version.')
+        snapshot = None
+    _SNAPSHOTS[path] = snapshot
+    return snapshot
+
+
+def get_startup_snapshot(r_home: Optional[str] = None,
+                         path: Optional[str] = None) -> Optional[dict]:
+    """Get the startup snapshot if valid.
+
+    :param r_home: R HOME directory. If None, the snapshot must
+    have been made for the R executable currently in the PATH.
+    :param path: path of the file. If None, the path returned by
+    :func:`get_startup_snapshot_path` is used.
+    :return: the snapshot, or None if there is no valid snapshot."""
+    snapshot = read_startup_snapshot(path)
+    if snapshot is None:
+        return None
+    if r_home is None:
+        if (
+                snapshot['r_in_path'] is None
+                or _file_key(_r_in_path()) != snapshot['r_in_path']
+        ):
+            logger.info('Startup snapshot not valid for the R in the PATH.')
+            return None
+    elif (
+            os.path.normpath(r_home) != os.path.normpath(snapshot['r_home'])
+            or _file_key(get_r_exec(r_home)) != snapshot['r_exec']
+    ):
+        logger.info(f'Startup snapshot not valid for R home {r_home}.')
+        return None
+    environ = snapshot['environ']
+    if (
+            any(os.environ.get(k) != v for k, v in environ.items())
+            or not _snapshot_envvar_names() <= environ.keys()
+            or _renviron_files(snapshot['r_home']) != snapshot['renviron']
+    ):
+        logger.info('Startup snapshot not valid for the environment '
+                    'variables or the Renviron files.')
+        return None
+    return snapshot
+
+
+def get_r_ld_library_path(r_home: str) -> str:
+    """Get the LD_LIBRARY_PATH settings added by R.
+
+    A valid startup snapshot is used if present, otherwise
+    R is called in a subprocess."""
+    snapshot = get_startup_snapshot(r_home)
+    if snapshot is None:
+        return r_ld_library_path_from_subprocess(r_home)
+    return snapshot['ld_library_path']
+
+
+def get_r_envvars(
+        r_home: str,
+        baselinevars: typing.Optional[typing.Mapping[str, str]] = None
+) -> typing.Tuple[typing.Tuple[str, str], ...]:
+    """Get the environment variables defined by the R front-end script.
+
+    A valid startup snapshot is used if present, otherwise
+    R is called in a subprocess. See :func:`r_envvars_from_subprocess`
+    for the parameters."""
+    snapshot = get_startup_snapshot(r_home)
+    if snapshot is None:
+        return r_envvars_from_subprocess(r_home, baselinevars)
+    if baselinevars is None:
+        baselinevars = os.environ
+    return tuple(
+        (k, v) for k, v in snapshot['renvvars']
+        if k not in baselinevars or baselinevars[k] != v
+    )
+
+
 def _get_r_cmd_config(r_home: str, about: str, allow_empty=False):
     """Get the output of calling 'R CMD CONFIG <about>'.
 
@@ -460,6 +792,19 @@ def iter_info():
     yield '  In the PATH: %s' % r_version_from_subprocess()
     yield '  Loading R library from rpy2: %s' % rlib_status
 
+    yield make_bold('Startup snapshot:')
+    snapshot_path = get_startup_snapshot_path()
+    if snapshot_path is None:
+        yield f'  Disabled ({ENVVAR_STARTUP_SNAPSHOT} is empty)'
+    elif read_startup_snapshot(snapshot_path) is None:
+        yield f'  {snapshot_path}: absent'
+    elif r_home is not None and get_startup_snapshot(r_home,
+                                                     snapshot_path):
+        yield f'  {snapshot_path}: valid'
+    else:
+        yield (f'  {snapshot_path}: not valid '
+               '(R or its environment has changed)')
+
     r_libs = os.environ.get('R_LIBS')
     yield make_bold('Additional directories to load R packages from:')
     yield f'  {r_libs}'
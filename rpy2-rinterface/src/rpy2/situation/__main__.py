@@ -1,9 +1,13 @@
 import argparse
 import logging
+import time
 from rpy2.situation import get_r_home
+from rpy2.situation import get_startup_snapshot_path
+from rpy2.situation import get_startup_timings
 from rpy2.situation import iter_info
 from rpy2.situation import r_ld_library_path_from_subprocess
 from rpy2.situation import set_default_logging
+from rpy2.situation import write_startup_snapshot
 import sys
 
 logger = logging.getLogger(__name__)
@@ -15,11 +19,15 @@ if __name__ == '__main__':
         'environment and help diagnose issues')
     parser.add_argument('action',
                         nargs='?',
-                        choices=('info', 'LD_LIBRARY_PATH'),
+                        choices=('info', 'LD_LIBRARY_PATH',
+                                 'snapshot', 'startup'),
                         default='info',
                         help=('Action to perform. "info" shows all info, '
                               'LD_LIBRARY_PATH returns optionally required '
-                              'additions to the environment variable'))
+                              'additions to the environment variable, '
+                              '"snapshot" writes a startup snapshot, '
+                              '"startup" shows the time spent in each '
+                              'phase of the startup of rpy2'))
     parser.add_argument('-v', '--verbose',
                         choices=('ERROR', 'WARNING', 'INFO', 'DEBUG'),
                         default='WARNING',
@@ -40,3 +48,25 @@ if __name__ == '__main__':
             sys.exit(1)
         else:
             print(r_ld_library_path_from_subprocess(r_home))
+    elif args.action == 'snapshot':
+        path = get_startup_snapshot_path()
+        if path is None:
+            print('Startup snapshots are disabled.')
+            sys.exit(1)
+        try:
+            write_startup_snapshot(path)
+        except ValueError as ve:
+            print(ve)
+            sys.exit(1)
+        print(f'Startup snapshot written to {path}')
+    elif args.action == 'startup':
+        t0 = time.perf_counter()
+        import rpy2.rinterface
+        t_import = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        rpy2.rinterface.initr()
+        t_initr = time.perf_counter() - t0
+        for name, t in get_startup_timings().items():
+            print('%-24s %8.4f' % (name, t))
+        print('%-24s %8.4f' % ('total import', t_import))
+        print('%-24s %8.4f' % ('total initr()', t_initr))
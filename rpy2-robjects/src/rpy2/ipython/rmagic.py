@@ -808,7 +808,8 @@ class RMagics(IPython.core.magic.Magics):
             else:
                 val = _find(rhs, self.shell.user_ns)
         if val is not None:
-            env[lhs] = val
+            # The R object is shared with Python rather than copied.
+            env.assign(lhs, val, copy=False)
 
     def _find_converter(
             self, name: str, local_ns: dict
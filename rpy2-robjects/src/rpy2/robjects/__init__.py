@@ -129,7 +129,7 @@ def _vector_matrix_array(
 def _convert_rpy2py_intvector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.IntSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -137,7 +137,7 @@ def _convert_rpy2py_intvector(obj):
 def _convert_rpy2py_floatvector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.FloatSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -145,7 +145,7 @@ def _convert_rpy2py_floatvector(obj):
 def _convert_rpy2py_complexvector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.ComplexSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -153,7 +153,7 @@ def _convert_rpy2py_complexvector(obj):
 def _convert_rpy2py_boolvector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.BoolSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -161,7 +161,7 @@ def _convert_rpy2py_boolvector(obj):
 def _convert_rpy2py_strvector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.StrSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -169,7 +169,7 @@ def _convert_rpy2py_strvector(obj):
 def _convert_rpy2py_bytevector(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.ByteSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -250,7 +250,7 @@ def _rpy2py_sexpclosure(obj):
 def _rpy2py_sexpenvironment(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.SexpEnvironment])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -258,15 +258,19 @@ def _rpy2py_sexpenvironment(obj):
 def _rpy2py_listsexp(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.ListSexpVector])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
+def _s4_extends(rclass):
+    return methods_env['extends'](rclass)
+
+
 @default_converter.rpy2py.register(SexpS4)
 def _rpy2py_sexps4(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[SexpS4])
-    cls = clsmap.find(methods_env['extends'](obj.rclass))
+    cls = clsmap.find_rclass(obj, lineage=_s4_extends)
     return cls(obj)
 
 
@@ -274,7 +278,7 @@ def _rpy2py_sexps4(obj):
 def _rpy2py_sexpextptr(obj):
     clsmap = (conversion.converter_ctx.get()
               .rpy2py_nc_map[rinterface.SexpExtPtr])
-    cls = clsmap.find(obj.rclass)
+    cls = clsmap.find_rclass(obj)
     return cls(obj)
 
 
@@ -310,6 +314,11 @@ def _py2rpy_sexp(obj):
     return obj
 
 
+@default_converter.py2rpy.register(vectors.LazyOperation)
+def _py2rpy_lazyoperation(obj):
+    return obj._evaluate()
+
+
 @default_converter.py2rpy.register(array.array)
 def _py2rpy_array(obj):
     if obj.typecode in ('h', 'H', 'i', 'I'):
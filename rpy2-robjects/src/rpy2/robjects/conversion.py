@@ -72,6 +72,9 @@ class NameClassMap(object):
 
     default = property(lambda self: self._default)
 
+    # Maximum number of memoized results in find_rclass().
+    _RCLASS_CACHE_MAXSIZE = 1024
+
     def __init__(self,
                  defaultcls: typing.Union[
                      typing.Type,
@@ -81,12 +84,16 @@ class NameClassMap(object):
             namemap = {}
         self._default = defaultcls
         self._map = namemap.copy()
+        self._shared = False
+        self._rclass_cache: typing.Dict[typing.Hashable, tuple] = {}
 
     def __contains__(self, key: str) -> bool:
         return key in self._map
 
     def __delitem__(self, key: str) -> None:
+        self._unshare()
         del self._map[key]
+        self._rclass_cache.clear()
 
     def __getitem__(
             self, key: str
@@ -99,12 +106,32 @@ class NameClassMap(object):
                         typing.Type[typing.Any],
                         typing.Callable[[typing.Any], typing.Any]
                     ]):
+        self._unshare()
         self._map[key] = value
+        self._rclass_cache.clear()
 
     def copy(self) -> 'NameClassMap':
         return NameClassMap(defaultcls=self._default,
                             namemap=self._map.copy())
 
+    def _copy_on_write(self) -> 'NameClassMap':
+        """Copy sharing the mapping of names until it is modified.
+
+        The mapping, and the results memoized by `find_rclass()`, are
+        shared until either the copy or the original is modified."""
+        res = NameClassMap(defaultcls=self._default)
+        res._map = self._map
+        res._rclass_cache = self._rclass_cache
+        res._shared = True
+        self._shared = True
+        return res
+
+    def _unshare(self) -> None:
+        if self._shared:
+            self._map = self._map.copy()
+            self._rclass_cache = {}
+            self._shared = False
+
     def update(self,
                mapping: typing.Dict[
                    str,
@@ -114,9 +141,11 @@ class NameClassMap(object):
                    ]
                ],
                default: typing.Optional[typing.Type] = None):
+        self._unshare()
         self._map.update(mapping)
         if default:
             self._default = default
+        self._rclass_cache.clear()
 
     def find_key(self, keys: typing.Iterable[str]) -> typing.Optional[str]:
         """
@@ -147,6 +176,36 @@ class NameClassMap(object):
             cls = self._default
         return cls
 
+    def find_rclass(
+            self, obj: rpy2.rinterface_lib.sexp.Sexp,
+            lineage: typing.Optional[
+                typing.Callable[[typing.Any], typing.Iterable[str]]
+            ] = None
+    ) -> typing.Union[typing.Type, typing.Callable[[typing.Any], typing.Any]]:
+        """Find the first mapping for the R class of an R object.
+
+        This is `find(obj.rclass)`, or `find(lineage(obj.rclass))` if
+        a function `lineage` is given, with the result memoized for
+        the R type and class attribute of the object. Memoized results
+        are discarded whenever the map is modified."""
+        key = (lineage, rpy2.rinterface_lib.sexp.rclass_key(obj.__sexp__))
+        try:
+            return self._rclass_cache[key][0]
+        except KeyError:
+            pass
+        rclass = obj.rclass
+        cls = self.find(
+            typing.cast(typing.Iterable[str], rclass) if lineage is None
+            else lineage(rclass)
+        )
+        cache = self._rclass_cache
+        if len(cache) >= self._RCLASS_CACHE_MAXSIZE:
+            cache.clear()
+        # The R class is kept alive with the result as the key is
+        # made of the addresses of its strings.
+        cache[key] = (cls, rclass)
+        return cls
+
 
 class NameClassMapContext(object):
     """Context manager to add/override in-place name->class maps."""
@@ -255,6 +314,58 @@ def _rpy2py(obj):
     )
 
 
+class _Dispatch(object):
+    """Dispatch on the type of the first argument for a Converter.
+
+    This wraps a function made with :func:`functools.singledispatch`,
+    with its methods `register` and `dispatch` and its attribute
+    `registry`. The function can be shared with the dispatch of an
+    other converter, in which case the rules are only copied when one
+    is registered with either of them (copy on write). The lookup of
+    the rule for a type is memoized by the shared function, and remains
+    so across conversion contexts."""
+
+    __slots__ = ('_default', '_func', '_dispatch', '_shared')
+
+    def __init__(self, default: typing.Callable,
+                 func: typing.Any, shared: bool = False):
+        self._default = default
+        self._func = func
+        self._dispatch = func.dispatch
+        self._shared = shared
+
+    def __call__(self, obj, *args, **kwargs):
+        return self._dispatch(obj.__class__)(obj, *args, **kwargs)
+
+    @property
+    def registry(self):
+        return self._func.registry
+
+    def dispatch(self, cls):
+        return self._dispatch(cls)
+
+    def register(self, cls, func=None):
+        self._unshare()
+        return self._func.register(cls, func)
+
+    def _copy_on_write(self) -> '_Dispatch':
+        self._shared = True
+        return _Dispatch(self._default, self._func, shared=True)
+
+    def _unshare(self) -> None:
+        if not self._shared:
+            return
+        func = singledispatch(self._default)
+        for k, v in self._func.registry.items():
+            # skip the root dispatch
+            if k is object and v is self._default:
+                continue
+            func.register(k, v)
+        self._func = func
+        self._dispatch = func.dispatch
+        self._shared = False
+
+
 class Converter(object):
     """
     Conversion between rpy2's low-level and high-level proxy objects
@@ -292,8 +403,8 @@ class Converter(object):
                  template: typing.Optional['Converter'] = None):
         (py2rpy, rpy2py) = Converter.make_dispatch_functions()
         self._name = name
-        self._py2rpy = py2rpy
-        self._rpy2py = rpy2py
+        self._py2rpy = _Dispatch(_py2rpy, py2rpy)
+        self._rpy2py = _Dispatch(_rpy2py, rpy2py)
         self._rpy2py_nc_map = {}
         lineage: typing.Tuple[str, ...]
         if template is None:
@@ -305,6 +416,22 @@ class Converter(object):
             overlay_converter(template, self)
         self._lineage = lineage
 
+    def _copy_on_write(self, name: str) -> 'Converter':
+        """Create a converter sharing the rules of this one.
+
+        Unlike with `Converter(name, template=self)` the rules are
+        only copied when a rule is added or modified in either
+        converter."""
+        res = Converter.__new__(Converter)
+        res._name = name
+        res._py2rpy = self._py2rpy._copy_on_write()
+        res._rpy2py = self._rpy2py._copy_on_write()
+        res._rpy2py_nc_map = {
+            k: v._copy_on_write() for k, v in self._rpy2py_nc_map.items()
+        }
+        res._lineage = self._lineage + (name, )
+        return res
+
     def __add__(self, converter: 'Converter') -> 'Converter':
         assert isinstance(converter, Converter)
         new_name = '%s + %s' % (self.name, converter.name)
@@ -322,7 +449,9 @@ class Converter(object):
         >>> # Do something else whith the earlier conversion rules restored.
 
         The conversion context is a *copy* of the set of conversion rules.
-        Any modification to those rules will be local to it.
+        Any modification to those rules will be local to it. The copy
+        is only made when a rule is added or changed in the context,
+        which makes entering a context cheap.
 
         Whenever the use of a context started by a `with` statement and
         within the code block it defines through indentation is inconvenient,
@@ -383,8 +512,9 @@ class ConversionContext(object):
     def __init__(self, ctx_converter):
         assert isinstance(ctx_converter, Converter)
         self._original_converter = converter_ctx.get()
-        self.ctx_converter = Converter('Converter-%i-in-context' % id(self),
-                                       template=ctx_converter)
+        self.ctx_converter = ctx_converter._copy_on_write(
+            'Converter-%i-in-context' % id(self)
+        )
 
     def __enter__(self):
         set_conversion(self.ctx_converter)
@@ -32,8 +32,16 @@ class Environment(RObjectMixin, sexp.SexpEnvironment):
         return res
 
     def __setitem__(self, item: str, value: typing.Any) -> None:
+        self.assign(item, value)
+
+    def assign(self, item: str, value: typing.Any,
+               copy: bool = False) -> None:
+        """ Assign a value, converted to R, to a symbol.
+
+        See :meth:`rpy2.rinterface.SexpEnvironment.assign`
+        about `copy`."""
         robj = conversion.get_conversion().py2rpy(value)
-        super(Environment, self).__setitem__(item, robj)
+        super(Environment, self).assign(item, robj, copy=copy)
 
     @property
     def enclos(self) -> typing.Union[sexp.SexpEnvironment, sexp.NULLType]:
@@ -2,6 +2,7 @@ import inspect
 import os
 import re
 import textwrap
+import threading
 import typing
 from typing import Union
 import warnings
@@ -96,13 +97,16 @@ class Function(RObjectMixin, rinterface.SexpClosure):
     __assymbol = baseenv_ri.find('as.symbol')
     __newenv = baseenv_ri.find('new.env')
 
-    _local_env = None
+    __local_env = None
 
-    def __init__(self, *args, **kwargs):
-        super(Function, self).__init__(*args, **kwargs)
-        self._local_env = self.__newenv(
-            hash=rinterface.BoolSexpVector((True, ))
-        )
+    @property
+    def _local_env(self):
+        # The environment is only created when first needed.
+        if self.__local_env is None:
+            self.__local_env = self.__newenv(
+                hash=rinterface.BoolSexpVector((True, ))
+            )
+        return self.__local_env
 
     @docstring_property(__doc__)
     def __doc__(self) -> str:
@@ -151,11 +155,32 @@ class Function(RObjectMixin, rinterface.SexpClosure):
         return res
 
 
+# Translation tables for the parameters of R functions, by names of
+# the parameters and translation options.
+_PRM_TRANSLATE_CACHE: 'OrderedDict[tuple, OrderedDict]' = OrderedDict()
+_PRM_TRANSLATE_CACHE_MAXSIZE = 4096
+_PRM_TRANSLATE_CACHE_LOCK = threading.Lock()
+
+
+def _reset_prm_translate_cache_lock() -> None:
+    # The lock may have been held by an other thread when the
+    # process was forked.
+    global _PRM_TRANSLATE_CACHE_LOCK
+    _PRM_TRANSLATE_CACHE_LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_prm_translate_cache_lock)
+
+
 class SignatureTranslatedFunction(Function):
     """ Python representation of an R function, where
     the names in named argument are translated to valid
-    argument names in Python. """
-    _prm_translate: Union[OrderedDict, dict] = {}
+    argument names in Python.
+
+    The translation is only made when first needed (for example the
+    first time the function is called with named arguments)."""
+    _prm_translate_table: typing.Optional[Union[OrderedDict, dict]] = None
 
     def __init__(self, sexp: rinterface.SexpClosure,
                  init_prm_translate=None,
@@ -163,19 +188,52 @@ class SignatureTranslatedFunction(Function):
                  symbol_r2python=default_symbol_r2python,
                  symbol_resolve=default_symbol_resolve):
         super(SignatureTranslatedFunction, self).__init__(sexp)
+        if init_prm_translate is not None:
+            assert isinstance(init_prm_translate, dict)
+        self._prm_translate_args = (init_prm_translate, on_conflict,
+                                    symbol_r2python, symbol_resolve)
+        if hasattr(sexp, '__rname__'):
+            # TODO: mypy does not use the line above and trips on
+            # __rname__ being not always present.
+            self.__rname__ = sexp.__rname__  # type: ignore
+
+    @property
+    def _prm_translate(self) -> Union[OrderedDict, dict]:
+        res = self._prm_translate_table
+        if res is None:
+            res = self._translate_parameters()
+            self._prm_translate_table = res
+        return res
+
+    @_prm_translate.setter
+    def _prm_translate(self, value: Union[OrderedDict, dict]) -> None:
+        self._prm_translate_table = value
+
+    def _translate_parameters(self) -> Union[OrderedDict, dict]:
+        (init_prm_translate, on_conflict,
+         symbol_r2python, symbol_resolve) = self._prm_translate_args
+        # The formals are not converted, as the translation only depends
+        # on the names of the parameters.
+        formals = _formals_fixed(self)
+        has_formals = formals is not rinterface.NULL
+        rnames = tuple(formals.do_slot('names')) if has_formals else ()
         if init_prm_translate is None:
-            self._prm_translate = OrderedDict()
+            key = (rnames, on_conflict, symbol_r2python, symbol_resolve)
+            with _PRM_TRANSLATE_CACHE_LOCK:
+                cached = _PRM_TRANSLATE_CACHE.get(key)
+                if cached is not None:
+                    _PRM_TRANSLATE_CACHE.move_to_end(key)
+                    return OrderedDict(cached)
+            prm_translate: Union[OrderedDict, dict] = OrderedDict()
         else:
-            assert isinstance(init_prm_translate, dict)
-            self._prm_translate = init_prm_translate
+            prm_translate = init_prm_translate
 
-        formals = self.formals()
-        if formals.__sexp__._cdata != rinterface.NULL.__sexp__._cdata:
+        if has_formals:
             (symbol_mapping,
              conflicts,
              resolutions) = _map_symbols(
-                 formals.names,
-                 translation=self._prm_translate,
+                 rnames,
+                 translation=prm_translate,
                  symbol_r2python=symbol_r2python,
                  symbol_resolve=symbol_resolve)
 
@@ -191,20 +249,27 @@ class SignatureTranslatedFunction(Function):
             # TODO: Why was this done?
             # reserved_pynames = set(dir(self))
 
-            self._prm_translate.update((k, v[0])
-                                       for k, v in symbol_mapping.items())
-        if hasattr(sexp, '__rname__'):
-            # TODO: mypy does not use the line above and trips on
-            # __rname__ being not always present.
-            self.__rname__ = sexp.__rname__  # type: ignore
+            prm_translate.update((k, v[0])
+                                 for k, v in symbol_mapping.items())
+        if init_prm_translate is None:
+            with _PRM_TRANSLATE_CACHE_LOCK:
+                if (
+                        key not in _PRM_TRANSLATE_CACHE
+                        and (len(_PRM_TRANSLATE_CACHE) >=
+                             _PRM_TRANSLATE_CACHE_MAXSIZE)
+                ):
+                    _PRM_TRANSLATE_CACHE.popitem(last=False)
+                _PRM_TRANSLATE_CACHE[key] = OrderedDict(prm_translate)
+        return prm_translate
 
     def __call__(self, *args, **kwargs):
-        prm_translate = self._prm_translate
-        for k in tuple(kwargs.keys()):
-            r_k = prm_translate.get(k, None)
-            if r_k is not None:
-                v = kwargs.pop(k)
-                kwargs[r_k] = v
+        if kwargs:
+            prm_translate = self._prm_translate
+            for k in tuple(kwargs.keys()):
+                r_k = prm_translate.get(k, None)
+                if r_k is not None:
+                    v = kwargs.pop(k)
+                    kwargs[r_k] = v
         return (super(SignatureTranslatedFunction, self)
                 .__call__(*args, **kwargs))
 
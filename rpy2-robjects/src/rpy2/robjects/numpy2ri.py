@@ -2,6 +2,8 @@ import rpy2.robjects as ro
 import rpy2.robjects.conversion as conversion
 import rpy2.rinterface as rinterface
 import rpy2.rlike.container as rlc
+import rpy2.rinterface_lib.conversion
+import rpy2.rinterface_lib.openrlib
 from rpy2.rinterface import (Sexp,
                              StrSexpVector, ByteSexpVector,
                              RTYPES)
@@ -12,6 +14,15 @@ RINT_SIZE = 32
 
 original_converter = None
 
+
+def _unicode_array_to_strsxp(a):
+    """Convert a 1D numpy array of kind "U" to an R vector of strings,
+    with the strings encoded in C."""
+    return StrSexpVector.from_memoryview(
+        memoryview(numpy.ascontiguousarray(a))
+    )
+
+
 # The possible kind codes are listed at
 #   http://numpy.scipy.org/array_interface.shtml
 _kinds = {
@@ -23,7 +34,7 @@ _kinds = {
     'c': ro.vectors.ComplexVector,
     # "O" -> special-cased below
     'S': ro.vectors.ByteVector,
-    'U': ro.vectors.StrVector,
+    'U': _unicode_array_to_strsxp,
     # "V" -> special-cased below
     # TODO: datetime64 ?
     # "datetime64":
@@ -48,7 +59,13 @@ rpy2py = converter.rpy2py
 
 
 def numpy_O_py2rpy(o):
-    if all(isinstance(x, str) for x in o):
+    values = o.tolist()
+    # Quick check of the types of all items without a loop in Python.
+    types = set(map(type, values))
+    if str in types and types <= {str, type(None)}:
+        # None items are R NAs.
+        res = StrSexpVector(values)
+    elif all(isinstance(x, str) for x in o):
         res = StrSexpVector(o)
     elif all(isinstance(x, bytes) for x in o):
         res = ByteSexpVector(o)
@@ -229,8 +246,23 @@ def rpy2py_charvector(obj):
 
 @rpy2py.register(rinterface.StrSexpVector)
 def rpy2py_strvector(obj):
-    res = numpy.array(obj)
-    res[res == rinterface.NA_Character] = None
+    """Convert an R vector of strings to a numpy array.
+
+    The array is of kind "U" and filled directly from R if there are
+    no NAs. Otherwise it is an array of objects with None for NAs."""
+    n = len(obj)
+    if n == 0:
+        return numpy.array(obj)
+    try:
+        buf, width = obj.to_ucs4_buffer()
+        res = numpy.frombuffer(buf, dtype='U%i' % width)
+    except ValueError:
+        with rpy2.rinterface_lib.openrlib.lock:
+            values = rpy2.rinterface_lib.conversion._strsxp_to_str_list(
+                obj.__sexp__._cdata, 0, n
+            )
+        res = numpy.empty(n, dtype=object)
+        res[:] = values
     return res
 
 
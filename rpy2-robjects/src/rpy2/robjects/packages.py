@@ -1,6 +1,8 @@
+import atexit
 import os
 import typing
 import warnings
+import weakref
 from types import ModuleType
 from warnings import warn
 import rpy2.rinterface as rinterface
@@ -16,6 +18,7 @@ from rpy2.robjects.packages_utils import (
                                           _fix_map_symbols
 )
 import rpy2.robjects.help as rhelp
+from rpy2.robjects import packages_cache
 
 _require = rinterface.baseenv['require']
 _library = rinterface.baseenv['library']
@@ -162,9 +165,10 @@ class Package(ModuleType):
     _env = None
     __rname__ = None
     _translation = None
-    _rpy2r = None
-    _exported_names = None
+    _rpy2r: typing.Optional[typing.Dict[str, str]] = None
+    _exported_names: typing.Optional[typing.Set[str]] = None
     _symbol_r2python = None
+    _symbol_cache: typing.Optional[packages_cache.PackageSymbolCache] = None
     __version__: typing.Optional[str] = None
     __rdata__: typing.Optional[PackageData] = None
 
@@ -172,7 +176,8 @@ class Package(ModuleType):
                  exported_names=None, on_conflict='fail',
                  version=None,
                  symbol_r2python=default_symbol_r2python,
-                 symbol_resolve=default_symbol_resolve):
+                 symbol_resolve=default_symbol_resolve,
+                 symbol_cache=None):
         """ Create a Python module-like object from an R environment,
         using the specified translation if defined.
 
@@ -187,6 +192,8 @@ class Package(ModuleType):
                            The default translate `.` into `_`.
         - symbol_resolve: function to check the Python symbols obtained
                           from `symbol_r2python`.
+        - symbol_cache: :class:`PackageSymbolCache` in which the
+                        translations of symbols are stored (or None)
         """
 
         super(Package, self).__init__(name)
@@ -200,6 +207,7 @@ class Package(ModuleType):
         self._exported_names = exported_names
         self._symbol_r2python = symbol_r2python
         self._symbol_resolve = symbol_resolve
+        self._symbol_cache = symbol_cache
         self.__fill_rpy2r__(on_conflict=on_conflict)
         self._exported_names = self._exported_names.difference(mynames)
         self.__version__ = version
@@ -218,12 +226,50 @@ class Package(ModuleType):
         """
         assert on_conflict in ('fail', 'warn')
 
+        cv = conversion.get_conversion()
+        for rpyname, rname in self._map_rpy2r(self._env, on_conflict):
+            try:
+                riobj = self._env[rname]
+            except rinterface.embedded.RRuntimeError as rre:
+                warn(str(rre))
+            rpyobj = cv.rpy2py(riobj)
+            if hasattr(rpyobj, '__rname__'):
+                rpyobj.__rname__ = rname
+            # TODO: shouldn't the original R name be also in the __dict__ ?
+            self.__dict__[rpyname] = rpyobj
+
+    def _map_rpy2r(
+            self, rnames: typing.Iterable[str], on_conflict: str
+    ) -> typing.List[typing.Tuple[str, str]]:
+        """ Map R symbols to Python symbols and add them to the
+        attribute _rpy2r.
+
+        - rnames: R symbols
+        - on_conflict: 'fail' or 'warn'
+
+        Returns a list of pairs (Python symbol, R symbol).
+        """
+        symbol_cache = self._symbol_cache
+        if symbol_cache is not None:
+            res = symbol_cache.symbols()
+            if res is not None:
+                for rpyname, rname in res:
+                    self._add_rpy2r(rpyname, rname)
+                return res
+        res = self._compute_rpy2r(rnames, on_conflict)
+        if symbol_cache is not None:
+            symbol_cache.set_symbols(res)
+        return res
+
+    def _compute_rpy2r(
+            self, rnames: typing.Iterable[str], on_conflict: str
+    ) -> typing.List[typing.Tuple[str, str]]:
         name = self.__rname__
 
         (symbol_mapping,
          conflicts,
          resolutions) = _map_symbols(
-             self._env,
+             rnames,
              translation=self._translation,
              symbol_r2python=self._symbol_r2python,
              symbol_resolve=self._symbol_resolve
@@ -239,33 +285,52 @@ class Package(ModuleType):
                          exception)
         symbol_mapping.update(resolutions)
         reserved_pynames = set(dir(self))
-        cv = conversion.get_conversion()
-        for rpyname, rnames in symbol_mapping.items():
+        res = []
+        for rpyname, rname_list in symbol_mapping.items():
             # last paranoid check
-            if len(rnames) > 1:
+            if len(rname_list) > 1:
                 raise ValueError(
                     'Only one R name should be associated with %s '
-                    '(and we have %s)' % (rpyname, str(rnames))
+                    '(and we have %s)' % (rpyname, str(rname_list))
                 )
-            rname = rnames[0]
+            rname = rname_list[0]
             if rpyname in reserved_pynames:
                 raise LibraryError('The symbol ' + rname +
                                    ' in the package "' + name + '"' +
                                    ' is conflicting with' +
                                    ' a Python object attribute')
-            self._rpy2r[rpyname] = rname
-            if (rpyname != rname) and (rname in self._exported_names):
-                self._exported_names.remove(rname)
-                self._exported_names.add(rpyname)
-            try:
-                riobj = self._env[rname]
-            except rinterface.embedded.RRuntimeError as rre:
-                warn(str(rre))
-            rpyobj = cv.rpy2py(riobj)
-            if hasattr(rpyobj, '__rname__'):
-                rpyobj.__rname__ = rname
-            # TODO: shouldn't the original R name be also in the __dict__ ?
-            self.__dict__[rpyname] = rpyobj
+            self._add_rpy2r(rpyname, rname)
+            res.append((rpyname, rname))
+        return res
+
+    def _add_rpy2r(self, rpyname: str, rname: str) -> None:
+        assert self._rpy2r is not None
+        assert self._exported_names is not None
+        self._rpy2r[rpyname] = rname
+        if (rpyname != rname) and (rname in self._exported_names):
+            self._exported_names.remove(rname)
+            self._exported_names.add(rpyname)
+
+    def _cached_prm_translate(
+            self, functions: typing.Iterable[SignatureTranslatedFunction]
+    ) -> None:
+        """ Set the translation of parameter names for functions from
+        the symbol cache, and store the ones not in the cache yet."""
+        symbol_cache = self._symbol_cache
+        if symbol_cache is None:
+            return
+        cached = symbol_cache.parameters()
+        missing = []
+        for func in functions:
+            rname = func.__rname__
+            if rname is None:
+                continue
+            prm_translate = cached.get(rname)
+            if prm_translate is None:
+                missing.append((rname, func._prm_translate))
+            else:
+                func._prm_translate = prm_translate.copy()
+        symbol_cache.set_parameters(missing)
 
     def __repr__(self):
         s = super(Package, self).__repr__()
@@ -328,13 +393,17 @@ class InstalledSTPackage(SignatureTranslatedPackage):
     def __fill_rpy2r__(self, on_conflict='fail'):
         (super(SignatureTranslatedPackage, self)
          .__fill_rpy2r__(on_conflict=on_conflict))
+        functions = []
         for name, robj in self.__dict__.items():
             if isinstance(robj, rinterface.Sexp) and \
                robj.typeof == rinterface.RTYPES.CLOSXP:
-                self.__dict__[name] = DocumentedSTFunction(
+                func = DocumentedSTFunction(
                     self.__dict__[name],
                     packagename=self.__rname__
                 )
+                self.__dict__[name] = func
+                functions.append(func)
+        self._cached_prm_translate(functions)
 
 
 class InstalledPackage(Package):
@@ -354,6 +423,128 @@ class InstalledPackage(Package):
         return os.linesep.join(doc)
 
 
+class _LazyPackageMixin(object):
+    """ Mixin for packages in which the R objects are only fetched,
+    converted, and wrapped when the corresponding attribute is first
+    accessed.
+
+    The mapping of R symbols to Python symbols is computed once, from
+    the exported names only, and `dir()` lists the Python symbols
+    whether they were accessed already or not.
+    """
+
+    def __fill_rpy2r__(self, on_conflict='fail'):
+        assert on_conflict in ('fail', 'warn')
+        self._map_rpy2r(self._exported_names, on_conflict)
+
+    def __update_dict__(self, on_conflict='fail'):
+        for elt in self._rpy2r:
+            self.__dict__.pop(elt, None)
+        self._rpy2r.clear()
+        self.__fill_rpy2r__(on_conflict=on_conflict)
+
+    def __getattr__(self, name):
+        rpy2r = self._rpy2r
+        if rpy2r is None or name not in rpy2r:
+            raise AttributeError(
+                "The symbol '%s' is not in the R package '%s'." %
+                (name, self.__rname__)
+            )
+        rname = rpy2r[name]
+        rpyobj = conversion.get_conversion().rpy2py(self._env[rname])
+        if hasattr(rpyobj, '__rname__'):
+            rpyobj.__rname__ = rname
+        rpyobj = self._wrap_rpyobj(rpyobj)
+        self.__dict__[name] = rpyobj
+        return rpyobj
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()).union(self._rpy2r or ()))
+
+    def _wrap_rpyobj(self, rpyobj):
+        return rpyobj
+
+
+# Number of functions not in the symbol cache accessed in a lazy package
+# before the translations of parameters computed since are stored.
+_PRM_TRANSLATE_FLUSH_SIZE = 64
+
+_LAZY_ST_PACKAGES: 'weakref.WeakSet[LazyInstalledSTPackage]' = (
+    weakref.WeakSet()
+)
+
+
+class LazyInstalledSTPackage(_LazyPackageMixin, InstalledSTPackage):
+    """ Lazy version of :class:`InstalledSTPackage`.
+
+    The translations of parameter names in the symbol cache are used
+    for the functions accessed, but the missing ones are not computed
+    when the functions are accessed. The translations computed later
+    (for example when calling a function with named arguments) are
+    stored in the symbol cache in batches, and when Python exits. """
+
+    _prm_translate_pending: typing.Optional[
+        typing.List[SignatureTranslatedFunction]
+    ] = None
+    _prm_translate_misses = 0
+
+    def _wrap_rpyobj(self, rpyobj):
+        if isinstance(rpyobj, rinterface.Sexp) and \
+           rpyobj.typeof == rinterface.RTYPES.CLOSXP:
+            rpyobj = DocumentedSTFunction(rpyobj,
+                                          packagename=self.__rname__)
+            symbol_cache = self._symbol_cache
+            if symbol_cache is not None and rpyobj.__rname__ is not None:
+                prm_translate = symbol_cache.parameters().get(
+                    rpyobj.__rname__
+                )
+                if prm_translate is None:
+                    self._add_prm_translate_pending(rpyobj)
+                else:
+                    rpyobj._prm_translate = prm_translate.copy()
+        return rpyobj
+
+    def _add_prm_translate_pending(
+            self, func: SignatureTranslatedFunction
+    ) -> None:
+        if self._prm_translate_pending is None:
+            self._prm_translate_pending = []
+            _LAZY_ST_PACKAGES.add(self)
+        self._prm_translate_pending.append(func)
+        self._prm_translate_misses += 1
+        if self._prm_translate_misses >= _PRM_TRANSLATE_FLUSH_SIZE:
+            self._flush_prm_translate()
+
+    def _flush_prm_translate(self) -> None:
+        """ Store in the symbol cache the translations of parameter names
+        computed for functions accessed and not in the cache. """
+        self._prm_translate_misses = 0
+        pending = self._prm_translate_pending
+        if not pending or self._symbol_cache is None:
+            return
+        computed: typing.List[typing.Tuple[str, typing.Mapping[str, str]]] = []
+        not_computed = []
+        for func in pending:
+            table = func._prm_translate_table
+            if table is None or func.__rname__ is None:
+                not_computed.append(func)
+            else:
+                computed.append((func.__rname__, table))
+        self._prm_translate_pending = not_computed
+        self._symbol_cache.set_parameters(computed)
+
+
+@atexit.register
+def _flush_lazy_st_packages() -> None:
+    for package in tuple(_LAZY_ST_PACKAGES):
+        package._flush_prm_translate()
+
+
+class LazyInstalledPackage(_LazyPackageMixin, InstalledPackage):
+    """ Lazy version of :class:`InstalledPackage`. """
+    pass
+
+
 class WeakPackage(Package):
     """
     'Weak' R package, with which looking for symbols results in
@@ -436,7 +627,9 @@ def importr(name: str,
             on_conflict='fail',
             symbol_r2python=default_symbol_r2python,
             symbol_resolve=default_symbol_resolve,
-            data=True):
+            data=True,
+            lazy=False,
+            symbol_cache=None):
     """ Import an R package.
 
     Arguments:
@@ -462,6 +655,18 @@ def importr(name: str,
     - data: embed a PackageData objects under the attribute
       name __rdata__ (default: True)
 
+    - lazy: only fetch and wrap an R object the first time the
+      corresponding attribute is accessed, rather than all objects
+      in the package when importing it. Only the exported symbols of
+      packages with a namespace are then available (default: False)
+
+    - symbol_cache: path to an SQLite file, or
+      :class:`rpy2.robjects.packages_cache.SymbolCache`, in which the
+      translations of symbols and of parameter names are stored so that
+      later imports of the same version of the package do not compute
+      them again. The default is the path in the environment variable
+      RPY2_SYMBOL_CACHE, if defined (default: None)
+
     Return:
 
     - an instance of class SignatureTranslatedPackage, or of class Package
@@ -492,21 +697,39 @@ def importr(name: str,
         version = None
 
     pack: typing.Union[InstalledSTPackage, InstalledPackage]
+    package_cls: typing.Type[typing.Union[InstalledSTPackage,
+                                          InstalledPackage]]
     if signature_translation:
-        pack = InstalledSTPackage(env, name,
-                                  translation=robject_translations,
-                                  exported_names=exported_names,
-                                  on_conflict=on_conflict,
-                                  version=version,
-                                  symbol_r2python=symbol_r2python,
-                                  symbol_resolve=symbol_resolve)
+        package_cls = LazyInstalledSTPackage if lazy else InstalledSTPackage
     else:
-        pack = InstalledPackage(env, name, translation=robject_translations,
-                                exported_names=exported_names,
-                                on_conflict=on_conflict,
-                                version=version,
-                                symbol_r2python=symbol_r2python,
-                                symbol_resolve=symbol_resolve)
+        package_cls = LazyInstalledPackage if lazy else InstalledPackage
+    if symbol_cache is None:
+        symbol_cache = packages_cache.default_cache()
+    elif isinstance(symbol_cache, str):
+        symbol_cache = packages_cache.SymbolCache(symbol_cache)
+    # The translations can only be stored for packages with a version,
+    # and when the default functions to translate symbols are used.
+    package_symbol_cache = None
+    if (
+            symbol_cache is not None and
+            version is not None and
+            symbol_r2python is default_symbol_r2python and
+            symbol_resolve is default_symbol_resolve
+    ):
+        package_symbol_cache = symbol_cache.package(
+            name, version, lib_loc,
+            {'translation': robject_translations,
+             'on_conflict': on_conflict,
+             'signature_translation': bool(signature_translation),
+             'lazy': bool(lazy)}
+        )
+    pack = package_cls(env, name, translation=robject_translations,
+                       exported_names=exported_names,
+                       on_conflict=on_conflict,
+                       version=version,
+                       symbol_r2python=symbol_r2python,
+                       symbol_resolve=symbol_resolve,
+                       symbol_cache=package_symbol_cache)
     if data:
         if pack.__rdata__ is not None:
             warn('While importing the R package "%s", the rpy2 Package object '
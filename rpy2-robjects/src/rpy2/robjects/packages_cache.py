@@ -0,0 +1,223 @@
+"""
+Persistent cache of the translation of R symbols for R packages.
+
+Importing an R package with :func:`rpy2.robjects.packages.importr`
+translates the R symbols in the package into Python symbols, and the
+names of the parameters of R functions into Python names. The results
+can be stored in an SQLite file so that processes importing the same
+packages later can skip that work.
+
+The translations of a package are stored for its name, version,
+library location, the version of rpy2, and the import options. The
+file is only used by `importr()` when given a cache or when the
+environment variable `RPY2_SYMBOL_CACHE` is set to the path of the
+file.
+"""
+
+import collections
+import json
+import os
+import sqlite3
+import typing
+import warnings
+from rpy2.robjects.version import __version__
+
+ENVVAR_SYMBOL_CACHE = 'RPY2_SYMBOL_CACHE'
+
+
+def create_cache_db(dbcon) -> None:
+    """ Create the tables for the cache if they do not exist.
+
+    dbcon: database connection (SQLite)
+    """
+    dbcon.executescript('''
+CREATE TABLE IF NOT EXISTS package (
+id INTEGER PRIMARY KEY,
+name TEXT,
+version TEXT,
+lib_loc TEXT,
+rpy2_version TEXT,
+options TEXT,
+UNIQUE (name, version, lib_loc, rpy2_version, options)
+);
+CREATE TABLE IF NOT EXISTS symbol (
+package_id INTEGER, pyname TEXT, rname TEXT
+);
+CREATE INDEX IF NOT EXISTS symbol_package_idx ON symbol (package_id);
+CREATE TABLE IF NOT EXISTS parameters (
+package_id INTEGER, rname TEXT, translation TEXT,
+UNIQUE (package_id, rname)
+);
+''')
+    dbcon.commit()
+
+
+class SymbolCache(object):
+    """ SQLite file with the translation of R symbols for R packages.
+
+    The cache is only an optimization: errors accessing the file are
+    reported with a warning and the translations are then computed
+    as if the cache was empty.
+    """
+
+    _path: str
+
+    def __init__(self, path: str, timeout: float = 10):
+        self._path = path
+        self._dbcon = sqlite3.connect(path, timeout=timeout,
+                                      check_same_thread=False)
+        create_cache_db(self._dbcon)
+
+    path = property(lambda self: self._path)
+
+    def close(self) -> None:
+        self._dbcon.close()
+
+    def package(self, name: str,
+                version: str,
+                lib_loc: typing.Optional[str],
+                options: dict) -> 'PackageSymbolCache':
+        """ Cache entry for an R package.
+
+        - name: name of the R package
+        - version: version of the R package
+        - lib_loc: location of the R library (or None)
+        - options: options for the translation (JSON-serializable)
+        """
+        return PackageSymbolCache(
+            self, (name, version, lib_loc or '', __version__,
+                   json.dumps(options, sort_keys=True))
+        )
+
+    def _execute(self, sql: str, parameters=()) -> typing.List[tuple]:
+        try:
+            return self._dbcon.execute(sql, parameters).fetchall()
+        except sqlite3.Error as err:
+            warnings.warn('Error with the symbol cache %s: %s' %
+                          (self._path, err))
+            return []
+
+    def _transaction(self, func: typing.Callable[[typing.Any], None]) -> None:
+        dbcon = self._dbcon
+        try:
+            with dbcon:
+                func(dbcon)
+        except sqlite3.Error as err:
+            warnings.warn('Error with the symbol cache %s: %s' %
+                          (self._path, err))
+
+
+_DEFAULT_CACHES: typing.Dict[str, SymbolCache] = {}
+
+
+def default_cache() -> typing.Optional[SymbolCache]:
+    """ Cache for the path in the environment variable
+    RPY2_SYMBOL_CACHE, or None if not set. """
+    path = os.environ.get(ENVVAR_SYMBOL_CACHE)
+    if not path:
+        return None
+    res = _DEFAULT_CACHES.get(path)
+    if res is None:
+        try:
+            res = SymbolCache(path)
+        except sqlite3.Error as err:
+            warnings.warn('Error with the symbol cache %s: %s' %
+                          (path, err))
+            return None
+        _DEFAULT_CACHES[path] = res
+    return res
+
+
+class PackageSymbolCache(object):
+    """ Translations of R symbols for one R package in a SymbolCache. """
+
+    def __init__(self, cache: SymbolCache, key: tuple):
+        self._cache = cache
+        self._key = key
+        self._parameters: typing.Optional[
+            typing.Dict[str, collections.OrderedDict]
+        ] = None
+
+    def _package_id(self) -> typing.Optional[int]:
+        res = self._cache._execute(
+            'SELECT id FROM package WHERE name=? AND version=? '
+            'AND lib_loc=? AND rpy2_version=? AND options=?',
+            self._key
+        )
+        return res[0][0] if res else None
+
+    def symbols(self) -> typing.Optional[typing.List[typing.Tuple[str, str]]]:
+        """ Pairs (Python symbol, R symbol), or None if not cached. """
+        package_id = self._package_id()
+        if package_id is None:
+            return None
+        return [tuple(row) for row in self._cache._execute(
+            'SELECT pyname, rname FROM symbol WHERE package_id=? '
+            'ORDER BY rowid', (package_id, )
+        )]
+
+    def set_symbols(self,
+                    symbols: typing.Iterable[typing.Tuple[str, str]]) -> None:
+        """ Store the pairs (Python symbol, R symbol). """
+        symbols = tuple(symbols)
+
+        def insert(dbcon):
+            cursor = dbcon.execute(
+                'INSERT OR IGNORE INTO package '
+                '(name, version, lib_loc, rpy2_version, options) '
+                'VALUES (?, ?, ?, ?, ?)', self._key
+            )
+            # Nothing to do if an other process stored the symbols.
+            if cursor.rowcount == 1:
+                dbcon.executemany(
+                    'INSERT INTO symbol VALUES (?, ?, ?)',
+                    ((cursor.lastrowid, pyname, rname)
+                     for pyname, rname in symbols)
+                )
+
+        self._cache._transaction(insert)
+
+    def parameters(self) -> typing.Dict[str, collections.OrderedDict]:
+        """ Translation of parameter names for functions, by R symbol.
+
+        The translations are read from the file once."""
+        if self._parameters is None:
+            package_id = self._package_id()
+            rows = [] if package_id is None else self._cache._execute(
+                'SELECT rname, translation FROM parameters '
+                'WHERE package_id=?', (package_id, )
+            )
+            self._parameters = {
+                rname: collections.OrderedDict(json.loads(translation))
+                for rname, translation in rows
+            }
+        return self._parameters
+
+    def set_parameters(
+            self,
+            translations: typing.Iterable[
+                typing.Tuple[str, typing.Mapping[str, str]]
+            ]
+    ) -> None:
+        """ Store the translations of parameter names for functions.
+
+        - translations: pairs (R symbol, translation)
+        """
+        translations = tuple(translations)
+        if not translations:
+            return
+        parameters = self.parameters()
+        for rname, translation in translations:
+            parameters[rname] = collections.OrderedDict(translation)
+        package_id = self._package_id()
+        if package_id is None:
+            return
+
+        def insert(dbcon):
+            dbcon.executemany(
+                'INSERT OR REPLACE INTO parameters VALUES (?, ?, ?)',
+                ((package_id, rname, json.dumps(list(translation.items())))
+                 for rname, translation in translations)
+            )
+
+        self._cache._transaction(insert)
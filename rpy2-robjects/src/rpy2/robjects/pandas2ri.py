@@ -13,6 +13,7 @@ import datetime
 import functools
 import math
 import numpy  # type: ignore
+import tzlocal
 import pandas  # type: ignore
 import pandas.core.series  # type: ignore
 from pandas.core.frame import DataFrame as PandasDataFrame  # type: ignore
@@ -28,7 +29,8 @@ from rpy2.robjects.vectors import (BoolVector,
                                    FloatSexpVector,
                                    StrVector,
                                    IntVector,
-                                   POSIXct)
+                                   POSIXct,
+                                   get_timezone)
 
 # The pandas converter requires numpy.
 import rpy2.robjects.numpy2ri as numpy2ri
@@ -37,6 +39,7 @@ original_converter = None
 
 ISOdatetime = rinterface.baseenv['ISOdatetime']
 as_vector = rinterface.baseenv['as.vector']
+as_character = rinterface.baseenv['as.character']
 
 converter = conversion.Converter('original pandas conversion')
 py2rpy = converter.py2rpy
@@ -50,6 +53,73 @@ integer_array_types = ('Int8', 'Int16', 'Int32', 'Int64', 'UInt8',
                        'UInt16', 'UInt32', 'UInt64')
 
 
+_DATAFRAME_COLUMN_RTYPES = frozenset(
+    (rinterface.RTYPES.LGLSXP, rinterface.RTYPES.INTSXP,
+     rinterface.RTYPES.REALSXP, rinterface.RTYPES.CPLXSXP,
+     rinterface.RTYPES.STRSXP, rinterface.RTYPES.RAWSXP)
+)
+
+
+def _index_to_names(index):
+    return StrVector(tuple(str(x) for x in index))
+
+
+def _dataframe_rownames(names):
+    """Build the R row names R's data.frame() would set from
+    the names of its columns."""
+    if any(names) and len(set(names)) == len(names):
+        return StrSexpVector(names)
+    else:
+        # Automatic row names, in R's compact form.
+        return IntSexpVector([rinterface.NA_Integer, -len(names)])
+
+
+def _py2rpy_pandasdataframe_columns(obj):
+    """Convert the columns in a pandas DataFrame to R vectors
+    without names."""
+    columns = OrderedDict()
+    for name, values in obj.items():
+        try:
+            columns[name] = _py2rpy_pandasseries_values(values)
+        except Exception as e:
+            warnings.warn('Error while trying to convert '
+                          'the column "%s". Fall back to string conversion. '
+                          'The error is: %s'
+                          % (name, str(e)))
+            columns[name] = _py2rpy_pandasseries_values(
+                values.astype('string')
+            )
+    return columns
+
+
+def _py2rpy_pandasdataframe_columnar(obj):
+    """Build an R data.frame from the columns of a pandas DataFrame.
+
+    The result is identical to what R's data.frame() returns
+    when called with the columns converted by py2rpy_pandasseries()
+    (see py2rpy_pandasdataframe()), but the list of columns
+    and its attributes are created directly."""
+    columns = _py2rpy_pandasdataframe_columns(obj)
+    rownames = [str(x) for x in obj.index]
+    nrows = len(rownames)
+    if not all(
+            col.typeof in _DATAFRAME_COLUMN_RTYPES
+            and len(col) == nrows
+            and 'dim' not in col.list_attrs()
+            for col in columns.values()
+    ):
+        # Let R's data.frame() handle other kinds of columns.
+        index_names = StrVector(rownames)
+        for col in columns.values():
+            col.do_slot_assign('names', index_names)
+        return DataFrame(columns)
+    res = ListSexpVector(list(columns.values()))
+    res.do_slot_assign('names', StrSexpVector([str(k) for k in columns]))
+    res.do_slot_assign('row.names', _dataframe_rownames(rownames))
+    res.rclass = StrSexpVector(('data.frame',))
+    return DataFrame(res)
+
+
 @py2rpy.register(PandasDataFrame)
 def py2rpy_pandasdataframe(obj):
     if obj.index.duplicated().any():
@@ -57,16 +127,26 @@ def py2rpy_pandasdataframe(obj):
                       'which will lead to loss of the row names in the '
                       'resulting data.frame')
 
+    cv = conversion.converter_ctx.get()
+    names = [str(x) for x in obj.columns]
+    if (
+            len(obj.index) > 0 and len(names) > 0
+            and all(names) and 'stringsAsFactors' not in names
+            and (cv.py2rpy.dispatch(pandas.core.series.Series)
+                 is py2rpy_pandasseries)
+    ):
+        return _py2rpy_pandasdataframe_columnar(obj)
+
     od = OrderedDict()
     for name, values in obj.items():
         try:
-            od[name] = conversion.converter_ctx.get().py2rpy(values)
+            od[name] = cv.py2rpy(values)
         except Exception as e:
             warnings.warn('Error while trying to convert '
                           'the column "%s". Fall back to string conversion. '
                           'The error is: %s'
                           % (name, str(e)))
-            od[name] = conversion.converter_ctx.get().py2rpy(
+            od[name] = cv.py2rpy(
                 values.astype('string')
             )
 
@@ -86,16 +166,30 @@ def py2rpy_pandasindex(obj):
         return numpy2ri.numpy2rpy(obj)
 
 
+def _categories_to_levels(categories):
+    """Convert the categories of a pandas Categorical to R factor levels.
+
+    Numerical categories are formatted by R's as.character(), as R's
+    factor() would do. Other categories are formatted by Python."""
+    if categories.dtype.kind in ('b', 'i', 'u', 'f'):
+        return as_character(
+            numpy2ri.numpy2rpy(categories.to_numpy())
+        )
+    else:
+        return StrSexpVector(list(categories.astype(str)))
+
+
 @py2rpy.register(pandas.Categorical)
 def py2rpy_categorical(obj):
-    for c in obj.categories:
-        if not isinstance(c, str):
-            raise ValueError('Converting pandas "Category" series to '
-                             'R factor is only possible when categories '
-                             'are strings.')
-    res = IntSexpVector(list(rinterface.NA_Integer if x == -1 else x+1
-                             for x in obj.codes))
-    res.do_slot_assign('levels', StrSexpVector(obj.categories))
+    codes = numpy.ascontiguousarray(obj.codes, dtype=numpy.intc)
+    res = IntSexpVector.from_memoryview(memoryview(codes))
+    # The codes are shifted to R's 1-based indexing, and the missing
+    # values (code -1) set to NA, in the buffer of the R vector.
+    values = numpy.asarray(res)
+    is_na = values == -1
+    values += 1
+    values[is_na] = int(rinterface.NA_Integer)
+    res.do_slot_assign('levels', _categories_to_levels(obj.categories))
     if obj.ordered:
         res.rclass = StrSexpVector(('ordered', 'factor'))
     else:
@@ -165,8 +259,140 @@ _PANDASTYPE2RPY2 = {
 }
 
 
-@py2rpy.register(pandas.core.series.Series)
-def py2rpy_pandasseries(obj):
+def _numpy1d_to_rvector(values):
+    """Create an R vector from a 1D numpy array of numbers or booleans.
+
+    This gives the same result as the conversion through numpy2ri
+    followed by R's as.vector(), without calling R functions. None is
+    returned if the array is not of a type handled here."""
+    if not isinstance(values, numpy.ndarray) or values.ndim != 1:
+        return None
+    dtype = values.dtype
+    if not dtype.isnative:
+        return None
+    if dtype.kind == 'f':
+        return rinterface.FloatSexpVector.from_memoryview(
+            memoryview(numpy.ascontiguousarray(values, dtype=numpy.float64))
+        )
+    elif dtype.kind in ('i', 'u'):
+        if dtype.itemsize > 4 or (dtype.kind == 'u' and dtype.itemsize > 2):
+            if dtype.kind == 'u':
+                return None
+            if len(values) and (values.min() < numpy.iinfo(numpy.intc).min
+                                or
+                                values.max() > numpy.iinfo(numpy.intc).max):
+                raise OverflowError(
+                    'Integer values out of the range for R integers.'
+                )
+        return rinterface.IntSexpVector.from_memoryview(
+            memoryview(numpy.ascontiguousarray(values, dtype=numpy.intc))
+        )
+    elif dtype.kind == 'b':
+        return rinterface.BoolSexpVector.from_memoryview(
+            memoryview(numpy.ascontiguousarray(values, dtype=numpy.intc))
+        )
+    else:
+        return None
+
+
+def _tz_name(tz):
+    if tz is None:
+        tzname = ''
+    elif tz is datetime.timezone.utc:
+        tzname = 'UTC'
+    elif hasattr(tz, 'zone'):
+        tzname = tz.zone
+    elif hasattr(tz, 'key'):
+        tzname = tz.key
+    else:
+        warnings.warn('Unable to get time zone from ZoneInfo object.')
+        tzname = ''
+    return tzname
+
+
+def _datetimeseries_to_posixct(obj):
+    """Convert a pandas Series of datetime64 values to an R POSIXct vector.
+
+    Time zone-naive values are wall-clock times in the local time zone,
+    which is what R assumes for a POSIXct vector with an empty
+    "tzone" attribute."""
+    if obj.dt.tz is None:
+        tzname = ''
+        # DST-ambiguous times are mapped to DST, nonexistent times
+        # are missing.
+        obj = obj.dt.tz_localize(
+            tzlocal.get_localzone(),
+            ambiguous=numpy.ones(len(obj), dtype=bool),
+            nonexistent='NaT'
+        )
+    else:
+        tzname = _tz_name(obj.dt.tz)
+    # numpy datetime64 values are in UTC.
+    values = obj.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+    seconds = (
+        (values - numpy.datetime64(0, 's')) / numpy.timedelta64(1, 's')
+    )
+    seconds[numpy.isnat(values)] = na_values.NA_Real
+    return POSIXct(POSIXct.sexp_from_seconds(seconds, tzname))
+
+
+def _arrowstrings_to_rvector(obj):
+    """Convert a pandas Series of Arrow strings to an R vector.
+
+    The R vector is built from the UTF-8 data and offsets in the
+    Arrow buffers, without creating Python strings. None is returned
+    if the Series is not backed by an Arrow array of strings."""
+    if not (isinstance(obj.dtype, pandas.ArrowDtype)
+            or
+            getattr(obj.dtype, 'storage', None) in ('pyarrow',
+                                                    'pyarrow_numpy')):
+        return None
+    arr = obj.array.__arrow_array__()
+    if hasattr(arr, 'combine_chunks'):
+        arr = arr.combine_chunks()
+    if str(arr.type) == 'string':
+        offsets_dtype = numpy.int32
+    elif str(arr.type) == 'large_string':
+        offsets_dtype = numpy.int64
+    else:
+        return None
+    _, offsets_buf, data_buf = arr.buffers()
+    if offsets_buf is None:
+        return None
+    offsets = numpy.frombuffer(
+        offsets_buf, dtype=offsets_dtype
+    )[arr.offset:(arr.offset + len(arr) + 1)]
+    lengths = numpy.diff(offsets)
+    if len(lengths) and lengths.max() > numpy.iinfo(numpy.intc).max:
+        return None
+    lengths = lengths.astype(numpy.intc)
+    if arr.null_count:
+        is_null = arr.is_null().to_numpy(zero_copy_only=False)
+        if lengths[is_null].any():
+            # Missing values with data cannot be skipped.
+            return None
+        lengths[is_null] = -1
+    if data_buf is None:
+        data = b''
+    else:
+        data = memoryview(data_buf)[offsets[0]:offsets[-1]]
+    return StrVector(StrSexpVector.from_utf8_buffer(data, lengths))
+
+
+def _strseries_to_rvector(obj):
+    """Convert a pandas Series of strings, with missing values, to
+    an R vector of strings."""
+    res = _arrowstrings_to_rvector(obj)
+    if res is None:
+        # Missing values (pandas.NA, None, or NaN) are set to None
+        # by pandas, and None is NA for the bulk conversion.
+        values = obj.to_numpy(dtype=object, na_value=None)
+        res = StrVector(StrSexpVector(values.tolist()))
+    return res
+
+
+def _py2rpy_pandasseries_values(obj):
+    """Convert a pandas Series to an R vector, ignoring its index."""
     if obj.dtype.name == 'O':
         warnings.warn('Element "%s" is of dtype "O" and converted '
                       'to R vector of strings.' % obj.name)
@@ -175,30 +401,9 @@ def py2rpy_pandasseries(obj):
         res = py2rpy_categorical(obj.cat)
         res = FactorVector(res)
     elif is_datetime64_any_dtype(obj.dtype):
-        # time series
-        if obj.dt.tz:
-            if obj.dt.tz is datetime.timezone.utc:
-                tzname = 'UTC'
-            elif hasattr(obj.dt.tz, 'zone'):
-                tzname = obj.dt.tz.zone
-            elif hasattr(obj.dt.tz, 'key'):
-                tzname = obj.dt.tz.key
-            else:
-                warnings.warn('Unable to get time zone from ZoneInfo object.')
-        else:
-            tzname = ''
-        d = [IntVector([x.year for x in obj]),
-             IntVector([x.month for x in obj]),
-             IntVector([x.day for x in obj]),
-             IntVector([x.hour for x in obj]),
-             IntVector([x.minute for x in obj]),
-             FloatSexpVector([x.second + x.microsecond * 1e-6 for x in obj])]
-        res = ISOdatetime(*d, tz=StrSexpVector([tzname]))
-        # TODO: can the POSIXct be created from the POSIXct constructor ?
-        # (is '<M8[ns]' mapping to Python datetime.datetime ?)
-        res = POSIXct(res)
+        res = _datetimeseries_to_posixct(obj)
     elif obj.dtype.type is str:
-        res = _PANDASTYPE2RPY2[str](obj)
+        res = _strseries_to_rvector(obj)
     elif obj.dtype.name in integer_array_types:
         res = _PANDASTYPE2RPY2[int](obj)
         if len(obj.shape) == 1:
@@ -228,20 +433,26 @@ def py2rpy_pandasseries(obj):
     elif type(obj.dtype) in (pandas.Float64Dtype, pandas.BooleanDtype):
         res = _PANDASTYPE2RPY2[type(obj.dtype)](obj)
     else:
-        # converted as a numpy array
-        func = numpy2ri.converter.py2rpy.registry[numpy.ndarray]
-        # current conversion as performed by numpy
+        res = _numpy1d_to_rvector(obj.values)
+        if res is None:
+            # converted as a numpy array
+            func = numpy2ri.converter.py2rpy.registry[numpy.ndarray]
+            # current conversion as performed by numpy
+
+            res = func(obj.values)
+            if len(obj.shape) == 1:
+                if (obj.dtype != dt_O_type):
+                    # force into an R vector
+                    res = as_vector(res)
+    return res
 
-        res = func(obj.values)
-        if len(obj.shape) == 1:
-            if (obj.dtype != dt_O_type):
-                # force into an R vector
-                res = as_vector(res)
 
+@py2rpy.register(pandas.core.series.Series)
+def py2rpy_pandasseries(obj):
+    res = _py2rpy_pandasseries_values(obj)
     # "index" is equivalent to "names" in R
     if obj.ndim == 1:
-        res.do_slot_assign('names',
-                           StrVector(tuple(str(x) for x in obj.index)))
+        res.do_slot_assign('names', _index_to_names(obj.index))
     else:
         res.do_slot_assign('dimnames',
                            SexpVector(conversion.converter_ctx
@@ -259,14 +470,47 @@ def ri2py_vector(obj):
 def rpy2py_floatvector(obj):
     if POSIXct.isrinstance(obj):
         return rpy2py(POSIXct(obj))
+    elif DateVector.isrinstance(obj):
+        return rpy2py(DateVector(obj))
     else:
         return numpy2ri.rpy2py(obj)
 
 
 @rpy2py.register(POSIXct)
 def rpy2py_posixct(obj):
-    return pandas.to_datetime(tuple(obj.iter_localized_datetime()),
-                              errors='coerce')
+    """Convert an R POSIXct vector to a pandas DatetimeIndex.
+
+    The number of seconds since the epoch is read from the R vector
+    without a copy, rounded to the microsecond, and the timezone in the
+    R attribute "tzone" is used as the pandas timezone (the local
+    timezone if empty, as in R)."""
+    try:
+        r_tzone_name = obj.do_slot('tzone')[0]
+    except LookupError:
+        warnings.warn('R object inheriting from "POSIXct" but without '
+                      'attribute "tzone".')
+        r_tzone_name = ''
+    if r_tzone_name == '':
+        tz = get_timezone()
+    else:
+        tz = r_tzone_name
+    seconds = numpy.asarray(obj)
+    res = pandas.to_datetime(numpy.round(seconds * 1e6),
+                             unit='us', utc=True)
+    return res.tz_convert(tz)
+
+
+@rpy2py.register(DateVector)
+def rpy2py_date(obj):
+    """Convert an R Date vector to a pandas DatetimeIndex.
+
+    The number of days since the epoch is read from the R vector
+    without a copy and fractional days are rounded down."""
+    days = numpy.asarray(obj)
+    is_na = numpy.isnan(days)
+    values = numpy.full(len(days), 'NaT', dtype='datetime64[D]')
+    values[~is_na] = numpy.floor(days[~is_na]).astype(numpy.int64)
+    return pandas.DatetimeIndex(values)
 
 
 def _records_to_columns(obj):
@@ -345,7 +589,9 @@ def rpy2py_dataframe(obj):
 
 
 def _to_pandas_factor(obj):
-    codes = [x-1 if x > 0 else -1 for x in numpy.array(obj)]
+    values = numpy.asarray(obj)
+    codes = values - 1
+    codes[values <= 0] = -1
     res = pandas.Categorical.from_codes(
         codes,
         categories=list(obj.do_slot('levels')),
@@ -0,0 +1,275 @@
+"""
+Pool of worker processes with an embedded R.
+
+R is initialized, and R packages are loaded, in the parent process before
+the worker processes are forked. The workers share the memory pages
+for R and the packages with the parent (copy-on-write), and start
+without having to initialize R or to load packages again.
+
+R functions are called in the workers by name, with the arguments and
+the results sent through pipes as pickled objects (R objects are
+serialized by R when pickled).
+
+.. code-block:: python
+
+   from rpy2.robjects.pool import WorkerPool
+
+   with WorkerPool(4, packages=('stats', )) as pool:
+       future = pool.submit('stats::median', robjects.FloatVector((1, 2, 3)))
+       future.result()
+
+This requires the "fork" start method for processes, which is not
+available on Windows.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import typing
+import rpy2.rinterface as rinterface
+from rpy2.rinterface_lib import openrlib
+import rpy2.robjects as robjects
+from rpy2.robjects.packages import importr
+
+
+class WorkerError(RuntimeError):
+    """A worker process ended before returning the result of a task."""
+    pass
+
+
+def _rss() -> int:
+    """Resident set size (in bytes) of the current process."""
+    import resource
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # Peak resident set size, in kilobytes except on macOS.
+        res = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return res if sys.platform == 'darwin' else res * 1024
+
+
+def _find_function(name: str):
+    """Find an R function by name (possibly with a namespace
+    as in "stats::median")."""
+    if '::' in name:
+        return robjects.r(name)
+    else:
+        return robjects.globalenv.find(name, wantfun=True)
+
+
+def _worker_main(conn, maxtasksperchild: typing.Optional[int],
+                 max_rss: typing.Optional[int]) -> None:
+    """Loop of a worker process: run tasks until told to stop or to retire."""
+    # The locks of rpy2 that other threads in the parent process may
+    # have been holding when the process was forked are replaced by the
+    # modules defining them (see os.register_at_fork()).
+    functions: typing.Dict[str, typing.Any] = {}
+    ntasks = 0
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        name, args, kwargs = task
+        try:
+            function = functions.get(name)
+            if function is None:
+                function = functions[name] = _find_function(name)
+            res: tuple = ('result', function(*args, **kwargs))
+        except Exception as e:
+            res = ('error', e)
+        ntasks += 1
+        retire = (
+            (maxtasksperchild is not None and ntasks >= maxtasksperchild)
+            or
+            (max_rss is not None and _rss() > max_rss)
+        )
+        try:
+            conn.send(res + (retire, ))
+        except Exception as e:
+            # The result (or the exception) cannot be pickled.
+            conn.send(('error',
+                       RuntimeError(f'Unable to send the result: {e!r}'),
+                       retire))
+        if retire:
+            break
+    conn.close()
+
+
+class _Worker(typing.NamedTuple):
+    process: multiprocessing.process.BaseProcess
+    conn: typing.Any
+
+
+class WorkerPool(object):
+    """Pool of worker processes forked from a process with R initialized.
+
+    :param processes: number of worker processes. If None, the number
+    of CPUs is used.
+    :param packages: names of R packages to load before the workers
+    are forked.
+    :param maxtasksperchild: number of tasks after which a worker is
+    replaced with a new one (None for no limit).
+    :param max_rss: resident set size (in bytes) above which a worker is
+    replaced with a new one after the task it was running (None for no
+    limit).
+    """
+
+    def __init__(self, processes: typing.Optional[int] = None,
+                 packages: typing.Iterable[str] = (),
+                 maxtasksperchild: typing.Optional[int] = None,
+                 max_rss: typing.Optional[int] = None):
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError('The number of processes must be at least 1.')
+        if maxtasksperchild is not None and maxtasksperchild < 1:
+            raise ValueError('maxtasksperchild must be at least 1.')
+        self._ctx = multiprocessing.get_context('fork')
+        self._maxtasksperchild = maxtasksperchild
+        self._max_rss = max_rss
+        rinterface.initr()
+        self._packages = tuple(packages)
+        for name in self._packages:
+            importr(name, on_conflict='warn')
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._spawn_lock = threading.Lock()
+        self._workers: typing.Dict[int, _Worker] = {}
+        # All workers are forked before starting the threads
+        # managing them.
+        for i in range(processes):
+            self._workers[i] = self._spawn()
+        self._threads = tuple(
+            threading.Thread(target=self._manage, args=(i, ), daemon=True)
+            for i in range(processes)
+        )
+        for thread in self._threads:
+            thread.start()
+
+    packages = property(lambda self: self._packages)
+
+    @property
+    def pids(self) -> typing.Tuple[typing.Optional[int], ...]:
+        """Process IDs of the current workers."""
+        return tuple(w.process.pid for w in self._workers.values())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._maxtasksperchild, self._max_rss),
+            daemon=True
+        )
+        # Fork while R is not evaluating anything in this process.
+        with self._spawn_lock, openrlib.rlock:
+            process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _respawn(self, i: int) -> _Worker:
+        worker = self._workers[i]
+        worker.conn.close()
+        worker.process.join()
+        self._workers[i] = self._spawn()
+        return self._workers[i]
+
+    def _manage(self, i: int) -> None:
+        """Loop of a thread sending tasks to the worker i."""
+        worker = self._workers[i]
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                try:
+                    worker.conn.send(None)
+                except OSError:
+                    pass
+                worker.conn.close()
+                worker.process.join()
+                return
+            future, name, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                worker.conn.send((name, args, kwargs))
+                status, value, retire = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.process.join()
+                future.set_exception(
+                    WorkerError(f'The worker process {worker.process.pid} '
+                                'ended with exit code '
+                                f'{worker.process.exitcode}.')
+                )
+                worker = self._respawn(i)
+                continue
+            except Exception as e:
+                # Arguments or result that cannot be pickled/unpickled.
+                future.set_exception(e)
+                continue
+            if status == 'error':
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+            if retire:
+                worker = self._respawn(i)
+
+    def submit(self, name: str, /,
+               *args, **kwargs) -> concurrent.futures.Future:
+        """Call an R function in a worker process.
+
+        :param name: name of the R function. It is looked for from the
+        R global environment in the worker, or in a namespace if the name
+        is of the form "<package>::<function>".
+        :param args: positional arguments for the R function.
+        :param kwargs: named arguments for the R function.
+        :return: a future for the result."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit tasks after shutdown.')
+            self._tasks.put((future, name, args, kwargs))
+        return future
+
+    def map(self, name: str,
+            *iterables) -> typing.List[concurrent.futures.Future]:
+        """Call an R function in worker processes for each set of
+        arguments taken from the iterables.
+
+        :return: a list of futures for the results."""
+        return [self.submit(name, *args) for args in zip(*iterables)]
+
+    def shutdown(self, wait: bool = True,
+                 cancel_futures: bool = False) -> None:
+        """Stop the worker processes once the pending tasks are done.
+
+        :param wait: wait for the worker processes to have stopped.
+        :param cancel_futures: cancel the pending tasks rather
+        than running them."""
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                if cancel_futures:
+                    while True:
+                        try:
+                            item = self._tasks.get_nowait()
+                        except queue.Empty:
+                            break
+                        item[0].cancel()
+                for thread in self._threads:
+                    self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown(wait=True)
@@ -57,6 +57,21 @@ def test_NameClassMap():
     assert ncm.find(classnames) is tuple
 
 
+def test_NameClassMap_find_rclass():
+    ncm = conversion.NameClassMap(object)
+    x = rinterface.IntSexpVector([1, 2])
+    x.rclass = rinterface.StrSexpVector(['A', 'B'])
+    assert ncm.find_rclass(x) is object
+    ncm['B'] = list
+    assert ncm.find_rclass(x) is list
+    assert len(ncm._rclass_cache) == 1
+    assert ncm.find_rclass(x) is list
+    assert ncm.find_rclass(x, lineage=lambda rclass: ('A', )) is object
+    with conversion.NameClassMapContext(ncm, {'A': tuple}):
+        assert ncm.find_rclass(x) is tuple
+    assert ncm.find_rclass(x) is list
+
+
 def test_NameClassMapContext():
     ncm = conversion.NameClassMap(object)
     assert not len(ncm._map)
@@ -91,6 +106,47 @@ def test_Converter_rclass_map_context():
     assert not len(ncm._map)
 
 
+def test_context_copy_on_write():
+    converter = robjects.default_converter
+
+    class Foo(object):
+        pass
+
+    class FooEnv(robjects.Environment):
+        pass
+
+    with conversion.localconverter(converter) as cv:
+        assert cv.py2rpy.registry is converter.py2rpy.registry
+        assert cv.py2rpy(1) == 1
+        cv.py2rpy.register(Foo, lambda obj: rinterface.NULL)
+        cv.rpy2py_nc_map[rinterface.SexpEnvironment]['A'] = FooEnv
+        assert cv.py2rpy(Foo()) is rinterface.NULL
+        assert cv.py2rpy(1) == 1
+        assert Foo not in converter.py2rpy.registry
+        assert 'A' not in converter.rpy2py_nc_map[rinterface.SexpEnvironment]
+        assert (set(cv.rpy2py_nc_map.keys()) ==
+                set(converter.rpy2py_nc_map.keys()))
+
+
+def test_context_copy_on_write_parent():
+    converter = robjects.default_converter + robjects.Converter('foo')
+
+    class Foo(object):
+        pass
+
+    class FooEnv(robjects.Environment):
+        pass
+
+    with conversion.localconverter(converter) as cv:
+        converter.py2rpy.register(Foo, lambda obj: rinterface.NULL)
+        converter.rpy2py_nc_map[rinterface.SexpEnvironment]['A'] = FooEnv
+        assert Foo not in cv.py2rpy.registry
+        assert 'A' not in cv.rpy2py_nc_map[rinterface.SexpEnvironment]
+        assert cv.py2rpy(1) == 1
+    assert converter.py2rpy(Foo()) is rinterface.NULL
+    assert 'A' in converter.rpy2py_nc_map[rinterface.SexpEnvironment]
+
+
 @pytest.fixture(scope='module')
 def _set_class_AB():
     robjects.r('A <- methods::setClass("A", representation(x="integer"))')
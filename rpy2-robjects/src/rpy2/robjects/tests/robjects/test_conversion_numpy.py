@@ -83,6 +83,20 @@ class TestNumpyConversions(object):
         u_r = self.check_homogeneous(u, "character", "character")
         assert tuple(l) == tuple(u_r)
 
+    def test_vector_unicode_character_non_ascii(self):
+        l = ['a', '\u21a7\u767e', '', '\U0001f600']
+        u = numpy.array(l, dtype='U')
+        u_r = self.check_homogeneous(u, 'character', 'character')
+        assert tuple(l) == tuple(u_r)
+
+    def test_vector_unicode_character_rpy2py(self):
+        with (robjects.default_converter + rpyn.converter).context() as cv:
+            res = cv.rpy2py(
+                rinterface.StrSexpVector(['a', '\u21a7\u767e', ''])
+            )
+        assert res.dtype == numpy.dtype('U2')
+        assert tuple(res) == ('a', '\u21a7\u767e', '')
+
     def test_vector_bytes(self):
         l = [b'a', b'b', b'c']
         s = numpy.array(l, dtype = '|S1')
@@ -265,6 +279,7 @@ def test_unsignednumpyint_to_rint(dtype):
 @pytest.mark.parametrize('values,expected_cls',
                          ((['a', 1, 2], robjects.vectors.ListVector),
                           (['a', 'b', 'c'], rinterface.StrSexpVector),
+                          (['a', None, 'c'], rinterface.StrSexpVector),
                           ([b'a', b'b', b'c'], rinterface.ByteSexpVector)))
 def test_numpy_O_py2rpy(values, expected_cls):
     a = numpy.array(values, dtype='O')
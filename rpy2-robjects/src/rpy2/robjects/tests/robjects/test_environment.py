@@ -23,6 +23,16 @@ def test_getsetitem():
     assert a[0] == 123
 
 
+@pytest.mark.parametrize('copy', (True, False))
+def test_assign(copy):
+    env = robjects.Environment()
+    x = robjects.IntVector([1, 2])
+    env.assign('x', x, copy=copy)
+    assert (env['x'].rid == x.rid) is not copy
+    env.assign('y', 123, copy=copy)
+    assert env['y'][0] == 123
+
+
 def test_keys():
     env = robjects.Environment()
     env['a'] = 123
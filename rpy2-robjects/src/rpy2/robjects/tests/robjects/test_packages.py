@@ -95,6 +95,58 @@ class TestImportr(object):
                                           on_conflict='warn')
         assert isinstance(stats, robjects.packages.Package)
 
+    @pytest.mark.parametrize('signature_translation', (True, False))
+    def test_importr_lazy(self, signature_translation):
+        stats = robjects.packages.importr(
+            'stats', on_conflict='warn', lazy=True,
+            signature_translation=signature_translation
+        )
+        assert isinstance(stats, robjects.packages.Package)
+        assert 't_test' in dir(stats)
+        assert 't_test' not in stats.__dict__
+        assert isinstance(stats.t_test, robjects.functions.Function)
+        assert 't_test' in stats.__dict__
+        assert stats.t_test.__rname__ == 't.test'
+        if signature_translation:
+            assert isinstance(stats.t_test,
+                              robjects.functions.DocumentedSTFunction)
+        with pytest.raises(AttributeError):
+            stats.foo_bar_not_in_stats
+
+    @pytest.mark.parametrize('lazy', (True, False))
+    def test_importr_symbol_cache(self, tmp_path, monkeypatch, lazy):
+        path = str(tmp_path / 'symbols.sqlite')
+        stats = robjects.packages.importr('stats', on_conflict='warn',
+                                          lazy=lazy, symbol_cache=path)
+        prm_translate = stats.t_test._prm_translate
+        if lazy:
+            # Translations computed after a function is accessed are
+            # stored in batches.
+            stats._flush_prm_translate()
+
+        def map_symbols(*args, **kwargs):
+            raise AssertionError('The symbols should be in the cache.')
+
+        monkeypatch.setattr(packages, '_map_symbols', map_symbols)
+        stats_cached = robjects.packages.importr('stats', on_conflict='warn',
+                                                 lazy=lazy, symbol_cache=path)
+        assert stats_cached._rpy2r == stats._rpy2r
+        assert stats_cached._exported_names == stats._exported_names
+        assert (stats_cached.t_test._prm_translate_table
+                == prm_translate)
+
+    def test_importr_lazy_symbol_cache_deferred(self, tmp_path):
+        path = str(tmp_path / 'symbols.sqlite')
+        stats = robjects.packages.importr('stats', on_conflict='warn',
+                                          lazy=True, symbol_cache=path)
+        # Accessing a function does not translate its parameters.
+        assert stats.t_test._prm_translate_table is None
+        stats._flush_prm_translate()
+        assert 't.test' not in stats._symbol_cache.parameters()
+        stats.t_test._prm_translate
+        stats._flush_prm_translate()
+        assert 't.test' in stats._symbol_cache.parameters()
+
     def test_import_stats_with_libloc(self):
         path = os.path.dirname(
             robjects.packages_utils.get_packagepath('stats')
@@ -94,6 +94,30 @@ class TestPandasConversions(object):
                 robjects.conversion.converter_ctx.get().py2rpy(pd_df)
         assert len(record) == 1
 
+    @pytest.mark.parametrize('index', (None, ['a', 'b', 'c'], [3, 1, 2]))
+    def test_dataframe_columnar(self, index):
+        pd_df = pandas.DataFrame(
+            OrderedDict((
+                ('b', [True, False, True]),
+                ('i', numpy.array([1, 2, 3], dtype='i')),
+                ('i64', numpy.array([1, 2, 3], dtype=numpy.int64)),
+                ('f', [1.0, 2.5, numpy.nan]),
+                ('s', ['a', 'b', 'c']),
+                ('c', pandas.Categorical(['x', 'y', 'x'])),
+                ('d', [datetime(2012, 5, 2),
+                       datetime(2012, 6, 3),
+                       datetime(2012, 7, 1)])
+            )),
+            index=index
+        )
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_df = cv.py2rpy(pd_df)
+            # Columns passed to R's data.frame().
+            rp_df_ref = robjects.vectors.DataFrame(
+                OrderedDict((k, cv.py2rpy(v)) for k, v in pd_df.items())
+            )
+        assert robjects.baseenv['identical'](rp_df, rp_df_ref)[0]
+
     def test_series(self):
         Series = pandas.core.series.Series
         s = Series(numpy.random.randn(5), index=['a', 'b', 'c', 'd', 'e'])
@@ -161,6 +185,20 @@ class TestPandasConversions(object):
             rp_s = robjects.conversion.converter_ctx.get().py2rpy(s)
         assert isinstance(rp_s, rinterface.StrSexpVector)
 
+    @pytest.mark.parametrize(
+        'storage', ['python', 'pyarrow']
+    )
+    def test_series_str_na(self, storage):
+        if storage == 'pyarrow':
+            pytest.importorskip('pyarrow')
+        # The slice is a view with an offset on Arrow arrays.
+        s = pandas.Series(['x', None, '\u21a7', ''],
+                          dtype=pandas.StringDtype(storage=storage))[1:]
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_s = cv.py2rpy(s)
+        assert isinstance(rp_s, rinterface.StrSexpVector)
+        assert tuple(rp_s) == (rinterface.NA_Character, '\u21a7', '')
+
     def test_series_obj_mixed(self):
         Series = pandas.core.series.Series
         s = Series(['x', 1, False], index=['a', 'b', 'c'])
@@ -274,6 +312,15 @@ class TestPandasConversions(object):
             assert isinstance(rp_c, robjects.vectors.FactorVector)
         assert rp_c[3] == rinterface.NA_Integer
 
+    def test_numericCategory2Factor(self):
+        category = pandas.Series(pandas.Categorical([2.5, 1.0, None, 2.5]))
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_c = robjects.conversion.converter_ctx.get().py2rpy(category)
+            assert isinstance(rp_c, robjects.vectors.FactorVector)
+        assert tuple(rp_c.levels) == ('1', '2.5')
+        assert tuple(rp_c)[:2] == (2, 1)
+        assert rp_c[2] == rinterface.NA_Integer
+
     def test_orderedCategory2Factor(self):
         category = pandas.Series(pandas.Categorical(['a','b','c','a'],
                                                     categories=['a','b','c'],
@@ -306,6 +353,19 @@ class TestPandasConversions(object):
             assert int(rp_c[0]) == 1483228800
             assert math.isnan(rp_c[1])
 
+    def test_datetime2posixct_naive(self):
+        dt = pandas.Series(
+            pandas.to_datetime(['2012-05-02 10:20:30.5', None])
+        )
+        with localconverter(default_converter + rpyp.converter) as cv:
+            rp_c = robjects.conversion.converter_ctx.get().py2rpy(dt)
+        assert isinstance(rp_c, robjects.vectors.POSIXct)
+        assert rp_c.do_slot('tzone')[0] == ''
+        r_c = robjects.baseenv['ISOdatetime'](2012, 5, 2, 10, 20, 30.5,
+                                              tz='')
+        assert rp_c[0] == r_c[0]
+        assert robjects.baseenv['is.na'](rp_c)[1]
+
     def test_date2posixct(self):
         today = datetime.now().date()
         date = pandas.Series([today])
@@ -344,6 +404,31 @@ class TestPandasConversions(object):
 
         assert py_time[1] is pandas.NaT
 
+    def test_timeR2Pandas_tzone(self):
+        r_time = robjects.baseenv['as.POSIXct'](
+            rinterface.StrSexpVector(('2012-05-02 10:20:30.5',
+                                      rinterface.NA_Character)),
+            tz=rinterface.StrSexpVector(('Europe/Paris',))
+        )
+        with localconverter(default_converter + rpyp.converter) as cv:
+            py_time = cv.rpy2py(r_time)
+        assert str(py_time.tz) == 'Europe/Paris'
+        assert py_time[0] == pandas.Timestamp('2012-05-02 10:20:30.5',
+                                              tz='Europe/Paris')
+        assert py_time[1] is pandas.NaT
+
+    def test_dateR2Pandas(self):
+        r_date = robjects.baseenv['as.Date'](
+            rinterface.StrSexpVector(('1960-05-02', '2012-07-01',
+                                      rinterface.NA_Character))
+        )
+        with localconverter(default_converter + rpyp.converter) as cv:
+            py_date = cv.rpy2py(r_date)
+        assert pandas.core.dtypes.common.is_datetime64_any_dtype(py_date)
+        assert py_date[0] == pandas.Timestamp('1960-05-02')
+        assert py_date[1] == pandas.Timestamp('2012-07-01')
+        assert py_date[2] is pandas.NaT
+
     def test_posixct_in_dataframe_to_pandas(self):
         tzone = robjects.vectors.get_timezone()
         dt = [datetime(1960, 5, 2),
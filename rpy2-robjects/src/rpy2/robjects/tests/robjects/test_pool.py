@@ -0,0 +1,93 @@
+import multiprocessing
+import pytest
+import rpy2.robjects as robjects
+from rpy2.robjects import pool
+
+pytestmark = pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(),
+    reason='The worker pool requires forking processes.'
+)
+
+
+@pytest.fixture(scope='module')
+def workerpool():
+    with pool.WorkerPool(2, packages=('stats', )) as res:
+        yield res
+
+
+def test_submit(workerpool):
+    future = workerpool.submit('stats::median',
+                               robjects.FloatVector((1, 2, 6)))
+    assert tuple(future.result()) == (2, )
+
+
+def test_submit_kwargs(workerpool):
+    future = workerpool.submit('sum',
+                               robjects.FloatVector((1, 2, robjects.NA_Real)),
+                               **{'na.rm': True})
+    assert tuple(future.result()) == (3, )
+
+
+def test_submit_globalenv():
+    robjects.r('rpy2_pool_test_f <- function(x) x + 1')
+    try:
+        with pool.WorkerPool(1) as workerpool:
+            future = workerpool.submit('rpy2_pool_test_f',
+                                       robjects.IntVector((1, 2)))
+            assert tuple(future.result()) == (2, 3)
+    finally:
+        robjects.r('rm(rpy2_pool_test_f)')
+
+
+def test_submit_error(workerpool):
+    future = workerpool.submit('stop', 'foo')
+    with pytest.raises(robjects.rinterface.embedded.RRuntimeError):
+        future.result()
+    # The worker is still usable.
+    assert tuple(workerpool.submit('sum', 1, 2).result()) == (3, )
+
+
+def test_map(workerpool):
+    futures = workerpool.map('sum', range(5), range(5))
+    assert [f.result()[0] for f in futures] == [0, 2, 4, 6, 8]
+
+
+def test_pids(workerpool):
+    pids = {workerpool.submit('Sys.getpid').result()[0]
+            for i in range(10)}
+    assert pids <= set(workerpool.pids)
+
+
+@pytest.mark.parametrize('kwargs',
+                         ({'maxtasksperchild': 1}, {'max_rss': 1}))
+def test_recycling(kwargs):
+    with pool.WorkerPool(1, **kwargs) as workerpool:
+        pids = [workerpool.submit('Sys.getpid').result()[0]
+                for i in range(3)]
+    assert len(set(pids)) == 3
+
+
+def test_shutdown():
+    workerpool = pool.WorkerPool(1)
+    workerpool.shutdown()
+    with pytest.raises(RuntimeError):
+        workerpool.submit('Sys.getpid')
+
+
+def test_fork_with_locks_held():
+    from rpy2.rinterface_lib import openrlib
+    from rpy2.robjects import functions
+    locks = (openrlib.lock,
+             robjects.rinterface._parse_cache._lock,
+             functions._PRM_TRANSLATE_CACHE_LOCK)
+    for lock in locks:
+        lock.acquire()
+    try:
+        workerpool = pool.WorkerPool(1)
+    finally:
+        for lock in locks:
+            lock.release()
+    with workerpool:
+        future = workerpool.submit('stats::median',
+                                   robjects.FloatVector((1, 2, 6)))
+        assert tuple(future.result(timeout=30)) == (2, )
@@ -22,3 +22,50 @@ def test_pickle():
     # Check the instance dict is also identical
     assert set(robj.__dict__.keys()) == set(robj_again.__dict__.keys())
 
+
+@pytest.mark.parametrize('protocol', (2, 5))
+def test_pickle_dataframe(protocol):
+    df = robjects.DataFrame({'a': robjects.IntVector((1, 2)),
+                             'b': robjects.StrVector(('x', 'y'))})
+    df_again = pickle.loads(pickle.dumps(df, protocol=protocol))
+    assert isinstance(df_again, robjects.DataFrame)
+    assert robjects.baseenv["identical"](df, df_again)[0]
+    assert tuple(df_again.colnames) == ('a', 'b')
+
+
+def test_pickle_matrix():
+    m = robjects.r.matrix(robjects.FloatVector(range(6)), nrow=2)
+    m_again = pickle.loads(pickle.dumps(m, protocol=5))
+    assert isinstance(m_again, robjects.vectors.FloatMatrix)
+    assert tuple(m_again.dim) == (2, 3)
+    assert robjects.baseenv["identical"](m, m_again)[0]
+
+
+@pytest.mark.parametrize('protocol', (2, 4, 5))
+def test_pickle_vector_delegators(protocol):
+    robj = robjects.FloatVector((1.5, 2.5, 3.5))
+    robj_again = pickle.loads(pickle.dumps(robj, protocol=protocol))
+    assert set(robj.__dict__.keys()) == set(robj_again.__dict__.keys())
+    assert robj_again.ro._parent is robj_again
+    assert tuple(robj_again.ro + 1) == (2.5, 3.5, 4.5)
+    assert robj_again.rx2(2)[0] == 2.5
+
+
+def test_pickle_vector_payload_once():
+    robj = robjects.FloatVector((1.5, 2.5, 3.5))
+    buffers = []
+    data = pickle.dumps(robj, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    robj_again = pickle.loads(data, buffers=buffers)
+    assert tuple(robj_again) == tuple(robj)
+
+
+def test_pickle_shared_memory_delegators():
+    from rpy2.rinterface_lib import sharedmemory
+    robj = robjects.FloatVector((1.5, 2.5, 3.5))
+    data, handles = sharedmemory.dumps(robj)
+    assert len(handles) == 1
+    robj_again = pickle.loads(data)
+    assert set(robj.__dict__.keys()) == set(robj_again.__dict__.keys())
+    assert robj_again.ro._parent is robj_again
+    assert robj_again.rx2(2)[0] == 2.5
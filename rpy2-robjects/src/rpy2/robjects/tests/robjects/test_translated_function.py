@@ -28,6 +28,40 @@ def test_init_with_translation():
     assert identical(ri_f, ro_f)[0] is True
 
 
+def test_translation_lazy(monkeypatch):
+    ri_f = rinterface.baseenv.find('rank')
+    ro_f = SignatureTranslatedFunction(ri_f)
+    assert ro_f._prm_translate_table is None
+    res = ro_f(robjects.IntVector([3, 1, 1]), ties_method='first')
+    assert tuple(res) == (3, 1, 2)
+    assert ro_f._prm_translate['ties_method'] == 'ties.method'
+
+    def _map_symbols(*args, **kwargs):
+        raise AssertionError('The translation should be cached.')
+
+    monkeypatch.setattr(robjects.functions, '_map_symbols', _map_symbols)
+    ro_f2 = SignatureTranslatedFunction(ri_f)
+    assert ro_f2._prm_translate == ro_f._prm_translate
+    assert ro_f2._prm_translate is not ro_f._prm_translate
+
+
+def test_translation_cache_formals():
+    ro_f = SignatureTranslatedFunction(
+        robjects.r('function(x, y.z) x')
+    )
+    ro_f2 = SignatureTranslatedFunction(
+        robjects.r('function(x, y.z) x + 1')
+    )
+    assert ro_f._prm_translate['y_z'] == 'y.z'
+    n = len(robjects.functions._PRM_TRANSLATE_CACHE)
+    assert ro_f2._prm_translate['y_z'] == 'y.z'
+    # The functions have the same parameters and share a cache entry,
+    # and the cache does not keep R functions alive.
+    assert len(robjects.functions._PRM_TRANSLATE_CACHE) == n
+    assert not any(isinstance(v, rinterface.Sexp)
+                   for v in robjects.functions._PRM_TRANSLATE_CACHE.values())
+
+
 def test_call():
     ri_f = rinterface.baseenv.find('sum')
     ro_f = robjects.Function(ri_f)
@@ -211,6 +211,27 @@ def test_contains():
     assert 'foo' not in v.ro
 
 
+def test_r_lazy():
+    x = robjects.vectors.IntVector((1, 2, 3))
+    y = robjects.vectors.IntVector((2, 3, 4))
+    z = ((x.ro.lazy + 1).ro * y).ro - 2
+    assert isinstance(z, robjects.vectors.LazyOperation)
+    assert z._rcall().typeof == robjects.rinterface.RTYPES.LANGSXP
+    res = z.evaluate()
+    assert isinstance(res, robjects.vectors.IntVector)
+    assert tuple(res) == (2, 7, 14)
+    assert 14 in z.ro
+    neg = - z.ro
+    assert tuple(neg.evaluate()) == (-2, -7, -14)
+
+
+def test_r_lazy_as_argument():
+    x = robjects.vectors.IntVector((1, 2, 3))
+    z = x.ro.lazy * 2
+    assert tuple(x.ro + z) == (3, 6, 9)
+    assert robjects.baseenv['sum'](z)[0] == 12
+
+
 @pytest.mark.parametrize(
     'cls,values',
     [(robjects.StrVector, ['abc', 'def']),
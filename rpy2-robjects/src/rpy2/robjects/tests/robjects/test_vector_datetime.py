@@ -94,6 +94,25 @@ def test_POSIXct_from_python_timezone(zone_str):
     assert res.slots['tzone'][0] == (zone_str if zone_str else '')
 
 
+def test_POSIXct_from_python_microseconds():
+    x = [datetime.datetime(2012, 5, 2, 10, 20, 30, 500000,
+                           tzinfo=datetime.timezone.utc)]
+    res = robjects.POSIXct(x)
+    assert res[0] == x[0].timestamp()
+    assert res.slots['tzone'][0] == 'UTC'
+
+
+def test_POSIXct_from_python_default_timezone_pytz(monkeypatch):
+    pytz = pytest.importorskip('pytz')
+    zone_str = 'Europe/Paris'
+    monkeypatch.setattr(rpy2.robjects.vectors, 'default_timezone',
+                        pytz.timezone(zone_str))
+    res = robjects.POSIXct([datetime.datetime(2012, 5, 2, 10, 20, 30)])
+    res_r = robjects.r('as.POSIXct')('2012-05-02 10:20:30', tz=zone_str)
+    assert res[0] == res_r[0]
+    assert res.slots['tzone'][0] == zone_str
+
+
 def testPOSIXct_fromSexp():
     sexp = robjects.r('ISOdate(2013, 12, 11)')
     res = robjects.POSIXct(sexp)
@@ -3,6 +3,7 @@ import collections.abc
 from rpy2.robjects.robject import RObjectMixin
 import rpy2.rinterface as rinterface
 import rpy2.rinterface_lib.conversion
+import rpy2.rinterface_lib._rinterface_capi as _rinterface_capi
 import rpy2.rinterface_lib.memorymanagement
 import rpy2.rinterface_lib.openrlib
 from rpy2.rinterface_lib import sexp
@@ -144,104 +145,184 @@ class VectorOperationsDelegator(object):
     to the corresponding R function.
     This permits a convenient coexistence between
     operators on Python sequence object with their R conterparts.
+
+    The R functions for the operators are the ones in R's base
+    package.
     """
 
+    _add = rinterface.baseenv['+']
+    _sub = rinterface.baseenv['-']
+    _matmul = rinterface.baseenv['%*%']
+    _mul = rinterface.baseenv['*']
+    _pow = rinterface.baseenv['^']
+    _floordiv = rinterface.baseenv['%/%']
+    _truediv = rinterface.baseenv['/']
+    _mod = rinterface.baseenv['%%']
+    _or = rinterface.baseenv['|']
+    _and = rinterface.baseenv['&']
+    _not = rinterface.baseenv['!']
+    _lt = rinterface.baseenv['<']
+    _le = rinterface.baseenv['<=']
+    _eq = rinterface.baseenv['==']
+    _ne = rinterface.baseenv['!=']
+    _gt = rinterface.baseenv['>']
+    _ge = rinterface.baseenv['>=']
+    _in = rinterface.baseenv['%in%']
+
     def __init__(self, parent):
         """ The parent in expected to inherit from Vector. """
         self._parent = parent
 
-    def __add__(self, x):
+    @property
+    def lazy(self) -> 'LazyOperationsDelegator':
+        """ Delegator building unevaluated R operations.
+
+        Chained operations are evaluated in one R call when the
+        result is needed (see :class:`LazyOperation`)."""
+        return LazyOperationsDelegator(self._parent)
+
+    def _apply(self, function, *args):
         cv = conversion.get_conversion()
-        res = globalenv_ri.find('+')(self._parent, cv.py2rpy(x))
+        res = function(self._parent, *(cv.py2rpy(x) for x in args))
         return cv.rpy2py(res)
 
+    def __add__(self, x):
+        return self._apply(self._add, x)
+
     def __sub__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('-')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._sub, x)
 
     def __matmul__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find("%*%")(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._matmul, x)
 
     def __mul__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('*')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._mul, x)
 
     def __pow__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('^')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._pow, x)
 
     def __floordiv__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('%/%')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._floordiv, x)
 
     def __truediv__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('/')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._truediv, x)
 
     def __mod__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('%%')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._mod, x)
 
     def __or__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('|')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._or, x)
 
     def __and__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('&')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._and, x)
 
     def __invert__(self):
-        res = globalenv_ri.find('!')(self._parent)
-        return conversion.get_conversion().rpy2py(res)
+        return self._apply(self._not)
 
     # Comparisons
 
     def __lt__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('<')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._lt, x)
 
     def __le__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('<=')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._le, x)
 
     def __eq__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('==')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._eq, x)
 
     def __ne__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('!=')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._ne, x)
 
     def __gt__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('>')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._gt, x)
 
     def __ge__(self, x):
-        cv = conversion.get_conversion()
-        res = globalenv_ri.find('>=')(self._parent, cv.py2rpy(x))
-        return cv.rpy2py(res)
+        return self._apply(self._ge, x)
 
     def __neg__(self):
-        res = globalenv_ri.find('-')(self._parent)
+        res = self._sub(self._parent)
         return res
 
     def __contains__(self, what):
-        res = globalenv_ri.find('%in%')(what, self._parent)
+        res = self._in(what, self._parent)
+        return res[0]
+
+
+class LazyOperation(object):
+    """ Unevaluated R operation on vectors.
+
+    The operations on the delegator `ro` are also unevaluated, building
+    one R call for a chain of operations. The call is only evaluated
+    by the method `evaluate()`, or when the operation is converted
+    to an R object (for example when it is the argument of an R
+    function). The intermediate results are then never converted
+    to Python objects.
+
+    >>> z = ((x.ro.lazy + 1).ro * y).ro - 2
+    >>> z.evaluate()
+    """
+
+    def __init__(self, function, args):
+        """
+        - function: an R function (rinterface-level)
+        - args: the arguments to the function, R objects or
+                LazyOperation objects.
+        """
+        self._function = function
+        self._args = tuple(args)
+        self.ro = LazyOperationsDelegator(self)
+
+    def _rcall(self) -> rinterface.LangSexpVector:
+        """ Build the unevaluated R call. """
+        args = [x._rcall() if isinstance(x, LazyOperation) else x
+                for x in self._args]
+        with rpy2.rinterface_lib.memorymanagement.rmemory() as rmemory:
+            res = rpy2.rinterface_lib.conversion._cdata_to_rinterface(
+                rmemory.protect(
+                    _rinterface_capi.build_rcall(
+                        self._function.__sexp__._cdata, args
+                    )
+                )
+            )
+        return res
+
+    def _evaluate(self) -> Sexp:
+        # R evaluates the arguments that are calls when
+        # evaluating the call to the function.
+        args = [x._rcall() if isinstance(x, LazyOperation) else x
+                for x in self._args]
+        return self._function(*args)
+
+    def evaluate(self):
+        """ Evaluate the R operations.
+
+        :return: The result, converted to Python."""
+        return conversion.get_conversion().rpy2py(self._evaluate())
+
+
+class LazyOperationsDelegator(VectorOperationsDelegator):
+    """ Delegate operations to R functions like
+    :class:`VectorOperationsDelegator`, but return
+    :class:`LazyOperation` objects rather than evaluate them."""
+
+    def _apply(self, function, *args):
+        cv = conversion.get_conversion()
+        return LazyOperation(
+            function,
+            (self._parent, ) + tuple(
+                x if isinstance(x, LazyOperation) else cv.py2rpy(x)
+                for x in args
+            )
+        )
+
+    def __neg__(self):
+        return self._apply(self._sub)
+
+    def __contains__(self, what):
+        parent = self._parent
+        if isinstance(parent, LazyOperation):
+            parent = parent._evaluate()
+        res = self._in(what, parent)
         return res[0]
 
 
@@ -1018,22 +1099,48 @@ class POSIXct(POSIXt, FloatVector):
                     IntVector([x.tm_sec for x in seq])]
         return POSIXct._sexp_from_seq(seq, lambda elt: elt.tm_zone, f)
 
+    @staticmethod
+    def sexp_from_seconds(seconds, tzone: str = ''):
+        """ return a POSIXct vector from seconds since the Epoch.
+
+        :param seconds: a sequence of floats, or an object with a buffer
+          of C doubles (for example a numpy array of float64).
+        :param tzone: the name of the time zone in R (the empty string
+          means the local time zone)."""
+        res = FloatSexpVector(seconds)
+        res.rclass = StrSexpVector(('POSIXct', 'POSIXt'))
+        res.do_slot_assign('tzone', StrSexpVector((tzone, )))
+        return res
+
     @staticmethod
     def sexp_from_datetime(seq):
         """ return a POSIXct vector from a sequence of
         datetime.datetime elements. """
-        def f(seq):
-            return [IntVector([x.year for x in seq]),
-                    IntVector([x.month for x in seq]),
-                    IntVector([x.day for x in seq]),
-                    IntVector([x.hour for x in seq]),
-                    IntVector([x.minute for x in seq]),
-                    IntVector([x.second for x in seq])]
-
-        def get_tz(elt):
-            return elt.tzinfo if elt.tzinfo else None
-
-        return POSIXct._sexp_from_seq(seq, get_tz, f)
+        seq = conversion.noconversion(seq)
+        tz_info = seq[0].tzinfo
+        for elt in seq:
+            if elt.tzinfo != tz_info:
+                raise ValueError(
+                    'Sequences of dates with different time zones not '
+                    'yet allowed.'
+                )
+        if tz_info is None and default_timezone:
+            # Naive datetime objects are in the default time zone.
+            tz_info = default_timezone
+            if isinstance(tz_info, str):
+                tz_info = zoneinfo.ZoneInfo(tz_info)
+            if hasattr(tz_info, 'localize'):
+                # pytz time zones must be given to localize(), as
+                # replace() uses their first offset (often LMT).
+                seq = [tz_info.localize(x) for x in seq]
+            else:
+                seq = [x.replace(tzinfo=tz_info) for x in seq]
+        # The timestamp for naive datetime objects is for the local time
+        # zone, as it is in R when the time zone is an empty string.
+        return POSIXct.sexp_from_seconds(
+            [x.timestamp() for x in seq],
+            '' if tz_info is None else str(tz_info)
+        )
 
     @staticmethod
     def isrinstance(obj) -> bool: